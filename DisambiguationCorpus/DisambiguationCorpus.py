@@ -13,10 +13,28 @@ class DisambiguationCorpus(Corpus):
         """
         super().__init__()
         if fileName is not None:
-            input_file = open(fileName, "r", encoding="utf8")
-            lines = input_file.readlines()
+            for sentence in DisambiguationCorpus.readSentences(fileName):
+                self.addSentence(sentence)
+
+    @staticmethod
+    def readSentences(fileName: str):
+        """
+        Reads the sentences of a disambiguation corpus file one by one, without keeping the file or the previous
+        sentences in memory, so that corpora larger than the memory can be processed.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the corpus file.
+
+        RETURNS
+        -------
+        generator
+            Sentences of the file, whose words are DisambiguatedWords.
+        """
+        with open(fileName, "r", encoding="utf8") as input_file:
             new_sentence = Sentence()
-            for line in lines:
+            for line in input_file:
                 word = line[:line.index("\t")]
                 parse = line[line.index("\t") + 1:]
                 if len(word) > 0 and len(parse) > 0:
@@ -24,12 +42,11 @@ class DisambiguationCorpus(Corpus):
                     if word == "<S>":
                         new_sentence = Sentence()
                     elif word == "</S>":
-                        self.addSentence(new_sentence)
+                        yield new_sentence
                     elif word == "<DOC>" or word == "</DOC>" or word == "<TITLE>" or word == "</TITLE>":
                         pass
                     else:
                         new_sentence.addWord(new_word)
-            input_file.close()
 
     def writeToFile(self, fileName: str):
         """
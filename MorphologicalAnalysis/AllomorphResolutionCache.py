@@ -0,0 +1,202 @@
+from Dictionary.TxtWord import TxtWord
+from Language.TurkishLanguage import TurkishLanguage
+
+from MorphologicalAnalysis.State import State
+from MorphologicalAnalysis.Transition import Transition
+
+
+class AllomorphResolutionCache:
+
+    __table: dict
+    __max_size: int
+    __hits: int
+    __misses: int
+
+    def __init__(self, maxSize=1000000):
+        """
+        Constructor of AllomorphResolutionCache class. The cache memoizes the result of Transition.makeTransition. The
+        result of makeTransition only depends on the suffix template, the start state, the flags of the root, whether
+        the stem is the root itself, and the last characters and the last two vowels of the stem. The cache is keyed
+        on these values and stores how many characters are dropped from the end of the stem together with the string
+        appended after them, so that the same entry can be applied to every stem with the same signature.
+
+        PARAMETERS
+        ----------
+        maxSize : int
+            Maximum number of resolutions stored. When the cache is full, new resolutions are computed but not stored.
+        """
+        self.__table = {}
+        self.__max_size = maxSize
+        self.__hits = 0
+        self.__misses = 0
+
+    @staticmethod
+    def rootSignature(root: TxtWord) -> tuple:
+        """
+        Returns the part of the root that affects the allomorph selection, that is the values of the flags used in
+        makeTransition and in the metamorpheme resolving methods, and the last two characters of the root if they
+        contain a digit.
+
+        PARAMETERS
+        ----------
+        root : TxtWord
+            Root of the word.
+
+        RETURNS
+        -------
+        tuple
+            Signature of the root.
+        """
+        name = root.getName()
+        ending = name[-2:]
+        if not any("0" <= ch <= "9" for ch in ending):
+            ending = ""
+        return (root.isAbbreviation(), root.notObeysVowelHarmonyDuringAgglutination(), root.isNumeral(),
+                root.isReal(), root.isFraction(), root.isTime(), root.isDate(), root.isPercent(), root.isRange(),
+                root.isProperNoun(), root.isNominal(), root.isAdjective(), root.isVerb(),
+                root.vowelAChangesToIDuringYSuffixation(), root.vowelEChangesToIDuringYSuffixation(),
+                root.lastIdropsDuringPassiveSuffixation(), root.lastIdropsDuringSuffixation(),
+                root.showsSuRegularities(), root.duplicatesDuringSuffixation(), root.endingKChangesIntoG(),
+                root.nounSoftenDuringSuffixation(), root.verbSoftenDuringSuffixation(),
+                root.consonantSMayInsertedDuringPossesiveSuffixation(), ending)
+
+    @staticmethod
+    def __stemSignature(stem: str) -> tuple:
+        """
+        Returns the part of a stem, which is not the root itself, that affects the allomorph selection: its last two
+        characters, its last vowel and the vowel before it, as they are computed by Word.lastVowel and
+        Word.beforeLastVowel.
+
+        PARAMETERS
+        ----------
+        stem : str
+            Current word form.
+
+        RETURNS
+        -------
+        tuple
+            Signature of the stem.
+        """
+        last = None
+        for i in range(len(stem) - 1, -1, -1):
+            if stem[i] in TurkishLanguage.VOWELS:
+                if last is None:
+                    last = stem[i]
+                else:
+                    return stem[-2:], last, stem[i]
+        if last is not None:
+            return stem[-2:], last, last
+        for i in range(len(stem) - 1, -1, -1):
+            if "0" <= stem[i] <= "9":
+                return stem[-2:], stem[i], "0"
+        return stem[-2:], "0", "0"
+
+    def makeTransition(self,
+                       transition: Transition,
+                       root: TxtWord,
+                       stem: str,
+                       startState: State,
+                       rootSignature=None) -> str:
+        """
+        Returns the same value as transition.makeTransition(root, stem, startState), using the memoized resolution
+        if the same phonological context is seen before.
+
+        PARAMETERS
+        ----------
+        transition : Transition
+            Transition to make.
+        root : TxtWord
+            Root of the current word form.
+        stem : str
+            Current word form.
+        startState : State
+            The state from which this Fsm morphological analysis search has started.
+        rootSignature : tuple
+            Signature of the root as returned by rootSignature. If None, it is computed from the root.
+
+        RETURNS
+        -------
+        str
+            The current value of the word form after this transition is completed in the finite state machine.
+        """
+        _with = transition.__str__()
+        if _with == "0":
+            return stem
+        if "Ş" in _with or (_with == "yA" and (stem == "ben" or stem == "sen")):
+            return transition.makeTransition(root, stem, startState)
+        if rootSignature is None:
+            rootSignature = AllomorphResolutionCache.rootSignature(root)
+        name = root.getName()
+        if stem == name or stem == name + "'":
+            key = (_with, startState.getName(), rootSignature, stem)
+        else:
+            key = (_with, startState.getName(), rootSignature, AllomorphResolutionCache.__stemSignature(stem))
+        resolution = self.__table.get(key)
+        if resolution is not None:
+            self.__hits += 1
+            if resolution[0] == 0:
+                return stem + resolution[1]
+            return stem[:len(stem) - resolution[0]] + resolution[1]
+        self.__misses += 1
+        formation = transition.makeTransition(root, stem, startState)
+        if len(self.__table) < self.__max_size:
+            common = 0
+            length = min(len(stem), len(formation))
+            while common < length and stem[common] == formation[common]:
+                common = common + 1
+            self.__table[key] = (len(stem) - common, formation[common:])
+        return formation
+
+    def size(self) -> int:
+        """
+        Returns the number of resolutions stored in the cache.
+
+        RETURNS
+        -------
+        int
+            Number of stored resolutions.
+        """
+        return len(self.__table)
+
+    def getHits(self) -> int:
+        """
+        Getter for the number of lookups answered from the cache.
+
+        RETURNS
+        -------
+        int
+            Number of cache hits.
+        """
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """
+        Getter for the number of lookups that required calling makeTransition.
+
+        RETURNS
+        -------
+        int
+            Number of cache misses.
+        """
+        return self.__misses
+
+    def hitRate(self) -> float:
+        """
+        Returns the ratio of lookups answered from the cache.
+
+        RETURNS
+        -------
+        float
+            Hit rate of the cache, 0 if there is no lookup yet.
+        """
+        if self.__hits + self.__misses == 0:
+            return 0.0
+        return self.__hits / (self.__hits + self.__misses)
+
+    def clear(self):
+        """
+        Removes all stored resolutions and resets the counters.
+        """
+        self.__table.clear()
+        self.__hits = 0
+        self.__misses = 0
@@ -0,0 +1,235 @@
+import sys
+from enum import Enum
+
+from Dictionary.Word import Word
+
+from MorphologicalAnalysis.FsmParseList import FsmParseList
+from MorphologicalAnalysis.LruCache import LruCache
+from MorphologicalAnalysis.State import State
+from MorphologicalAnalysis.TinyLfuCache import TinyLfuCache
+from MorphologicalAnalysis.Transition import Transition
+
+
+class AnalysisCache:
+
+    __cache: object
+    __hits: int
+    __misses: int
+
+    def __init__(self,
+                 cacheSize: int,
+                 maxBytes=None):
+        """
+        Constructor of AnalysisCache class. The cache stores the analyses of the surface forms analyzed with
+        morphologicalAnalysis. The analyses are stored as tuples of copies of the given parses, and each lookup returns a
+        new FsmParseList of new copies of the stored parses. Therefore, a caller modifying its parse list, for example
+        with reduceToParsesWithSameRoot, or its parses, for example with setForm or restoreOriginalForm, does not
+        change the cached analyses.
+
+        By default, the cache is an LruCache limited by the number of surface forms. If maxBytes is given, the cache is
+        a TinyLfuCache limited by the estimated size of the analyses in bytes, see entrySize.
+
+        PARAMETERS
+        ----------
+        cacheSize : int
+            Maximum number of surface forms stored in the cache.
+        maxBytes : int
+            Memory budget of the cache in bytes. If given, cacheSize is ignored.
+        """
+        if maxBytes is None:
+            self.__cache = LruCache(cacheSize)
+        else:
+            self.__cache = TinyLfuCache(maxBytes, AnalysisCache.entrySize)
+        self.__hits = 0
+        self.__misses = 0
+
+    @staticmethod
+    def entrySize(parses: tuple) -> int:
+        """
+        Returns the approximate memory used by the given analyses. The objects reachable from the parses, such as
+        their lists, strings and inflectional groups, are counted once with sys.getsizeof. The roots, states,
+        transitions and tags are shared with the dictionary and the finite state machine, so they are not counted.
+
+        PARAMETERS
+        ----------
+        parses : tuple
+            Analyses of a surface form.
+
+        RETURNS
+        -------
+        int
+            Approximate size of the analyses in bytes.
+        """
+        total = 0
+        seen = set()
+        stack = [parses]
+        while len(stack) > 0:
+            item = stack.pop()
+            if id(item) in seen or isinstance(item, (Word, State, Transition, Enum)) or item is None:
+                continue
+            seen.add(id(item))
+            total += sys.getsizeof(item)
+            if isinstance(item, (list, tuple, set)):
+                stack.extend(item)
+            elif isinstance(item, dict):
+                stack.extend(item.keys())
+                stack.extend(item.values())
+            elif hasattr(item, "__dict__"):
+                total += sys.getsizeof(item.__dict__)
+                stack.extend(item.__dict__.values())
+        return total
+
+    @staticmethod
+    def normalizedKey(surfaceForm: str,
+                      lowercased: str,
+                      isProper: bool) -> tuple:
+        """
+        Returns the key of the given surface form. The analyses of a surface form only depend on its lowercase form,
+        whether it is a proper noun and whether its first letter is a capital letter, so for example 'Ankara' and
+        'ANKARA' have the same key.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to analyze.
+        lowercased : str
+            Lowercase form of the surface form.
+        isProper : bool
+            True if the surface form is a proper noun.
+
+        RETURNS
+        -------
+        tuple
+            Key of the surface form.
+        """
+        return lowercased, isProper, len(surfaceForm) > 0 and Word.isCapital(surfaceForm)
+
+    def contains(self, key: tuple) -> bool:
+        """
+        Checks whether the analyses of the given key are stored.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by normalizedKey.
+
+        RETURNS
+        -------
+        bool
+            True if the key is in the cache, False otherwise.
+        """
+        return self.__cache.contains(key)
+
+    def get(self, key: tuple) -> FsmParseList:
+        """
+        Returns copies of the analyses of the given key as a new parse list. The lookup is counted as a hit or a miss.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by normalizedKey.
+
+        RETURNS
+        -------
+        FsmParseList
+            Parse list of the stored analyses, None if the key is not in the cache.
+        """
+        parses = self.__cache.get(key)
+        if parses is None:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        return FsmParseList(tuple(parse.clone() for parse in parses))
+
+    def peek(self, key: tuple) -> tuple:
+        """
+        Returns the stored analyses of the given key without counting the lookup. The recency of the entry is not
+        changed either, so reading the cache for a snapshot does not reorder it. The parses are not copied, so they
+        must not be modified.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by normalizedKey.
+
+        RETURNS
+        -------
+        tuple
+            Stored analyses, None if the key is not in the cache.
+        """
+        return self.__cache.peek(key)
+
+    def add(self,
+            key: tuple,
+            fsmParseList: FsmParseList):
+        """
+        Stores copies of the given analyses, so that the caller can still modify its parses.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by normalizedKey.
+        fsmParseList : FsmParseList
+            Analyses of the surface form.
+        """
+        self.__cache.add(key, tuple(parse.clone() for parse in fsmParseList.toTuple()))
+
+    def getHits(self) -> int:
+        """
+        Getter for the number of lookups finding their surface form.
+
+        RETURNS
+        -------
+        int
+            Number of hits.
+        """
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """
+        Getter for the number of lookups not finding their surface form.
+
+        RETURNS
+        -------
+        int
+            Number of misses.
+        """
+        return self.__misses
+
+    def getEvictions(self) -> int:
+        """
+        Getter for the number of analyses evicted from or not admitted to the cache.
+
+        RETURNS
+        -------
+        int
+            Number of evictions, 0 if the cache is limited by the number of surface forms.
+        """
+        if isinstance(self.__cache, TinyLfuCache):
+            return self.__cache.getEvictions()
+        return 0
+
+    def getResidentBytes(self) -> int:
+        """
+        Returns the estimated memory used by the stored analyses.
+
+        RETURNS
+        -------
+        int
+            Size in bytes, 0 if the cache is limited by the number of surface forms.
+        """
+        if isinstance(self.__cache, TinyLfuCache):
+            return self.__cache.getResidentBytes()
+        return 0
+
+    def getStatistics(self) -> dict:
+        """
+        Returns the hits, misses, evictions and resident bytes of the cache.
+
+        RETURNS
+        -------
+        dict
+            Statistics of the cache.
+        """
+        return {"hits": self.__hits, "misses": self.__misses, "evictions": self.getEvictions(),
+                "resident_bytes": self.getResidentBytes()}
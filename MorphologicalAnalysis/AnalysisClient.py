@@ -0,0 +1,67 @@
+import json
+import socket
+
+from MorphologicalAnalysis.AnalysisServer import AnalysisServer
+
+
+class AnalysisClient:
+
+    __socket: socket.socket
+    __input: object
+    __next_id: int
+
+    def __init__(self,
+                 socketPath=None,
+                 port=None):
+        """
+        Constructor of AnalysisClient class. The client connects to an AnalysisServer running on the same host, on the
+        given Unix domain socket or on the given port of the loopback address.
+
+        PARAMETERS
+        ----------
+        socketPath : str
+            Path of the Unix domain socket of the server.
+        port : int
+            TCP port of the server, used if socketPath is None.
+        """
+        if socketPath is not None:
+            self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.__socket.connect(socketPath)
+        elif port is not None:
+            self.__socket = socket.create_connection((AnalysisServer.HOST, port))
+        else:
+            raise ValueError("A socket path or a port is needed")
+        self.__input = self.__socket.makefile("rb")
+        self.__next_id = 0
+
+    def analyze(self, surfaceForms: list) -> list:
+        """
+        Sends the given surface forms to the server in one request and returns their analyses.
+
+        PARAMETERS
+        ----------
+        surfaceForms : list
+            Surface forms to analyze.
+
+        RETURNS
+        -------
+        list
+            List of the analyses of each surface form as strings.
+        """
+        self.__next_id = self.__next_id + 1
+        request = {"id": self.__next_id, "words": list(surfaceForms)}
+        self.__socket.sendall(json.dumps(request, ensure_ascii=False).encode("utf8") + b"\n")
+        line = self.__input.readline()
+        if len(line) == 0:
+            raise ValueError("The server closed the connection")
+        response = json.loads(line)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["analyses"]
+
+    def close(self):
+        """
+        Closes the connection to the server.
+        """
+        self.__input.close()
+        self.__socket.close()
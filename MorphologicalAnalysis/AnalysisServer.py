@@ -0,0 +1,404 @@
+import argparse
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class AnalysisServer:
+
+    __analyzer: FsmMorphologicalAnalyzer
+    __window: float
+    __max_batch: int
+    __max_pending: int
+    __line_limit: int
+    __executor: ThreadPoolExecutor
+    __loop: asyncio.AbstractEventLoop
+    __queue: asyncio.Queue
+    __stopped: asyncio.Event
+    __closing: bool
+    __connections: dict
+    __waiting: dict
+    __ready: threading.Event
+    __requests: int
+    __batches: int
+
+    HOST = "127.0.0.1"
+    SHUTDOWN_ERROR = "The server is shutting down"
+
+    def __init__(self,
+                 analyzer=None,
+                 window=0.005,
+                 maxBatch=1000,
+                 maxPending=10000,
+                 lineLimit=16 * 1024 * 1024):
+        """
+        Constructor of AnalysisServer class. The server keeps an analyzer loaded, so that short-lived jobs on the same
+        host do not construct their own. The clients send newline-delimited JSON requests over a Unix domain socket or
+        a TCP socket bound to the loopback address, see AnalysisClient. The requests arriving within the batching
+        window are analyzed together: their distinct words are analyzed once, the cached ones are answered from the
+        cache, and the response of each request is sent as soon as its batch is analyzed, in the order of the requests
+        of the connection. At most maxPending requests wait for a batch, the connections sending more requests are not
+        read until a batch is taken.
+
+        A request is an object with an id and either a word or a list of words, such as {"id": 1, "words": ["ev",
+        "kitabı"]}. The response has the same id and the analyses of the word, or a list of the analyses of each word,
+        as strings. An invalid request is answered with an error. A request longer than lineLimit bytes is answered
+        with an error and its connection is closed.
+
+        PARAMETERS
+        ----------
+        analyzer : FsmMorphologicalAnalyzer
+            Analyzer of the server. If None, a new analyzer is constructed.
+        window : float
+            Time in seconds during which the requests following the first request of a batch are added to the batch.
+        maxBatch : int
+            Maximum number of words in a batch.
+        maxPending : int
+            Maximum number of requests waiting for a batch.
+        lineLimit : int
+            Maximum length of a request in bytes.
+        """
+        if analyzer is None:
+            analyzer = FsmMorphologicalAnalyzer()
+        self.__analyzer = analyzer
+        self.__window = window
+        self.__max_batch = maxBatch
+        self.__max_pending = maxPending
+        self.__line_limit = lineLimit
+        self.__executor = ThreadPoolExecutor(1)
+        self.__loop = None
+        self.__queue = None
+        self.__stopped = None
+        self.__closing = False
+        self.__connections = {}
+        self.__waiting = {}
+        self.__ready = threading.Event()
+        self.__requests = 0
+        self.__batches = 0
+
+    async def serve(self,
+                    socketPath=None,
+                    port=None):
+        """
+        Accepts connections on the given Unix domain socket or on the given port of the loopback address until close
+        is called. On close, the requests not answered yet are answered with an error, the connections are closed
+        after their responses are sent, and then the batches are stopped.
+
+        PARAMETERS
+        ----------
+        socketPath : str
+            Path of the Unix domain socket.
+        port : int
+            TCP port, used if socketPath is None.
+        """
+        if socketPath is None and port is None:
+            raise ValueError("A socket path or a port is needed")
+        self.__analyzer.preload()
+        self.__loop = asyncio.get_running_loop()
+        self.__queue = asyncio.Queue(self.__max_pending)
+        self.__stopped = asyncio.Event()
+        self.__closing = False
+        if socketPath is not None:
+            server = await asyncio.start_unix_server(self.__handleConnection, socketPath, limit=self.__line_limit)
+        else:
+            server = await asyncio.start_server(self.__handleConnection, AnalysisServer.HOST, port,
+                                                limit=self.__line_limit)
+        batcher = asyncio.ensure_future(self.__analyzeBatches())
+        self.__ready.set()
+        try:
+            async with server:
+                try:
+                    await self.__stopped.wait()
+                finally:
+                    server.close()
+                    await self.__closeConnections()
+        finally:
+            batcher.cancel()
+            try:
+                await batcher
+            except asyncio.CancelledError:
+                pass
+            self.__ready.clear()
+
+    async def __closeConnections(self):
+        """
+        Answers the requests waiting for a batch with an error, ends the requests of each connection and waits until
+        the connections have sent their responses and are closed.
+        """
+        self.__closing = True
+        for response, request_id in list(self.__waiting.items()):
+            if not response.done():
+                response.set_result({"id": request_id, "error": AnalysisServer.SHUTDOWN_ERROR})
+        while not self.__queue.empty():
+            self.__queue.get_nowait()
+        for reader in self.__connections.values():
+            reader.feed_eof()
+        if len(self.__connections) > 0:
+            await asyncio.gather(*self.__connections.keys(), return_exceptions=True)
+
+    def waitUntilReady(self, timeout=None) -> bool:
+        """
+        Waits until the server accepts connections. It can be called from another thread than the server.
+
+        PARAMETERS
+        ----------
+        timeout : float
+            Maximum time to wait in seconds, None to wait without limit.
+
+        RETURNS
+        -------
+        bool
+            True if the server accepts connections, False if the timeout expired.
+        """
+        return self.__ready.wait(timeout)
+
+    def close(self):
+        """
+        Stops the server. It can be called from another thread than the server.
+        """
+        if self.__loop is not None and not self.__loop.is_closed():
+            self.__loop.call_soon_threadsafe(self.__stopped.set)
+
+    async def __handleConnection(self,
+                                 reader: asyncio.StreamReader,
+                                 writer: asyncio.StreamWriter):
+        """
+        Reads the requests of a connection and queues them for the batches, while a second task sends their responses
+        in the order of the requests. A request longer than the line limit is answered with an error, and the
+        connection is closed, since the rest of the request can not be told apart from the next requests.
+
+        PARAMETERS
+        ----------
+        reader : asyncio.StreamReader
+            Stream of the requests.
+        writer : asyncio.StreamWriter
+            Stream of the responses.
+        """
+        self.__connections[asyncio.current_task()] = reader
+        responses = asyncio.Queue()
+        sender = asyncio.ensure_future(self.__sendResponses(responses, writer))
+        try:
+            while not self.__closing:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    await responses.put(self.__errorResponse(None, "The request is longer than " +
+                                                             str(self.__line_limit) + " bytes"))
+                    break
+                except ConnectionError:
+                    break
+                if len(line) == 0:
+                    break
+                if len(line.strip()) > 0:
+                    await responses.put(await self.__queueRequest(line))
+        finally:
+            await responses.put(None)
+            try:
+                await sender
+            except ConnectionError:
+                pass
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+            del self.__connections[asyncio.current_task()]
+
+    def __errorResponse(self,
+                        requestId,
+                        message: str) -> asyncio.Future:
+        """
+        Returns a future already set to an error response.
+
+        PARAMETERS
+        ----------
+        requestId : object
+            Id of the request, None if it is not known.
+        message : str
+            Error message.
+
+        RETURNS
+        -------
+        asyncio.Future
+            Future of the error response.
+        """
+        response = self.__loop.create_future()
+        response.set_result({"id": requestId, "error": message})
+        return response
+
+    async def __queueRequest(self, line: bytes) -> asyncio.Future:
+        """
+        Parses a request and adds its words to the queue of the batches. If the queue is full, it waits until a batch
+        takes requests from it. The queued item records whether the request has a single word or a list of words.
+
+        PARAMETERS
+        ----------
+        line : bytes
+            JSON encoded request.
+
+        RETURNS
+        -------
+        asyncio.Future
+            Future of the response of the request.
+        """
+        try:
+            request = json.loads(line)
+            if not isinstance(request, dict):
+                raise ValueError("The request is not an object")
+            if "word" in request and isinstance(request["word"], str):
+                words = [request["word"]]
+                single = True
+            elif "words" in request and isinstance(request["words"], list) and \
+                    all(isinstance(word, str) for word in request["words"]):
+                words = request["words"]
+                single = False
+            else:
+                raise ValueError("The request has neither a word nor a list of words")
+        except ValueError as error:
+            return self.__errorResponse(None, str(error))
+        if self.__closing:
+            return self.__errorResponse(request.get("id"), AnalysisServer.SHUTDOWN_ERROR)
+        response = self.__loop.create_future()
+        self.__waiting[response] = request.get("id")
+        response.add_done_callback(lambda done: self.__waiting.pop(done, None))
+        self.__requests += 1
+        await self.__queue.put((request.get("id"), words, single, response))
+        return response
+
+    async def __sendResponses(self,
+                              responses: asyncio.Queue,
+                              writer: asyncio.StreamWriter):
+        """
+        Writes the responses of a connection as soon as they are available, in the order of the requests.
+
+        PARAMETERS
+        ----------
+        responses : asyncio.Queue
+            Futures of the responses, ended with None.
+        writer : asyncio.StreamWriter
+            Stream of the responses.
+        """
+        while True:
+            response = await responses.get()
+            if response is None:
+                break
+            writer.write(json.dumps(await response, ensure_ascii=False).encode("utf8") + b"\n")
+            await writer.drain()
+
+    async def __analyzeBatches(self):
+        """
+        Collects the requests arriving within the batching window after a first request, analyzes their distinct words
+        in the executor and sets the responses of the requests. An error while answering a request is sent as its
+        response, so that it does not stop the batches.
+        """
+        while True:
+            batch = [await self.__queue.get()]
+            size = len(batch[0][1])
+            deadline = self.__loop.time() + self.__window
+            while size < self.__max_batch:
+                timeout = deadline - self.__loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self.__queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                batch.append(item)
+                size = size + len(item[1])
+            self.__batches += 1
+            surface_forms = list(dict.fromkeys(word for _, words, _, _ in batch for word in words))
+            try:
+                analyses = await self.__loop.run_in_executor(self.__executor, self.__analyze, surface_forms)
+            except Exception as error:
+                for request_id, _, _, response in batch:
+                    if not response.done():
+                        response.set_result({"id": request_id, "error": str(error)})
+                continue
+            for request_id, words, single, response in batch:
+                if response.done():
+                    continue
+                try:
+                    if single:
+                        result = {"id": request_id, "analyses": analyses[words[0]]}
+                    else:
+                        result = {"id": request_id, "analyses": [analyses[word] for word in words]}
+                except Exception as error:
+                    result = {"id": request_id, "error": str(error)}
+                response.set_result(result)
+
+    def __analyze(self, surfaceForms: list) -> dict:
+        """
+        Analyzes the given distinct surface forms with the analyzeMany method of the analyzer.
+
+        PARAMETERS
+        ----------
+        surfaceForms : list
+            Surface forms to analyze.
+
+        RETURNS
+        -------
+        dict
+            Map from the surface forms to the strings of their analyses.
+        """
+        parse_lists = self.__analyzer.analyzeMany(surfaceForms)
+        return {surface_form: [parse.__str__() for parse in parse_list.toTuple()]
+                for surface_form, parse_list in zip(surfaceForms, parse_lists)}
+
+    def getRequests(self) -> int:
+        """
+        Getter for the number of valid requests received.
+
+        RETURNS
+        -------
+        int
+            Number of requests.
+        """
+        return self.__requests
+
+    def getBatches(self) -> int:
+        """
+        Getter for the number of batches analyzed.
+
+        RETURNS
+        -------
+        int
+            Number of batches.
+        """
+        return self.__batches
+
+
+def main():
+    """
+    Starts an analysis server with the options given on the command line.
+    """
+    parser = argparse.ArgumentParser(description="Serves the analyses of an FsmMorphologicalAnalyzer to local clients")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--socket", help="path of the Unix domain socket")
+    group.add_argument("--port", type=int, help="TCP port on the loopback address")
+    parser.add_argument("--window", type=float, default=5.0, help="batching window in milliseconds")
+    parser.add_argument("--max-batch", type=int, default=1000, help="maximum number of words in a batch")
+    parser.add_argument("--max-pending", type=int, default=10000, help="maximum number of requests waiting for a batch")
+    parser.add_argument("--snapshot", help="analyzer snapshot written with saveSnapshot")
+    parser.add_argument("--lexicon", help="lexicon file written with saveMappedLexicon")
+    parser.add_argument("--cache-snapshot", help="cache snapshot written with saveCacheSnapshot")
+    arguments = parser.parse_args()
+    if arguments.snapshot is not None:
+        analyzer = FsmMorphologicalAnalyzer.fromSnapshot(arguments.snapshot)
+    elif arguments.lexicon is not None:
+        analyzer = FsmMorphologicalAnalyzer.fromMappedLexicon(arguments.lexicon)
+    else:
+        analyzer = FsmMorphologicalAnalyzer()
+    if arguments.cache_snapshot is not None:
+        analyzer.loadCacheSnapshot(arguments.cache_snapshot)
+    server = AnalysisServer(analyzer, arguments.window / 1000, arguments.max_batch, arguments.max_pending)
+    try:
+        asyncio.run(server.serve(arguments.socket, arguments.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
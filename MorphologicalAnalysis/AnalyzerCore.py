@@ -0,0 +1,339 @@
+import gc
+import hashlib
+import os
+import pickle
+import sys
+
+from Dictionary.Trie.Trie import Trie
+from Dictionary.TxtDictionary import TxtDictionary
+from Dictionary.Word import Word
+from Util.FileUtils import FileUtils
+
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.MappedLexicon import MappedLexicon
+
+
+class _SnapshotUnpickler(pickle.Unpickler):
+
+    def find_class(self,
+                   module: str,
+                   name: str):
+        """
+        Returns the class with the given module and name if it is one of the classes of a core, see
+        AnalyzerCore.SNAPSHOT_CLASSES. Any other class or function is refused.
+
+        PARAMETERS
+        ----------
+        module : str
+            Module of the class.
+        name : str
+            Name of the class.
+
+        RETURNS
+        -------
+        type
+            Class with the given module and name.
+        """
+        if name not in AnalyzerCore.SNAPSHOT_CLASSES.get(module, ()):
+            raise pickle.UnpicklingError(module + "." + name + " is not allowed in an analyzer snapshot")
+        return super().find_class(module, name)
+
+
+class AnalyzerCore:
+
+    __dictionary: TxtDictionary
+    __dictionary_trie: Trie
+    __suffix_trie: Trie
+    __finite_state_machine: FiniteStateMachine
+    __finite_state_machine_digest: str
+    __pronunciations: dict
+    __misspelled_file_name: str
+    __stamp: str
+
+    DATA_DIRECTORY = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+    SNAPSHOT_MAGIC = b"FSMSNAP"
+    SNAPSHOT_VERSION = 3
+    SNAPSHOT_CLASSES = {"Dictionary.Dictionary": ("Dictionary.turkishLowerCaseComparator",),
+                        "Dictionary.TxtDictionary": ("TxtDictionary",),
+                        "Dictionary.TxtWord": ("TxtWord",),
+                        "Dictionary.Word": ("Word",),
+                        "Dictionary.Trie.Trie": ("Trie",),
+                        "Dictionary.Trie.TrieNode": ("TrieNode",),
+                        "MorphologicalAnalysis.FiniteStateMachine": ("FiniteStateMachine",),
+                        "MorphologicalAnalysis.State": ("State",),
+                        "MorphologicalAnalysis.Transition": ("Transition",),
+                        "builtins": ("set", "frozenset", "list", "tuple", "dict", "str", "bytes", "int", "float",
+                                     "bool")}
+
+    def __init__(self,
+                 dictionaryFileName=None,
+                 misspelledFileName=None,
+                 fileName=os.path.join(DATA_DIRECTORY, 'turkish_finite_state_machine.xml')):
+        """
+        Constructor of AnalyzerCore class. The core contains the linguistic data of the morphological analyzer: the
+        dictionary, the dictionary trie, the finite state machine, the suffix trie and the pronunciations. The core is
+        not modified after it is loaded, the roots added while analyzing are kept by each analyzer separately, so one
+        core can be shared by many FsmMorphologicalAnalyzer instances with different caches and settings. The suffix
+        trie and the pronunciations, which are only used for unknown words, are loaded when they are first needed.
+
+        PARAMETERS
+        ----------
+        dictionaryFileName : str
+            the file to read the dictionary.
+        misspelledFileName: str
+            the file to read the misspelled file name.
+        fileName : str
+            the file to read the finite state machine.
+        """
+        if dictionaryFileName is None:
+            self.__dictionary = TxtDictionary()
+            misspelledFileName = os.path.join(os.path.dirname(sys.modules[TxtDictionary.__module__].__file__), "data",
+                                              "turkish_misspellings.txt")
+        else:
+            self.__dictionary = TxtDictionary(dictionaryFileName, misspelledFileName)
+        self.__misspelled_file_name = misspelledFileName
+        self.__finite_state_machine = FiniteStateMachine(fileName)
+        with open(fileName, "rb") as input_file:
+            self.__finite_state_machine_digest = hashlib.sha256(input_file.read()).hexdigest()
+        self.__dictionary_trie = self.__dictionary.prepareTrie()
+        self.__suffix_trie = None
+        self.__pronunciations = None
+        self.__stamp = None
+
+    def getDictionary(self) -> TxtDictionary:
+        """
+        Getter for the dictionary.
+
+        RETURNS
+        -------
+        TxtDictionary
+            Dictionary of the core.
+        """
+        return self.__dictionary
+
+    def getDictionaryTrie(self) -> Trie:
+        """
+        Getter for the trie of the dictionary words and their variants.
+
+        RETURNS
+        -------
+        Trie
+            Dictionary trie of the core.
+        """
+        return self.__dictionary_trie
+
+    def getFiniteStateMachine(self) -> FiniteStateMachine:
+        """
+        Getter for the finite state machine.
+
+        RETURNS
+        -------
+        FiniteStateMachine
+            Finite state machine of the core.
+        """
+        return self.__finite_state_machine
+
+    def getSuffixTrie(self) -> Trie:
+        """
+        Returns the suffix trie, and constructs it from suffixes.txt if it is not loaded yet.
+
+        RETURNS
+        -------
+        Trie
+            Suffix trie of the core.
+        """
+        if self.__suffix_trie is None:
+            self.prepareSuffixTrie(os.path.join(AnalyzerCore.DATA_DIRECTORY, 'suffixes.txt'))
+        return self.__suffix_trie
+
+    def getPronunciations(self) -> dict:
+        """
+        Returns the pronunciations of the foreign proper nouns, and reads them from pronunciations.txt if they are not
+        loaded yet.
+
+        RETURNS
+        -------
+        dict
+            Map from the foreign words to their pronunciations.
+        """
+        if self.__pronunciations is None:
+            self.addPronunciations(os.path.join(AnalyzerCore.DATA_DIRECTORY, 'pronunciations.txt'))
+        return self.__pronunciations
+
+    def prepareSuffixTrie(self, fileName: str):
+        """
+        Constructs the suffix trie from the given file, which contains the most frequent suffixes that a verb or a
+        noun can take. The suffixes are stored in reverse form.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the file that contains the suffixes.
+        """
+        suffix_trie = Trie()
+        with open(fileName, "r") as input_file:
+            lines = input_file.readlines()
+        for suffix in lines:
+            reverse_suffix = suffix.strip()[::-1]
+            suffix_trie.addWord(reverse_suffix, Word(reverse_suffix))
+        self.__suffix_trie = suffix_trie
+
+    def addPronunciations(self, fileName: str):
+        """
+        Reads the foreign words and their pronunciations from the given file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Input file containing foreign words and their pronunciations.
+        """
+        self.__pronunciations = FileUtils.readHashMap(fileName)
+
+    def preload(self):
+        """
+        Loads the suffix trie and the pronunciations, if they are not loaded yet.
+        """
+        self.getSuffixTrie()
+        self.getPronunciations()
+
+    def getStamp(self) -> str:
+        """
+        Returns the hash of the finite state machine file and of the words of the dictionary with their flags, which
+        identifies the analyses computed with this core. It is computed once, since the core is not modified.
+
+        RETURNS
+        -------
+        str
+            Hexadecimal SHA-256 hash.
+        """
+        if self.__stamp is None:
+            digest = hashlib.sha256()
+            digest.update(self.__finite_state_machine_digest.encode("ascii"))
+            for i in range(self.__dictionary.size()):
+                digest.update(self.__dictionary.getWordWithIndex(i).__str__().encode("utf8"))
+                digest.update(b"\n")
+            self.__stamp = digest.hexdigest()
+        return self.__stamp
+
+    def saveSnapshot(self, fileName: str):
+        """
+        Writes the core to a binary snapshot file. The lazily loaded components are loaded first, so a core loaded
+        from the snapshot with fromSnapshot does not read the xml and text files or insert the words into the tries
+        again.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the snapshot file.
+        """
+        self.preload()
+        state = {"dictionary": self.__dictionary,
+                 "dictionary_trie": self.__dictionary_trie,
+                 "suffix_trie": self.__suffix_trie,
+                 "finite_state_machine": self.__finite_state_machine,
+                 "finite_state_machine_digest": self.__finite_state_machine_digest,
+                 "pronunciations": self.__pronunciations,
+                 "misspelled_file_name": self.__misspelled_file_name}
+        with open(fileName, "wb") as output_file:
+            output_file.write(AnalyzerCore.SNAPSHOT_MAGIC)
+            output_file.write(bytes([AnalyzerCore.SNAPSHOT_VERSION]))
+            pickle.dump(state, output_file, pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def fromSnapshot(fileName: str):
+        """
+        Loads a core from a snapshot file written with saveSnapshot. The garbage collector is paused while the
+        snapshot is loaded, since the millions of objects of the tries would otherwise trigger many useless
+        collections.
+
+        Snapshots must be trusted files, since they are read with pickle. Only the classes of a core can be loaded,
+        see SNAPSHOT_CLASSES, but the contents of those objects are not checked, so do not load snapshots written by
+        others.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the snapshot file.
+
+        RETURNS
+        -------
+        AnalyzerCore
+            Core with the dictionary, tries and finite state machine of the snapshot.
+        """
+        magic = AnalyzerCore.SNAPSHOT_MAGIC
+        gc_enabled = gc.isenabled()
+        with open(fileName, "rb") as input_file:
+            header = input_file.read(len(magic) + 1)
+            if header[:len(magic)] != magic:
+                raise ValueError(fileName + " is not an analyzer snapshot file")
+            if header[len(magic):] != bytes([AnalyzerCore.SNAPSHOT_VERSION]):
+                raise ValueError(fileName + " was written by another version of the analyzer")
+            gc.disable()
+            try:
+                state = _SnapshotUnpickler(input_file).load()
+            finally:
+                if gc_enabled:
+                    gc.enable()
+        core = AnalyzerCore.__new__(AnalyzerCore)
+        core.__dictionary = state["dictionary"]
+        core.__dictionary_trie = state["dictionary_trie"]
+        core.__suffix_trie = state["suffix_trie"]
+        core.__finite_state_machine = state["finite_state_machine"]
+        core.__finite_state_machine_digest = state["finite_state_machine_digest"]
+        core.__pronunciations = state["pronunciations"]
+        core.__misspelled_file_name = state["misspelled_file_name"]
+        core.__stamp = None
+        return core
+
+    def saveMappedLexicon(self, fileName: str):
+        """
+        Writes the dictionary, the dictionary trie and the misspelled words to a lexicon file, which can be attached by
+        any number of processes with fromMappedLexicon without loading the dictionary. The misspelled words are read
+        from the file the dictionary read them from, or from the lexicon of a core created with fromMappedLexicon.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the lexicon file.
+        """
+        if isinstance(self.__dictionary, MappedLexicon):
+            misspelled_words = self.__dictionary.getMisspelledWords()
+        elif self.__misspelled_file_name is not None:
+            misspelled_words = FileUtils.readHashMap(self.__misspelled_file_name)
+        else:
+            misspelled_words = {}
+        MappedLexicon.save(fileName, self.__dictionary, self.__dictionary_trie, misspelled_words)
+
+    @staticmethod
+    def fromMappedLexicon(source,
+                          fileName=os.path.join(DATA_DIRECTORY, 'turkish_finite_state_machine.xml')):
+        """
+        Creates a core whose dictionary and dictionary trie are a MappedLexicon attached to the given lexicon file or
+        buffer, written with saveMappedLexicon. The words are read from the shared pages of the lexicon when they are
+        first needed, instead of being loaded by each process. The finite state machine, which is small, is read from
+        its file. Such a core can not be written to a snapshot.
+
+        PARAMETERS
+        ----------
+        source : str or buffer
+            Name of the lexicon file, or a buffer containing it, such as the buffer of a SharedMemory.
+        fileName : str
+            the file to read the finite state machine.
+
+        RETURNS
+        -------
+        AnalyzerCore
+            Core using the mapped lexicon.
+        """
+        lexicon = MappedLexicon(source)
+        core = AnalyzerCore.__new__(AnalyzerCore)
+        core.__dictionary = lexicon
+        core.__dictionary_trie = lexicon
+        core.__finite_state_machine = FiniteStateMachine(fileName)
+        with open(fileName, "rb") as input_file:
+            core.__finite_state_machine_digest = hashlib.sha256(input_file.read()).hexdigest()
+        core.__suffix_trie = None
+        core.__pronunciations = None
+        core.__misspelled_file_name = None
+        core.__stamp = None
+        return core
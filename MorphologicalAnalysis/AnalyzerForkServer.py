@@ -0,0 +1,299 @@
+import gc
+import multiprocessing
+import os
+import queue
+import threading
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.FsmParseList import FsmParseList
+from MorphologicalAnalysis.ParseSerializer import ParseSerializer
+
+
+def _serveRequests(analyzer: FsmMorphologicalAnalyzer,
+                   requests,
+                   results):
+    """
+    Main loop of a worker process of AnalyzerForkServer. It analyzes the surface forms of each request with the
+    analyzer inherited from the server and sends back their analyses serialized with a ParseSerializer, until it
+    receives None.
+
+    PARAMETERS
+    ----------
+    analyzer : FsmMorphologicalAnalyzer
+        Analyzer inherited from the server process.
+    requests : Queue
+        Queue of the requests of this worker, which are pairs of a request number and a list of surface forms.
+    results : Queue
+        Queue of the results shared by all workers.
+    """
+    serializer = ParseSerializer(analyzer.getFiniteStateMachine(), analyzer.getDictionary())
+    while True:
+        request = requests.get()
+        if request is None:
+            break
+        request_id, surface_forms = request
+        parses = [analyzer.morphologicalAnalysis(surface_form).toTuple() for surface_form in surface_forms]
+        results.put((request_id, serializer.encode(parses)))
+
+
+class AnalyzerForkServer:
+
+    __analyzer: FsmMorphologicalAnalyzer
+    __worker_count: int
+    __workers: list
+    __requests: list
+    __results: object
+    __serializer: ParseSerializer
+    __next_request: int
+    __condition: threading.Condition
+    __finished: dict
+    __abandoned: set
+    __reading: bool
+    __frozen_servers = 0
+    __unfreeze_when_stopped = False
+    __freeze_lock = threading.Lock()
+
+    TIMEOUT = 1.0
+
+    def __init__(self,
+                 analyzer=None,
+                 workers=None):
+        """
+        Constructor of AnalyzerForkServer class. The server builds the analyzer once and forks worker processes, which
+        share the memory of the analyzer with the server as long as they do not write to it. Before forking, the
+        components loaded on first use are loaded, and the objects of the analyzer are moved to the permanent
+        generation of the garbage collector with gc.freeze, so that the collections of the workers do not write to
+        every word, trie node and transition of the analyzer and copy their pages. Only the pages of the objects
+        used by the analyses of a worker are copied by reference counting. The server can be used by several threads
+        at the same time.
+
+        PARAMETERS
+        ----------
+        analyzer : FsmMorphologicalAnalyzer
+            Analyzer shared by the workers. If None, a new analyzer is constructed.
+        workers : int
+            Number of worker processes. If None, the number of processors is used.
+        """
+        if analyzer is None:
+            analyzer = FsmMorphologicalAnalyzer()
+        if workers is None:
+            workers = os.cpu_count()
+        self.__analyzer = analyzer
+        self.__worker_count = workers
+        self.__workers = []
+        self.__requests = []
+        self.__results = None
+        self.__serializer = ParseSerializer(analyzer.getFiniteStateMachine(), analyzer.getDictionary())
+        self.__next_request = 0
+        self.__condition = threading.Condition()
+        self.__finished = {}
+        self.__abandoned = set()
+        self.__reading = False
+
+    def start(self):
+        """
+        Forks the worker processes. The garbage collector of the server stays frozen until stop is called. If the
+        garbage collector was already frozen before the first server started, it is left frozen.
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("The fork server needs a platform that can fork processes")
+        if len(self.__workers) > 0:
+            return
+        self.__analyzer.preload()
+        context = multiprocessing.get_context("fork")
+        self.__results = context.Queue()
+        self.__requests = [context.Queue() for _ in range(self.__worker_count)]
+        with AnalyzerForkServer.__freeze_lock:
+            if AnalyzerForkServer.__frozen_servers == 0:
+                AnalyzerForkServer.__unfreeze_when_stopped = gc.get_freeze_count() == 0
+            AnalyzerForkServer.__frozen_servers += 1
+            gc.collect()
+            gc.freeze()
+        for requests in self.__requests:
+            worker = context.Process(target=_serveRequests, args=(self.__analyzer, requests, self.__results),
+                                     daemon=True)
+            worker.start()
+            self.__workers.append(worker)
+
+    def analyze(self,
+                surfaceForms: list,
+                chunkSize=None) -> list:
+        """
+        Analyzes the given surface forms in the workers and returns their analyses in the order of the surface forms.
+        Each distinct surface form is analyzed once, and the distinct surface forms are sent to the workers in chunks.
+
+        PARAMETERS
+        ----------
+        surfaceForms : list
+            Surface forms to analyze.
+        chunkSize : int
+            Number of surface forms sent to a worker at once. If None, the surface forms are divided equally among the
+            workers.
+
+        RETURNS
+        -------
+        list
+            FsmParseList of each surface form, in the order of the surface forms.
+        """
+        if len(self.__workers) == 0:
+            raise ValueError("The fork server is not started")
+        types = list(dict.fromkeys(surfaceForms))
+        if chunkSize is None:
+            chunkSize = max(1, (len(types) + len(self.__workers) - 1) // len(self.__workers))
+        chunks = {}
+        with self.__condition:
+            for i in range(0, len(types), chunkSize):
+                request_id = self.__next_request
+                self.__next_request = self.__next_request + 1
+                worker_index = request_id % len(self.__workers)
+                chunks[request_id] = (worker_index, types[i: i + chunkSize])
+                self.__requests[worker_index].put((request_id, chunks[request_id][1]))
+        analyses = {}
+        for request_id, data in self.__waitForResults(chunks).items():
+            for surface_form, parses in zip(chunks[request_id][1], self.__serializer.decode(data)):
+                analyses[surface_form] = parses
+        return [FsmParseList(analyses[surface_form]) for surface_form in surfaceForms]
+
+    def __waitForResults(self, chunks: dict) -> dict:
+        """
+        Waits for the results of the given requests. The results of all callers arrive on one queue, which is read by
+        one caller at a time. The reader keeps the results it receives in the finished results, where each caller
+        takes its own results, and wakes up the other callers. The results of the requests abandoned by their callers
+        are dropped.
+
+        PARAMETERS
+        ----------
+        chunks : dict
+            Map from the request numbers to the worker index and the surface forms of each request.
+
+        RETURNS
+        -------
+        dict
+            Map from the request numbers to their serialized results.
+        """
+        results = {}
+        while True:
+            with self.__condition:
+                for request_id in chunks:
+                    if request_id not in results and request_id in self.__finished:
+                        results[request_id] = self.__finished.pop(request_id)
+                if len(results) == len(chunks):
+                    return results
+                if self.__reading:
+                    if not self.__condition.wait(AnalyzerForkServer.TIMEOUT):
+                        self.__checkWorkers(chunks, results)
+                    continue
+                self.__reading = True
+            request_id = None
+            try:
+                request_id, data = self.__results.get(timeout=AnalyzerForkServer.TIMEOUT)
+            except queue.Empty:
+                pass
+            finally:
+                with self.__condition:
+                    self.__reading = False
+                    if request_id in self.__abandoned:
+                        self.__abandoned.remove(request_id)
+                    elif request_id is not None:
+                        self.__finished[request_id] = data
+                    self.__condition.notify_all()
+            if request_id is None:
+                self.__checkWorkers(chunks, results)
+
+    def __checkWorkers(self,
+                       chunks: dict,
+                       results: dict):
+        """
+        Raises a ValueError if a worker handling one of the given requests exited. Since the caller does not wait for
+        the requests anymore, their finished results are dropped, and the results arriving later will be dropped by
+        the reader.
+
+        PARAMETERS
+        ----------
+        chunks : dict
+            Map from the request numbers to the worker index and the surface forms of each request.
+        results : dict
+            Results of the given requests already taken by the caller.
+        """
+        for worker_index, _ in chunks.values():
+            if not self.__workers[worker_index].is_alive():
+                with self.__condition:
+                    for request_id in chunks:
+                        if request_id not in results and self.__finished.pop(request_id, None) is None:
+                            self.__abandoned.add(request_id)
+                raise ValueError("A worker of the fork server exited")
+
+    @staticmethod
+    def uniqueMemory(pid: int) -> int:
+        """
+        Returns the memory used only by the given process, that is the resident pages it does not share with any other
+        process. It is read from /proc, so it is only available on Linux.
+
+        PARAMETERS
+        ----------
+        pid : int
+            Process id.
+
+        RETURNS
+        -------
+        int
+            Unique resident memory in bytes, None if it can not be read.
+        """
+        try:
+            with open("/proc/" + str(pid) + "/smaps_rollup", "r") as input_file:
+                lines = input_file.readlines()
+        except OSError:
+            return None
+        size = 0
+        for line in lines:
+            items = line.split()
+            if items[0] in ("Private_Clean:", "Private_Dirty:"):
+                size = size + int(items[1]) * 1024
+        return size
+
+    def getWorkerMemory(self) -> dict:
+        """
+        Returns the unique resident memory of each worker, see uniqueMemory.
+
+        RETURNS
+        -------
+        dict
+            Map from the process ids of the workers to their unique memory in bytes.
+        """
+        return {worker.pid: AnalyzerForkServer.uniqueMemory(worker.pid) for worker in self.__workers}
+
+    def getWorkerCount(self) -> int:
+        """
+        Getter for the number of worker processes.
+
+        RETURNS
+        -------
+        int
+            Number of workers.
+        """
+        return self.__worker_count
+
+    def stop(self):
+        """
+        Stops the worker processes. The garbage collector is unfrozen when the last running server stops, unless it
+        was frozen before the first server started.
+        """
+        if len(self.__workers) == 0:
+            return
+        for requests in self.__requests:
+            requests.put(None)
+        for worker in self.__workers:
+            worker.join(AnalyzerForkServer.TIMEOUT)
+            if worker.is_alive():
+                worker.terminate()
+                worker.join()
+        self.__workers = []
+        self.__requests = []
+        self.__results = None
+        with self.__condition:
+            self.__finished = {}
+            self.__abandoned = set()
+        with AnalyzerForkServer.__freeze_lock:
+            AnalyzerForkServer.__frozen_servers -= 1
+            if AnalyzerForkServer.__frozen_servers == 0 and AnalyzerForkServer.__unfreeze_when_stopped:
+                gc.unfreeze()
@@ -0,0 +1,219 @@
+import asyncio
+import weakref
+from concurrent.futures import Executor, ThreadPoolExecutor
+
+from Corpus.Sentence import Sentence
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.FsmParseList import FsmParseList
+
+
+class AsyncFsmMorphologicalAnalyzer:
+
+    __analyzer: FsmMorphologicalAnalyzer
+    __executor: Executor
+    __own_executor: bool
+    __max_concurrency: int
+    __max_pending: int
+    __loops: weakref.WeakKeyDictionary
+    __analyses: int
+    __coalesced: int
+
+    def __init__(self,
+                 analyzer=None,
+                 maxConcurrency=4,
+                 executor=None,
+                 maxPending=1000):
+        """
+        Constructor of AsyncFsmMorphologicalAnalyzer class. The class lets asyncio services analyze words without
+        blocking their event loop: the analyses run in an executor, and the requests for a word that is already being
+        analyzed wait for that analysis instead of starting another one. At most maxConcurrency analyses run at the
+        same time, and at most maxPending distinct surface forms are pending, that is waiting for or running their
+        analysis. A request for another surface form waits until one of the pending analyses ends before it is
+        admitted, so that a burst of requests neither queues an unbounded amount of work in the executor nor creates
+        an unbounded number of tasks. The limits and the pending requests are kept separately for each event loop, so
+        the same instance can be used by several loops, one after the other or at the same time.
+
+        PARAMETERS
+        ----------
+        analyzer : FsmMorphologicalAnalyzer
+            Analyzer used by the executor threads. If None, a new analyzer is constructed.
+        maxConcurrency : int
+            Maximum number of analyses running at the same time.
+        executor : Executor
+            Executor running the analyses. If None, a thread pool with maxConcurrency threads is created and shut down
+            by close.
+        maxPending : int
+            Maximum number of distinct surface forms pending at the same time.
+        """
+        if analyzer is None:
+            analyzer = FsmMorphologicalAnalyzer()
+        self.__analyzer = analyzer
+        self.__own_executor = executor is None
+        if executor is None:
+            executor = ThreadPoolExecutor(maxConcurrency)
+        self.__executor = executor
+        self.__max_concurrency = maxConcurrency
+        self.__max_pending = maxPending
+        self.__loops = weakref.WeakKeyDictionary()
+        self.__analyses = 0
+        self.__coalesced = 0
+
+    async def analyze(self, surfaceForm: str) -> FsmParseList:
+        """
+        Analyzes the given surface form in the executor. If the same surface form is already pending, its analysis is
+        awaited instead. Otherwise, the request waits until less than maxPending surface forms are pending. The
+        cancellation of a request does not cancel the analysis awaited by the other requests. Each request gets its own
+        copies of the parses.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to analyse.
+
+        RETURNS
+        -------
+        FsmParseList
+            Analyses of the surface form.
+        """
+        semaphore, admission, pending = self.__loopState()
+        future = pending.get(surfaceForm)
+        if future is None:
+            await admission.acquire()
+            future = pending.get(surfaceForm)
+            if future is None:
+                future = asyncio.ensure_future(self.__analyze(surfaceForm, semaphore))
+                pending[surfaceForm] = future
+                future.add_done_callback(lambda done: self.__endAnalysis(surfaceForm, admission, pending))
+            else:
+                admission.release()
+                self.__coalesced += 1
+        else:
+            self.__coalesced += 1
+        return FsmParseList(tuple(parse.clone() for parse in await asyncio.shield(future)))
+
+    @staticmethod
+    def __endAnalysis(surfaceForm: str,
+                      admission: asyncio.Semaphore,
+                      pending: dict):
+        """
+        Removes an ended analysis from the pending requests and admits a waiting request.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Analyzed surface form.
+        admission : asyncio.Semaphore
+            Semaphore limiting the pending surface forms of the running event loop.
+        pending : dict
+            Map of the pending requests of the running event loop.
+        """
+        pending.pop(surfaceForm, None)
+        admission.release()
+
+    def __loopState(self) -> tuple:
+        """
+        Returns the semaphores limiting the running analyses and the pending surface forms, and the map of the pending
+        requests of the running event loop. They are created when the loop first uses the analyzer, and dropped when
+        the loop is garbage collected.
+
+        RETURNS
+        -------
+        tuple
+            Semaphore of the analyses, semaphore of the pending surface forms and map from the surface forms to the
+            futures of their analyses.
+        """
+        loop = asyncio.get_running_loop()
+        state = self.__loops.get(loop)
+        if state is None:
+            state = (asyncio.Semaphore(self.__max_concurrency), asyncio.Semaphore(self.__max_pending), {})
+            self.__loops[loop] = state
+        return state
+
+    async def __analyze(self,
+                        surfaceForm: str,
+                        semaphore: asyncio.Semaphore) -> tuple:
+        """
+        Waits until less than maxConcurrency analyses are running and analyzes the given surface form in the executor.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to analyse.
+        semaphore : asyncio.Semaphore
+            Semaphore of the running event loop.
+
+        RETURNS
+        -------
+        tuple
+            Analyses of the surface form.
+        """
+        async with semaphore:
+            self.__analyses += 1
+            return await asyncio.get_running_loop().run_in_executor(
+                self.__executor, lambda: self.__analyzer.morphologicalAnalysis(surfaceForm).toTuple())
+
+    async def analyzeSentence(self, sentence: Sentence) -> list:
+        """
+        Analyzes the words of the given sentence concurrently. As in the morphologicalAnalysis method of the analyzer,
+        the misspelled words are replaced with their correct forms in the dictionary.
+
+        PARAMETERS
+        ----------
+        sentence : Sentence
+            Sentence to analyse.
+
+        RETURNS
+        -------
+        list
+            FsmParseList of each word of the sentence.
+        """
+        dictionary = self.__analyzer.getDictionary()
+        surface_forms = []
+        for i in range(sentence.wordCount()):
+            original_form = sentence.getWord(i).getName()
+            spell_corrected_form = dictionary.getCorrectForm(original_form)
+            if len(spell_corrected_form) == 0:
+                spell_corrected_form = original_form
+            surface_forms.append(spell_corrected_form)
+        return list(await asyncio.gather(*[self.analyze(surface_form) for surface_form in surface_forms]))
+
+    def getAnalyzer(self) -> FsmMorphologicalAnalyzer:
+        """
+        Getter for the analyzer.
+
+        RETURNS
+        -------
+        FsmMorphologicalAnalyzer
+            Analyzer running in the executor.
+        """
+        return self.__analyzer
+
+    def getAnalyses(self) -> int:
+        """
+        Getter for the number of analyses run in the executor.
+
+        RETURNS
+        -------
+        int
+            Number of analyses.
+        """
+        return self.__analyses
+
+    def getCoalesced(self) -> int:
+        """
+        Getter for the number of requests which awaited the analysis of another request.
+
+        RETURNS
+        -------
+        int
+            Number of coalesced requests.
+        """
+        return self.__coalesced
+
+    def close(self):
+        """
+        Shuts down the executor if it was created by the constructor.
+        """
+        if self.__own_executor:
+            self.__executor.shutdown()
@@ -7,6 +7,8 @@ from MorphologicalAnalysis.Transition import Transition
 class FiniteStateMachine:
     __states: list
     __transitions: dict
+    __state_map: dict
+    __transition_table: list
 
     def __init__(self, fileName: str):
         """
@@ -26,6 +28,10 @@ class FiniteStateMachine:
         toState then continue with the nextSiblings. Also, if there is no possible toState, it prints this case and the
         causative states.
 
+        The machine is compiled while it is read; each state gets a dense integer index in the order of the file, and
+        the transitions of each state are stored in a table indexed by that integer. Therefore, getState and
+        getTransitions do not search the states.
+
         PARAMETERS
         ----------
         fileName : str
@@ -33,6 +39,8 @@ class FiniteStateMachine:
         """
         self.__transitions = {}
         self.__states = []
+        self.__state_map = {}
+        self.__transition_table = []
         root = xml.etree.ElementTree.parse(fileName).getroot()
         for state_node in root:
             state_name = state_node.attrib["name"]
@@ -40,9 +48,9 @@ class FiniteStateMachine:
             end_state = state_node.attrib["end"] == "yes"
             if start_state:
                 original_pos = state_node.attrib["originalpos"]
-                self.__states.append(State(state_name, True, end_state, original_pos))
+                self.__addState(State(state_name, True, end_state, original_pos))
             else:
-                self.__states.append(State(state_name, False, end_state))
+                self.__addState(State(state_name, False, end_state))
         for state_node in root:
             if "name" in state_node.attrib:
                 state_name = state_node.attrib["name"]
@@ -87,6 +95,22 @@ class FiniteStateMachine:
                                                    withName=with_name,
                                                    toPos=to_pos)
 
+    def __addState(self, state: State):
+        """
+        Adds the given state to the machine. The state gets the next integer index and an empty transition list in the
+        transition table.
+
+        PARAMETERS
+        ----------
+        state : State
+            State to add.
+        """
+        state.setIndex(len(self.__states))
+        self.__states.append(state)
+        self.__transition_table.append([])
+        if state.getName() not in self.__state_map:
+            self.__state_map[state.getName()] = state
+
     def isValidTransition(self, transition: str) -> bool:
         """
         The isValidTransition loops through states ArrayList and checks transitions between states. If the actual
@@ -133,10 +157,40 @@ class FiniteStateMachine:
         State
             State if found any, None otherwise.
         """
-        for state in self.__states:
-            if state.getName() == name:
-                return state
-        return None
+        return self.__state_map.get(name)
+
+    def getStateWithIndex(self, index: int) -> State:
+        """
+        Returns the state with the given integer index.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the state.
+
+        RETURNS
+        -------
+        State
+            State with the given index.
+        """
+        return self.__states[index]
+
+    def __isCompiledState(self, state: State) -> bool:
+        """
+        Checks if the given state is one of the states of this machine, so that it has a row in the transition table.
+
+        PARAMETERS
+        ----------
+        state : State
+            State to check.
+
+        RETURNS
+        -------
+        bool
+            True if the state belongs to this machine, false otherwise.
+        """
+        index = state.getIndex()
+        return 0 <= index < len(self.__states) and self.__states[index] is state
 
     def addTransition(self,
                       fromState: State,
@@ -168,7 +222,10 @@ class FiniteStateMachine:
         if fromState in self.__transitions:
             transition_list = self.__transitions[fromState]
         else:
-            transition_list = []
+            if self.__isCompiledState(fromState):
+                transition_list = self.__transition_table[fromState.getIndex()]
+            else:
+                transition_list = []
         transition_list.append(new_transition)
         self.__transitions[fromState] = transition_list
 
@@ -186,6 +243,8 @@ class FiniteStateMachine:
         list
             Transitions at given state.
         """
+        if self.__isCompiledState(state):
+            return self.__transition_table[state.getIndex()]
         if state in self.__transitions:
             return self.__transitions[state]
         else:
@@ -0,0 +1,91 @@
+class FrequencySketch:
+
+    __table: list
+    __mask: int
+    __additions: int
+    __sample_size: int
+
+    DEPTH = 4
+    MAX_COUNT = 15
+    SEEDS = (0x97CB3127, 0xB7E15162, 0x8F1BBCDC, 0xC3A5C85C)
+
+    def __init__(self, width: int):
+        """
+        Constructor of FrequencySketch class. The sketch is a count-min sketch estimating how often each key is
+        accessed with a fixed amount of memory. It has DEPTH rows of small counters, each key increments one counter
+        in each row, and the frequency of a key is the minimum of its counters. When the number of increments reaches
+        ten times the width, all counters are halved, so that the sketch forgets the keys that were frequent long ago.
+
+        PARAMETERS
+        ----------
+        width : int
+            Number of counters in each row. It is rounded up to a power of two.
+        """
+        size = 16
+        while size < width:
+            size = size * 2
+        self.__table = [[0] * size for _ in range(FrequencySketch.DEPTH)]
+        self.__mask = size - 1
+        self.__additions = 0
+        self.__sample_size = 10 * size
+
+    def __indexes(self, key: object) -> list:
+        """
+        Returns the index of the counter of the given key in each row.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to hash.
+
+        RETURNS
+        -------
+        list
+            Index of the counter in each row.
+        """
+        h = hash(key)
+        return [(((h ^ seed) * 0x9E3779B97F4A7C15) >> 23) & self.__mask for seed in FrequencySketch.SEEDS]
+
+    def increment(self, key: object):
+        """
+        Records an access to the given key.
+
+        PARAMETERS
+        ----------
+        key : object
+            Accessed key.
+        """
+        added = False
+        for row, index in zip(self.__table, self.__indexes(key)):
+            if row[index] < FrequencySketch.MAX_COUNT:
+                row[index] = row[index] + 1
+                added = True
+        if added:
+            self.__additions = self.__additions + 1
+            if self.__additions >= self.__sample_size:
+                self.__reset()
+
+    def frequency(self, key: object) -> int:
+        """
+        Returns the estimated number of accesses to the given key.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to estimate.
+
+        RETURNS
+        -------
+        int
+            Estimated frequency of the key, at most MAX_COUNT.
+        """
+        return min(row[index] for row, index in zip(self.__table, self.__indexes(key)))
+
+    def __reset(self):
+        """
+        Halves all counters.
+        """
+        for row in self.__table:
+            for i in range(len(row)):
+                row[i] = row[i] >> 1
+        self.__additions = self.__additions // 2
@@ -0,0 +1,17 @@
+from enum import Enum, auto
+
+
+class FrontierType(Enum):
+
+    """
+    Parses are expanded in the order they are added, the search is breadth first.
+    """
+    BREADTH_FIRST = auto()
+    """
+    The last added parse is expanded first, the search is depth first.
+    """
+    DEPTH_FIRST = auto()
+    """
+    The parse with the longest surface form is expanded first.
+    """
+    LONGEST_SURFACE_FIRST = auto()
@@ -1,67 +1,318 @@
+import collections
 import copy
+import multiprocessing
+import os
 import re
+import threading
+import time
+import weakref
 
-import pkg_resources
 
 from Corpus.Sentence import Sentence
-from DataStructure.Cache.LRUCache import LRUCache
 from Dictionary.Trie.Trie import Trie
 from Dictionary.TxtDictionary import TxtDictionary
 from Dictionary.TxtWord import TxtWord
 from Dictionary.Word import Word
 from Util.FileUtils import FileUtils
 
+from MorphologicalAnalysis.AllomorphResolutionCache import AllomorphResolutionCache
+from MorphologicalAnalysis.AnalysisCache import AnalysisCache
+from MorphologicalAnalysis.AnalyzerCore import AnalyzerCore
 from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
 from MorphologicalAnalysis.FsmParse import FsmParse
 from MorphologicalAnalysis.FsmParseList import FsmParseList
+from MorphologicalAnalysis.FullFormLexicon import FullFormLexicon
+from MorphologicalAnalysis.FrontierType import FrontierType
+from MorphologicalAnalysis.LexiconOverlay import LexiconOverlay
 from MorphologicalAnalysis.MetamorphicParse import MetamorphicParse
 from MorphologicalAnalysis.MorphologicalParse import MorphologicalParse
 from MorphologicalAnalysis.MorphologicalTag import MorphologicalTag
+from MorphologicalAnalysis.NegativeAnalysisCache import NegativeAnalysisCache
+from MorphologicalAnalysis.ParseFrontier import ParseFrontier
+from MorphologicalAnalysis.ParseSerializer import ParseSerializer
+from MorphologicalAnalysis.PartialFsmParse import PartialFsmParse
+from MorphologicalAnalysis.PersistentAnalysisCache import PersistentAnalysisCache
+from MorphologicalAnalysis.SearchGraph import SearchGraph
+from MorphologicalAnalysis.SearchStatistics import SearchStatistics
 from MorphologicalAnalysis.State import State
+from MorphologicalAnalysis.SuffixAutomaton import SuffixAutomaton
+from MorphologicalAnalysis.SuffixTable import SuffixTable
+from MorphologicalAnalysis.SurfaceFormIndex import SurfaceFormIndex
 from MorphologicalAnalysis.Transition import Transition
 
+_worker_analyzer = None
+
+
+def _analyzeInWorker(surfaceForms: list) -> bytes:
+    """
+    Analyzes the given surface forms in a worker process of warmCache or analyzeMany with the analyzer inherited from
+    the parent process.
+
+    PARAMETERS
+    ----------
+    surfaceForms : list
+        Surface forms to analyze.
+
+    RETURNS
+    -------
+    bytes
+        Surface forms and their analyses serialized with a ParseSerializer.
+    """
+    result = []
+    for surface_form in surfaceForms:
+        result.append((surface_form, _worker_analyzer.morphologicalAnalysis(surface_form).toTuple()))
+    serializer = ParseSerializer(_worker_analyzer.getFiniteStateMachine(), _worker_analyzer.getDictionary())
+    return serializer.encode(result)
+
 
 class FsmMorphologicalAnalyzer:
+    __core: AnalyzerCore
     __dictionary_trie: Trie
-    __suffix_trie: Trie
+    __session_overlay: LexiconOverlay
+    __flagged_roots: dict
+    __call: threading.local
+    __lock: threading.Lock
     __finite_state_machine: FiniteStateMachine
     __dictionary: TxtDictionary
-    __cache: LRUCache
+    __cache: AnalysisCache
+    __negative_cache: NegativeAnalysisCache
+    __persistent_cache: PersistentAnalysisCache
+    __roots_guessed: bool
+    __warmed_keys: dict
+    __allomorph_cache: AllomorphResolutionCache
+    __full_form_lexicon: FullFormLexicon
+    __suffix_automaton: SuffixAutomaton
+    __root_variants: dict
+    __search_statistics: SearchStatistics
     __most_used_patterns = {}
     __parsed_surface_forms = None
-    __pronunciations = {}
+    __instances = weakref.WeakSet()
+    __instances_lock = threading.Lock()
+    __forking_instances = []
+    __fork_hooks_registered = False
 
+    DATA_DIRECTORY = AnalyzerCore.DATA_DIRECTORY
     MAX_DISTANCE = 2
+    MAX_ROOT_VARIANTS = 200000
+    SNAPSHOT_MAGIC = "FSMCACHE001"
 
     def __init__(self,
                  dictionaryFileName=None,
                  misspelledFileName=None,
-                 fileName=pkg_resources.resource_filename(__name__, 'data/turkish_finite_state_machine.xml'),
-                 cacheSize=10000000):
+                 fileName=os.path.join(DATA_DIRECTORY, 'turkish_finite_state_machine.xml'),
+                 cacheSize=10000000,
+                 negativeCacheSize=100000,
+                 cacheBytes=None,
+                 core=None):
         """
         Constructor of FsmMorphologicalAnalyzer class. It generates a new TxtDictionary type dictionary from
-        given input dictionary file name and by using turkish_finite_state_machine.xml file.
+        given input dictionary file name and by using turkish_finite_state_machine.xml file. The suffix trie and the
+        pronunciations, which are only used for unknown words, are loaded when they are first needed, see preload.
+
+        The dictionary, the tries and the finite state machine form an AnalyzerCore, which the analyzer does not
+        modify: the roots it adds and the flags it sets while analyzing a surface form are kept in an overlay of that
+        analysis, and the roots added by rootOfPossiblyNewWord in an overlay of the analyzer. Therefore, several
+        analyzers with different caches and settings can share one core given with the core parameter, and one analyzer
+        can be used by several threads at the same time.
 
         PARAMETERS
         ----------
         fileName : str
             the file to read the finite state machine.
         cacheSize : int
-            the size of the LRUCache.
+            the size of the analysis cache.
+        negativeCacheSize : int
+            the maximum number of surface forms without any analysis remembered by the analyzer.
+        cacheBytes : int
+            the memory budget of the analysis cache in bytes. If given, cacheSize is ignored and the analyses are
+            admitted to and evicted from the cache by their frequency.
         dictionaryFileName : str
             the file to read the dictionary.
         misspelledFileName: str
             the file to read the misspelled file name.
+        core : AnalyzerCore
+            the core shared with other analyzers. If given, the dictionary and finite state machine files are not
+            read.
+        """
+        if core is None:
+            core = AnalyzerCore(dictionaryFileName, misspelledFileName, fileName)
+        self.__core = core
+        self.__dictionary = core.getDictionary()
+        self.__finite_state_machine = core.getFiniteStateMachine()
+        self.__dictionary_trie = core.getDictionaryTrie()
+        self.__cache = AnalysisCache(cacheSize, cacheBytes)
+        self.__negative_cache = NegativeAnalysisCache(negativeCacheSize)
+        self.__session_overlay = LexiconOverlay()
+        self.__flagged_roots = {}
+        self.__call = threading.local()
+        self.__lock = threading.Lock()
+        self.__persistent_cache = None
+        self.__roots_guessed = False
+        self.__warmed_keys = {}
+        self.__allomorph_cache = AllomorphResolutionCache()
+        self.__full_form_lexicon = None
+        self.__suffix_automaton = None
+        self.__root_variants = {}
+        self.__search_statistics = None
+        FsmMorphologicalAnalyzer.__registerForForks(self)
+
+    @staticmethod
+    def __registerForForks(analyzer):
+        """
+        Adds the given analyzer to the analyzers whose locks are held while the process forks. The fork hooks are
+        registered with os.register_at_fork when the first analyzer is constructed. Without them, a child forked while
+        another thread holds the lock of an analyzer, for example a worker of analyzeMany, inherits the lock held and
+        deadlocks in its first analysis.
+
+        PARAMETERS
+        ----------
+        analyzer : FsmMorphologicalAnalyzer
+            Analyzer to register.
         """
-        if dictionaryFileName is None:
-            self.__dictionary = TxtDictionary()
-        else:
-            self.__dictionary = TxtDictionary(dictionaryFileName, misspelledFileName)
-        self.__finite_state_machine = FiniteStateMachine(fileName)
-        self.__dictionary_trie = self.__dictionary.prepareTrie()
-        self.prepareSuffixTrie(pkg_resources.resource_filename(__name__, 'data/suffixes.txt'))
-        self.__cache = LRUCache(cacheSize)
-        self.addPronunciations(pkg_resources.resource_filename(__name__, 'data/pronunciations.txt'))
+        with FsmMorphologicalAnalyzer.__instances_lock:
+            if not FsmMorphologicalAnalyzer.__fork_hooks_registered and hasattr(os, "register_at_fork"):
+                os.register_at_fork(before=FsmMorphologicalAnalyzer.__beforeFork,
+                                    after_in_parent=FsmMorphologicalAnalyzer.__afterForkInParent,
+                                    after_in_child=FsmMorphologicalAnalyzer.__afterForkInChild)
+                FsmMorphologicalAnalyzer.__fork_hooks_registered = True
+            FsmMorphologicalAnalyzer.__instances.add(analyzer)
+
+    @staticmethod
+    def __beforeFork():
+        """
+        Acquires the lock of each analyzer and of its session overlay before the process forks, so that no other
+        thread holds them at the moment of the fork. The analyzer lock is acquired before the overlay lock, the same
+        order as in the analysis.
+        """
+        FsmMorphologicalAnalyzer.__instances_lock.acquire()
+        FsmMorphologicalAnalyzer.__forking_instances = list(FsmMorphologicalAnalyzer.__instances)
+        for analyzer in FsmMorphologicalAnalyzer.__forking_instances:
+            analyzer.__lock.acquire()
+            analyzer.__session_overlay.getLock().acquire()
+
+    @staticmethod
+    def __afterForkInParent():
+        """
+        Releases the locks acquired by beforeFork in the parent process.
+        """
+        for analyzer in reversed(FsmMorphologicalAnalyzer.__forking_instances):
+            analyzer.__session_overlay.getLock().release()
+            analyzer.__lock.release()
+        FsmMorphologicalAnalyzer.__forking_instances = []
+        FsmMorphologicalAnalyzer.__instances_lock.release()
+
+    @staticmethod
+    def __afterForkInChild():
+        """
+        Replaces the locks acquired by beforeFork with new ones in the child process, where only the forking thread
+        exists.
+        """
+        for analyzer in FsmMorphologicalAnalyzer.__forking_instances:
+            analyzer.__lock = threading.Lock()
+            analyzer.__session_overlay.resetLock()
+        FsmMorphologicalAnalyzer.__forking_instances = []
+        FsmMorphologicalAnalyzer.__instances_lock = threading.Lock()
+
+    def getCore(self) -> AnalyzerCore:
+        """
+        Getter for the core containing the dictionary, the tries and the finite state machine.
+
+        RETURNS
+        -------
+        AnalyzerCore
+            Core of the analyzer, which can be given to the constructor of other analyzers.
+        """
+        return self.__core
+
+    def preload(self):
+        """
+        Loads the components that are otherwise loaded when they are first needed, that is the suffix trie used by
+        rootOfPossiblyNewWord and the pronunciations of the foreign proper nouns. Services that can not afford the
+        delay during their first requests should call it after constructing the analyzer.
+        """
+        self.__core.preload()
+
+    def saveSnapshot(self, fileName: str):
+        """
+        Writes the core of the analyzer, that is the dictionary, the dictionary and suffix tries, the finite state
+        machine and the pronunciations, to a binary snapshot file. An analyzer loaded from the snapshot with
+        fromSnapshot does not read the xml and text files or insert the words into the tries again. The caches, the
+        roots added while analyzing and the optional components are not written.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the snapshot file.
+        """
+        self.__core.saveSnapshot(fileName)
+
+    @staticmethod
+    def fromSnapshot(fileName: str,
+                     cacheSize=10000000,
+                     negativeCacheSize=100000,
+                     cacheBytes=None):
+        """
+        Creates an analyzer from a snapshot file written with saveSnapshot. Snapshots are read with pickle, so only
+        trusted files should be loaded, see AnalyzerCore.fromSnapshot.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the snapshot file.
+        cacheSize : int
+            the size of the analysis cache.
+        negativeCacheSize : int
+            the maximum number of surface forms without any analysis remembered by the analyzer.
+        cacheBytes : int
+            the memory budget of the analysis cache in bytes.
+
+        RETURNS
+        -------
+        FsmMorphologicalAnalyzer
+            Analyzer with the dictionary, tries and finite state machine of the snapshot.
+        """
+        return FsmMorphologicalAnalyzer(cacheSize=cacheSize, negativeCacheSize=negativeCacheSize,
+                                        cacheBytes=cacheBytes, core=AnalyzerCore.fromSnapshot(fileName))
+
+    def saveMappedLexicon(self, fileName: str):
+        """
+        Writes the dictionary and the dictionary trie of the analyzer to a lexicon file, which can be attached by any
+        number of processes with fromMappedLexicon. The roots added while analyzing are not written.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the lexicon file.
+        """
+        self.__core.saveMappedLexicon(fileName)
+
+    @staticmethod
+    def fromMappedLexicon(source,
+                          cacheSize=10000000,
+                          negativeCacheSize=100000,
+                          cacheBytes=None):
+        """
+        Creates an analyzer whose dictionary and dictionary trie are read from a lexicon file or buffer written with
+        saveMappedLexicon, see AnalyzerCore.fromMappedLexicon.
+
+        PARAMETERS
+        ----------
+        source : str or buffer
+            Name of the lexicon file, or a buffer containing it, such as the buffer of a SharedMemory.
+        cacheSize : int
+            the size of the analysis cache.
+        negativeCacheSize : int
+            the maximum number of surface forms without any analysis remembered by the analyzer.
+        cacheBytes : int
+            the memory budget of the analysis cache in bytes.
+
+        RETURNS
+        -------
+        FsmMorphologicalAnalyzer
+            Analyzer using the mapped lexicon.
+        """
+        return FsmMorphologicalAnalyzer(cacheSize=cacheSize, negativeCacheSize=negativeCacheSize,
+                                        cacheBytes=cacheBytes, core=AnalyzerCore.fromMappedLexicon(source))
 
     def reverseString(self, s: str) -> str:
         """
@@ -78,16 +329,11 @@ class FsmMorphologicalAnalyzer:
         """
         Constructs the suffix trie from the input file suffixes.txt. suffixes.txt contains the most frequent 6000
         suffixes that a verb or a noun can take. The suffix trie is a trie that stores these suffixes in reverse form,
-        which can be then used to match a given word for its possible suffix content.
+        which can be then used to match a given word for its possible suffix content. The suffix trie is stored in the
+        core, so it is replaced for all analyzers sharing the core.
         :param fileName: Name of the file that contains the suffixes
         """
-        self.__suffix_trie = Trie()
-        file = open(fileName, "r")
-        lines = file.readlines()
-        file.close()
-        for suffix in lines:
-            reverse_suffix = self.reverseString(suffix.strip())
-            self.__suffix_trie.addWord(reverse_suffix, Word(reverse_suffix))
+        self.__core.prepareSuffixTrie(fileName)
 
     def addParsedSurfaceForms(self, fileName: str):
         """
@@ -99,10 +345,11 @@ class FsmMorphologicalAnalyzer:
 
     def addPronunciations(self, fileName: str):
         """
-        Reads the file for foreign words and their pronunciations.
+        Reads the file for foreign words and their pronunciations. The pronunciations are stored in the core, so they
+        are replaced for all analyzers sharing the core.
         :param fileName: Input file containing foreign words and their pronunciations.
         """
-        self.__pronunciations = FileUtils.readHashMap(fileName)
+        self.__core.addPronunciations(fileName)
 
     def getPossibleWords(self,
                          morphologicalParse: MorphologicalParse,
@@ -186,6 +433,17 @@ class FsmMorphologicalAnalyzer:
         """
         return self.__dictionary
 
+    def getAllomorphResolutionCache(self) -> AllomorphResolutionCache:
+        """
+        Getter for the allomorph resolution cache used during the search.
+
+        RETURNS
+        -------
+        AllomorphResolutionCache
+            The cache of the resolved suffixes, which also keeps its size and hit rate.
+        """
+        return self.__allomorph_cache
+
     def getFiniteStateMachine(self) -> FiniteStateMachine:
         """
         The getFiniteStateMachine method is used to get FiniteStateMachine.
@@ -216,6 +474,9 @@ class FsmMorphologicalAnalyzer:
         vowelAChangesToIDuringYSuffixation or endingKChangesIntoG then it returns true if the last index is not equal to
         2 and distance is not greater than MAX_DISTANCE and false otherwise.
 
+        Since a mismatch is only allowed in the last two characters of the short string, the common prefix is checked
+        with startswith and only the last two characters are compared one by one.
+
         PARAMETERS
         ----------
         shortString : str
@@ -230,10 +491,15 @@ class FsmMorphologicalAnalyzer:
         bool
             True if given substring is the actual substring of the longString, false otherwise.
         """
+        if longString.startswith(shortString):
+            return True
+        start = max(len(shortString) - 2, 0)
+        if not longString.startswith(shortString[:start]):
+            return False
         root_word = shortString == root.getName() or longString == root.getName()
         distance = 0
         last = 1
-        for j in range(len(shortString)):
+        for j in range(start, len(shortString)):
             if shortString[j] != longString[j]:
                 if j < len(shortString) - 2:
                     return False
@@ -532,9 +798,11 @@ class FsmMorphologicalAnalyzer:
                                       root: TxtWord,
                                       isProper: bool):
         """
-        The initializeParseListFromRoot method is used to create a list which consists of initial fsm parsings. First,
-        traverses this HashSet and uses each word as a root and calls initializeParseList method with this root and
-        list.
+        The initializeParseListFromRoot method is used to create a list which consists of initial fsm parsings. The
+        initial parses of the root and of its variants are computed once with rootVariantParses and stored in the root
+        variant index, the following calls with the same root only append the stored parses to the list. The stored
+        parses are only read during the search, so they can be shared by all analyses. If the flags of the root are
+        changed, its initial parses are computed again.
 
         PARAMETERS
         ----------
@@ -545,31 +813,77 @@ class FsmMorphologicalAnalyzer:
         isProper : bool
             is used to check a word is proper or not.
         """
-        self.__initializeParseList(parseList, root, isProper)
+        key = (id(root), isProper)
+        flags = root.__str__()
+        entry = self.__root_variants.get(key)
+        if entry is None or entry[0] is not root or entry[1] != flags:
+            if self.__search_statistics is not None:
+                self.__search_statistics.increment("root_variant_misses")
+            entry = (root, flags, self.__rootVariantParses(root, isProper))
+            if len(self.__root_variants) < FsmMorphologicalAnalyzer.MAX_ROOT_VARIANTS or key in self.__root_variants:
+                self.__root_variants[key] = entry
+        elif self.__search_statistics is not None:
+            self.__search_statistics.increment("root_variant_hits")
+        parseList.extend(entry[2])
+
+    def __rootVariantParses(self,
+                            root: TxtWord,
+                            isProper: bool) -> tuple:
+        """
+        Traverses the variants of the given root and calls initializeParseList method with each of them. For the roots
+        that both obey and not obey a rule, such as vowel harmony, softening, last vowel drop, duplication or ending k
+        changing into g, a copy of the root without the corresponding flags is added as a variant.
+
+        PARAMETERS
+        ----------
+        root : TxtWord
+            the root form to generate initial parse list.
+        isProper : bool
+            is used to check a word is proper or not.
+
+        RETURNS
+        -------
+        tuple
+            Initial parses of the root and its variants.
+        """
+        parse_list = []
+        self.__initializeParseList(parse_list, root, isProper)
         if root.obeysAndNotObeysVowelHarmonyDuringAgglutination():
-            new_root = copy.deepcopy(root)
-            new_root.removeFlag("IS_UU")
-            new_root.removeFlag("IS_UUU")
-            self.__initializeParseList(parseList, new_root, isProper)
+            self.__initializeParseList(parse_list, self.__rootVariant(root, ["IS_UU", "IS_UUU"]), isProper)
         if root.rootSoftenAndNotSoftenDuringSuffixation():
-            new_root = copy.deepcopy(root)
-            new_root.removeFlag("IS_SD")
-            new_root.removeFlag("IS_SDD")
-            self.__initializeParseList(parseList, new_root, isProper)
+            self.__initializeParseList(parse_list, self.__rootVariant(root, ["IS_SD", "IS_SDD"]), isProper)
         if root.lastIDropsAndNotDropDuringSuffixation():
-            new_root = copy.deepcopy(root)
-            new_root.removeFlag("IS_UD")
-            new_root.removeFlag("IS_UDD")
-            self.__initializeParseList(parseList, new_root, isProper)
+            self.__initializeParseList(parse_list, self.__rootVariant(root, ["IS_UD", "IS_UDD"]), isProper)
         if root.duplicatesAndNotDuplicatesDuringSuffixation():
-            new_root = copy.deepcopy(root)
-            new_root.removeFlag("IS_ST")
-            new_root.removeFlag("IS_STT")
-            self.__initializeParseList(parseList, new_root, isProper)
+            self.__initializeParseList(parse_list, self.__rootVariant(root, ["IS_ST", "IS_STT"]), isProper)
         if root.endingKChangesIntoG() and root.containsFlag("IS_OA"):
-            new_root = copy.deepcopy(root)
-            new_root.removeFlag("IS_OA")
-            self.__initializeParseList(parseList, new_root, isProper)
+            self.__initializeParseList(parse_list, self.__rootVariant(root, ["IS_OA"]), isProper)
+        return tuple(parse_list)
+
+    def __rootVariant(self,
+                      root: TxtWord,
+                      flags: list) -> TxtWord:
+        """
+        Returns a copy of the given root without the given flags.
+
+        PARAMETERS
+        ----------
+        root : TxtWord
+            Root to copy.
+        flags : list
+            Flags to remove from the copy.
+
+        RETURNS
+        -------
+        TxtWord
+            Copy of the root without the flags.
+        """
+        if self.__search_statistics is not None:
+            self.__search_statistics.increment("deep_copies")
+        new_root = copy.deepcopy(root)
+        for flag in flags:
+            new_root.removeFlag(flag)
+        return new_root
 
     def __initializeParseListFromSurfaceForm(self,
                                              surfaceForm: str,
@@ -595,35 +909,66 @@ class FsmMorphologicalAnalyzer:
         initial_fsm_parse = []
         if len(surfaceForm) == 0:
             return initial_fsm_parse
-        words = self.__dictionary_trie.getWordsWithPrefix(surfaceForm)
+        words = self.__wordsWithPrefix(surfaceForm)
         for word in words:
             self.__initializeParseListFromRoot(initial_fsm_parse, word, isProper)
         return initial_fsm_parse
 
+    def __wordsWithPrefix(self, surfaceForm: str) -> set:
+        """
+        Returns the roots stored in the trie under the prefixes of the given surface form. The roots added by the
+        current analysis and by rootOfPossiblyNewWord, and the copies of the dictionary roots whose flags are changed
+        by the current analysis, are taken from the overlays, since the shared dictionary trie is not modified.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to search.
+
+        RETURNS
+        -------
+        set
+            Possible roots of the surface form.
+        """
+        overlay = getattr(self.__call, "overlay", None)
+        if overlay is None:
+            overlay = self.__session_overlay
+            if overlay.isEmpty():
+                return self.__dictionary_trie.getWordsWithPrefix(surfaceForm)
+        return overlay.getWordsWithPrefix(self.__dictionary_trie, surfaceForm)
+
     def __addNewParsesFromCurrentParse(self,
-                                       currentFsmParse: FsmParse,
-                                       fsmParse: list,
+                                       currentFsmParse: PartialFsmParse,
+                                       fsmParse: ParseFrontier,
                                        maxLengthOrSurfaceForm,
-                                       root: TxtWord):
+                                       root: TxtWord,
+                                       searchGraph: SearchGraph):
         """
         The addNewParsesFromCurrentParseSurfaceForm method initially gets the final suffixes from input currentFsmParse
         called as currentState, and by using the currentState information it gets the currentSurfaceForm. Then loops
         through each currentState's transition. If the currentTransition is possible, it makes the transition.
         The addNewParsesFromCurrentParseMaxLength method initially gets the final suffixes from input currentFsmParse
         called as currentState, and by using the currentState information it gets the new analysis. Then loops through
-        each currentState's transition. If the currentTransition is possible, it makes the transition.
+        each currentState's transition. If the currentTransition is possible, it makes the transition. The new parses
+        share the root and the previous suffixes with currentFsmParse, so no copy of the parse is made. A new parse is
+        only added to the frontier if the search graph does not contain an equivalent parse.
 
         PARAMETERS
         ----------
-        currentFsmParse : FsmParse
-            FsmParse type input.
-        fsmParse : list
-            List of FsmParse.
+        currentFsmParse : PartialFsmParse
+            PartialFsmParse type input.
+        fsmParse : ParseFrontier
+            Frontier of the search, the new parses are added to it.
         maxLengthOrSurfaceForm
-            Maximum length of the parse.
+            Maximum length of the parse, or the SurfaceFormIndex of the surface form to be parsed.
         root : TxtWord
             TxtWord used to make transition.
+        searchGraph : SearchGraph
+            Search graph merging the equivalent parses.
         """
+        if self.__search_statistics is not None:
+            self.__addNewParsesWithStatistics(currentFsmParse, fsmParse, maxLengthOrSurfaceForm, root, searchGraph)
+            return
         current_state = currentFsmParse.getFinalSuffix()
         current_surface_form = currentFsmParse.getSurfaceForm()
         if isinstance(maxLengthOrSurfaceForm, int):
@@ -633,36 +978,170 @@ class FsmMorphologicalAnalyzer:
                         and (current_surface_form != root.getName()
                              or (current_surface_form == root.getName() and
                                  current_transition.transitionPossibleForWord(root, current_state))):
-                    tmp = current_transition.makeTransition(root, current_surface_form, currentFsmParse.getStartState())
+                    tmp = self.__allomorph_cache.makeTransition(current_transition, root, current_surface_form,
+                                                                currentFsmParse.getStartState(),
+                                                                currentFsmParse.getRootSignature())
                     if len(tmp) <= max_length:
-                        new_fsm_parse = copy.deepcopy(currentFsmParse)
-                        new_fsm_parse.addSuffix(current_transition.toState(), tmp, current_transition.withName(),
-                                              current_transition.__str__(), current_transition.toPos())
-                        new_fsm_parse.setAgreement(current_transition.withName())
-                        fsmParse.append(new_fsm_parse)
-        elif isinstance(maxLengthOrSurfaceForm, str):
-            surface_form = maxLengthOrSurfaceForm
+                        new_fsm_parse = currentFsmParse.addSuffix(current_transition.toState(), tmp,
+                                                                  current_transition.withName(),
+                                                                  current_transition.__str__(),
+                                                                  current_transition.toPos())
+                        if searchGraph.add(new_fsm_parse):
+                            fsmParse.add(new_fsm_parse)
+        elif isinstance(maxLengthOrSurfaceForm, SurfaceFormIndex):
+            surface_form_index = maxLengthOrSurfaceForm
+            surface_form = surface_form_index.getSurfaceForm()
             for current_transition in self.__finite_state_machine.getTransitions(current_state):
-                if current_transition.transitionPossibleForString(currentFsmParse.getSurfaceForm(), surface_form) and \
+                if current_transition.transitionPossibleForSurfaceFormIndex(current_surface_form, surface_form_index) \
+                        and \
                         current_transition.transitionPossibleForParse(currentFsmParse) and (
                         current_surface_form != root.getName()
                         or (current_surface_form == root.getName() and
                             current_transition.transitionPossibleForWord(root, current_state))):
-                    tmp = current_transition.makeTransition(root, current_surface_form, currentFsmParse.getStartState())
+                    tmp = self.__allomorph_cache.makeTransition(current_transition, root, current_surface_form,
+                                                                currentFsmParse.getStartState(),
+                                                                currentFsmParse.getRootSignature())
                     if (len(tmp) < len(surface_form) and self.__isPossibleSubstring(tmp, surface_form, root)) or \
                             (len(tmp) == len(surface_form) and (
                                     root.lastIdropsDuringSuffixation() or tmp == surface_form)):
-                        new_fsm_parse = copy.deepcopy(currentFsmParse)
-                        new_fsm_parse.addSuffix(current_transition.toState(), tmp, current_transition.withName(),
-                                              current_transition.__str__(), current_transition.toPos())
-                        new_fsm_parse.setAgreement(current_transition.withName())
-                        fsmParse.append(new_fsm_parse)
+                        new_fsm_parse = currentFsmParse.addSuffix(current_transition.toState(), tmp,
+                                                                  current_transition.withName(),
+                                                                  current_transition.__str__(),
+                                                                  current_transition.toPos())
+                        if searchGraph.add(new_fsm_parse):
+                            fsmParse.add(new_fsm_parse)
+
+    def __addNewParsesWithStatistics(self,
+                                     currentFsmParse: PartialFsmParse,
+                                     fsmParse: ParseFrontier,
+                                     maxLengthOrSurfaceForm,
+                                     root: TxtWord,
+                                     searchGraph: SearchGraph):
+        """
+        Same as addNewParsesFromCurrentParse, but each check of a transition is made separately, so that the search
+        statistics can count the transitions tried, the check rejecting each transition, the calls to makeTransition,
+        the merged states and the parses added to the frontier. If state timing is enabled, the time spent is added to
+        the current state.
+
+        PARAMETERS
+        ----------
+        currentFsmParse : PartialFsmParse
+            PartialFsmParse type input.
+        fsmParse : ParseFrontier
+            Frontier of the search, the new parses are added to it.
+        maxLengthOrSurfaceForm
+            Maximum length of the parse, or the SurfaceFormIndex of the surface form to be parsed.
+        root : TxtWord
+            TxtWord used to make transition.
+        searchGraph : SearchGraph
+            Search graph merging the equivalent parses.
+        """
+        statistics = self.__search_statistics
+        if statistics.isStateTiming():
+            start_time = time.perf_counter()
+        statistics.increment("frontier_pops")
+        current_state = currentFsmParse.getFinalSuffix()
+        current_surface_form = currentFsmParse.getSurfaceForm()
+        surface_form_index = None
+        if isinstance(maxLengthOrSurfaceForm, SurfaceFormIndex):
+            surface_form_index = maxLengthOrSurfaceForm
+        for current_transition in self.__finite_state_machine.getTransitions(current_state):
+            statistics.increment("transitions_tried")
+            if surface_form_index is not None and \
+                    not current_transition.transitionPossibleForSurfaceFormIndex(current_surface_form,
+                                                                                 surface_form_index):
+                statistics.increment("rejected_by_surface_form")
+                continue
+            if not current_transition.transitionPossibleForParse(currentFsmParse):
+                statistics.increment("rejected_by_parse")
+                continue
+            if current_surface_form == root.getName() and \
+                    not current_transition.transitionPossibleForWord(root, current_state):
+                statistics.increment("rejected_by_word")
+                continue
+            statistics.increment("make_transition_calls")
+            tmp = self.__allomorph_cache.makeTransition(current_transition, root, current_surface_form,
+                                                        currentFsmParse.getStartState(),
+                                                        currentFsmParse.getRootSignature())
+            if surface_form_index is None:
+                possible = len(tmp) <= maxLengthOrSurfaceForm
+            else:
+                surface_form = surface_form_index.getSurfaceForm()
+                possible = (len(tmp) < len(surface_form) and self.__isPossibleSubstring(tmp, surface_form, root)) or \
+                    (len(tmp) == len(surface_form) and (root.lastIdropsDuringSuffixation() or tmp == surface_form))
+            if not possible:
+                statistics.increment("rejected_by_length")
+                continue
+            new_fsm_parse = currentFsmParse.addSuffix(current_transition.toState(), tmp,
+                                                      current_transition.withName(),
+                                                      current_transition.__str__(),
+                                                      current_transition.toPos())
+            if searchGraph.add(new_fsm_parse):
+                statistics.increment("frontier_pushes")
+                fsmParse.add(new_fsm_parse)
+            else:
+                statistics.increment("merged_states")
+        if statistics.isStateTiming():
+            statistics.addStateTime(current_state.getName(), time.perf_counter() - start_time)
+
+    def __initialPartialParses(self, fsmParse: list) -> list:
+        """
+        Converts the initial parses to the initial nodes of the search. The root signature used by the allomorph
+        resolution cache is computed once for each root and shared by all nodes of that root.
+
+        PARAMETERS
+        ----------
+        fsmParse : list
+            List of initial FsmParse.
+
+        RETURNS
+        -------
+        list
+            List of initial PartialFsmParse.
+        """
+        signatures = {}
+        result = []
+        for parse in fsmParse:
+            root = parse.getWord()
+            if id(root) not in signatures:
+                signatures[id(root)] = AllomorphResolutionCache.rootSignature(root)
+            result.append(PartialFsmParse.fromFsmParse(parse, signatures[id(root)]))
+        return result
+
+    def __initialFrontier(self,
+                          fsmParse: list,
+                          frontierType: FrontierType) -> tuple:
+        """
+        Constructs the frontier and the search graph of a search from the initial parses.
+
+        PARAMETERS
+        ----------
+        fsmParse : list
+            List of initial FsmParse.
+        frontierType : FrontierType
+            Order in which the parses are expanded.
+
+        RETURNS
+        -------
+        tuple
+            Frontier containing the initial nodes and the search graph of the search.
+        """
+        frontier = ParseFrontier(frontierType)
+        search_graph = SearchGraph()
+        for parse in self.__initialPartialParses(fsmParse):
+            if search_graph.add(parse):
+                frontier.add(parse)
+        if self.__search_statistics is not None:
+            self.__search_statistics.increment("frontier_pushes", frontier.size())
+        return frontier, search_graph
 
     def __parseExists(self,
                       fsmParse: list,
-                      surfaceForm: str) -> bool:
+                      surfaceForm: str,
+                      frontierType=FrontierType.DEPTH_FIRST) -> bool:
         """
-        The parseExists method is used to check the existence of the parse.
+        The parseExists method is used to check the existence of the parse. Since the first accepting parse is enough,
+        the search is depth first by default.
 
         PARAMETERS
         ----------
@@ -670,79 +1149,124 @@ class FsmMorphologicalAnalyzer:
             List of FsmParse
         surfaceForm : str
             String to use during transition.
+        frontierType : FrontierType
+            Order in which the parses are expanded.
 
         RETURNS
         -------
         bool
             True when the currentState is end state and input surfaceForm id equal to currentSurfaceForm, otherwise false.
         """
-        while len(fsmParse) > 0:
-            current_fsm_parse = fsmParse.pop(0)
+        fsm_parse, search_graph = self.__initialFrontier(fsmParse, frontierType)
+        surface_form_index = SurfaceFormIndex(surfaceForm)
+        while not fsm_parse.isEmpty():
+            current_fsm_parse = fsm_parse.remove()
             root = current_fsm_parse.getWord()
             current_state = current_fsm_parse.getFinalSuffix()
             current_surface_form = current_fsm_parse.getSurfaceForm()
             if current_state.isEndState() and current_surface_form == surfaceForm:
                 return True
-            self.__addNewParsesFromCurrentParse(current_fsm_parse, fsmParse, surfaceForm, root)
+            self.__addNewParsesFromCurrentParse(current_fsm_parse, fsm_parse, surface_form_index, root, search_graph)
         return False
 
     def __parseWord(self,
                     fsmParse: list,
-                    maxLengthOrSurfaceForm) -> list:
+                    maxLengthOrSurfaceForm,
+                    frontierType=FrontierType.BREADTH_FIRST) -> list:
+        """
+        The parseWord method is used to parse a given fsmParse. It returns the FsmParse objects of the paths found by
+        parsePaths.
+
+        PARAMETERS
+        ----------
+        fsmParse : list
+            a list of FsmParse
+        maxLengthOrSurfaceForm
+            maximum length of the surfaceform.
+        frontierType : FrontierType
+            Order in which the parses are expanded.
+
+        RETURNS
+        -------
+        list
+            Result list which has the currentFsmParse.
+        """
+        return [parse for path, parse in self.__parsePaths(fsmParse, maxLengthOrSurfaceForm, frontierType)]
+
+    def __parsePaths(self,
+                     fsmParse: list,
+                     maxLengthOrSurfaceForm,
+                     frontierType=FrontierType.BREADTH_FIRST) -> list:
         """
         The parseWordSurfaceForm method is used to parse a given fsmParse. It simply adds new parses to the current
         parse by using addNewParsesFromCurrentParse method.
         The parseWordMaxLength method is used to parse a given fsmParse. It simply adds new parses to the current parse
         by using addNewParsesFromCurrentParse method.
 
+        During the search, parses are represented as PartialFsmParse nodes sharing their common prefixes, full FsmParse
+        objects are only constructed for the accepted parses. Parses reaching the same state with the same surface form
+        from the same root are expanded only once, the other paths reaching them are enumerated again at the end.
+
         PARAMETERS
         ----------
         fsmParse : list
             a list of FsmParse
         maxLengthOrSurfaceForm
             maximum length of the surfaceform.
+        frontierType : FrontierType
+            Order in which the parses are expanded.
 
         RETURNS
         -------
         list
-            Result list which has the currentFsmParse.
+            List of (PartialFsmParse, FsmParse) tuples, one for each distinct analysis.
         """
-        result = []
-        result_transition_list = []
+        fsm_parse, search_graph = self.__initialFrontier(fsmParse, frontierType)
+        accepted = []
         if isinstance(maxLengthOrSurfaceForm, int):
             max_length = maxLengthOrSurfaceForm
-            while len(fsmParse) > 0:
-                current_fsm_parse = fsmParse.pop(0)
+            while not fsm_parse.isEmpty():
+                current_fsm_parse = fsm_parse.remove()
                 root = current_fsm_parse.getWord()
                 current_state = current_fsm_parse.getFinalSuffix()
                 current_surface_form = current_fsm_parse.getSurfaceForm()
                 if current_state.isEndState() and len(current_surface_form) <= max_length:
-                    current_transition_list = current_surface_form + " " + current_fsm_parse.transitionList()
-                    if current_transition_list not in result_transition_list:
-                        result.append(current_fsm_parse)
-                        current_fsm_parse.constructInflectionalGroups()
-                        result_transition_list.append(current_transition_list)
-                self.__addNewParsesFromCurrentParse(current_fsm_parse, fsmParse, max_length, root)
+                    accepted.append(current_fsm_parse)
+                self.__addNewParsesFromCurrentParse(current_fsm_parse, fsm_parse, max_length, root, search_graph)
         elif isinstance(maxLengthOrSurfaceForm, str):
             surface_form = maxLengthOrSurfaceForm
-            while len(fsmParse) > 0:
-                current_fsm_parse = fsmParse.pop(0)
+            surface_form_index = SurfaceFormIndex(surface_form)
+            while not fsm_parse.isEmpty():
+                current_fsm_parse = fsm_parse.remove()
                 root = current_fsm_parse.getWord()
                 current_state = current_fsm_parse.getFinalSuffix()
                 current_surface_form = current_fsm_parse.getSurfaceForm()
                 if current_state.isEndState() and current_surface_form == surface_form:
-                    current_transition_list = current_fsm_parse.transitionList()
-                    if current_transition_list not in result_transition_list:
-                        result.append(current_fsm_parse)
-                        current_fsm_parse.constructInflectionalGroups()
-                        result_transition_list.append(current_transition_list)
-                self.__addNewParsesFromCurrentParse(current_fsm_parse, fsmParse, surface_form, root)
+                    accepted.append(current_fsm_parse)
+                self.__addNewParsesFromCurrentParse(current_fsm_parse, fsm_parse, surface_form_index, root,
+                                                    search_graph)
+        if self.__search_statistics is not None:
+            self.__search_statistics.increment("accepted_parses", len(accepted))
+        result = []
+        result_transition_list = set()
+        for accepted_fsm_parse in accepted:
+            for path in search_graph.paths(accepted_fsm_parse):
+                new_fsm_parse = path.toFsmParse()
+                if isinstance(maxLengthOrSurfaceForm, int):
+                    current_transition_list = path.getSurfaceForm() + " " + new_fsm_parse.transitionList()
+                else:
+                    current_transition_list = new_fsm_parse.transitionList()
+                if current_transition_list not in result_transition_list:
+                    result.append((path, new_fsm_parse))
+                    new_fsm_parse.constructInflectionalGroups()
+                    result_transition_list.add(current_transition_list)
         return result
 
     def morphologicalAnalysisRoot(self,
                                   surfaceForm: str,
                                   root: TxtWord,
-                                  state=None) -> list:
+                                  state=None,
+                                  frontierType=FrontierType.BREADTH_FIRST) -> list:
         """
         The morphologicalAnalysis with 3 inputs is used to initialize an {@link ArrayList} and add a new FsmParse
         with given root and state.
@@ -755,6 +1279,8 @@ class FsmMorphologicalAnalyzer:
             String input to use for parsing.
         state : str
             String input.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search.
 
         RETURNS
         -------
@@ -766,11 +1292,12 @@ class FsmMorphologicalAnalyzer:
             self.__initializeParseListFromRoot(initial_fsm_parse, root, self.isProperNoun(surfaceForm))
         else:
             initial_fsm_parse = [FsmParse(root, self.__finite_state_machine.getState(state))]
-        return self.__parseWord(initial_fsm_parse, surfaceForm)
+        return self.__parseWord(initial_fsm_parse, surfaceForm, frontierType)
 
     def generateAllParses(self,
                           root: TxtWord,
-                          maxLength: int) -> list:
+                          maxLength: int,
+                          frontierType=FrontierType.BREADTH_FIRST) -> list:
         """
         The generateAllParses with 2 inputs is used to generate all parses with given root. Then it calls
         initializeParseListFromRoot method to initialize list with newly created ArrayList, input root, and maximum
@@ -782,6 +1309,8 @@ class FsmMorphologicalAnalyzer:
             TxtWord input.
         maxLength : int
             Maximum length of the surface form.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search.
 
         RETURNS
         -------
@@ -792,7 +1321,236 @@ class FsmMorphologicalAnalyzer:
         if root.isProperNoun():
             self.__initializeParseListFromRoot(initial_fsm_parse, root, True)
         self.__initializeParseListFromRoot(initial_fsm_parse, root, False)
-        return self.__parseWord(initial_fsm_parse, maxLength)
+        return self.__parseWord(initial_fsm_parse, maxLength, frontierType)
+
+    def buildFullFormLexicon(self,
+                             fileName: str,
+                             maxLength: int,
+                             roots=None):
+        """
+        Builds a full form lexicon file. First, all surface forms of the roots up to the given length are generated
+        with generateAllParses. Then each surface form is analyzed with the finite state machine both as a proper noun
+        and as a lowercase word, and the analyses are written to the lexicon file. A lexicon can be used with
+        loadFullFormLexicon.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the lexicon file to write.
+        maxLength : int
+            Maximum length of the generated surface forms.
+        roots : list
+            Roots whose surface forms will be generated. If None, all words in the dictionary are used.
+        """
+        if roots is None:
+            roots = [self.__dictionary.getWordWithIndex(i) for i in range(self.__dictionary.size())]
+        surface_forms = set()
+        for root in roots:
+            for fsm_parse in self.generateAllParses(root, maxLength):
+                surface_forms.add(fsm_parse.getSurfaceForm())
+        entries = {}
+        for surface_form in surface_forms:
+            proper_paths = self.__parsePaths(self.__initializeParseListFromSurfaceForm(surface_form, True),
+                                             surface_form)
+            paths = self.__parsePaths(self.__initializeParseListFromSurfaceForm(surface_form, False), surface_form)
+            not_proper = {}
+            for path, fsm_parse in paths:
+                not_proper[fsm_parse.transitionList() + " " + fsm_parse.withList()] = path
+            parses = []
+            for path, fsm_parse in proper_paths:
+                key = fsm_parse.transitionList() + " " + fsm_parse.withList()
+                if key in not_proper:
+                    parses.append((FullFormLexicon.PROPER_AND_NOT_PROPER, path))
+                    not_proper.pop(key)
+                else:
+                    parses.append((FullFormLexicon.ONLY_PROPER, path))
+            for path in not_proper.values():
+                parses.append((FullFormLexicon.ONLY_NOT_PROPER, path))
+            if len(parses) > 0:
+                entries[surface_form] = FullFormLexicon.encodeParses(parses)
+        known_roots = set()
+        for i in range(self.__dictionary.size()):
+            known_roots.add(FullFormLexicon.rootKey(self.__dictionary.getWordWithIndex(i)))
+        FullFormLexicon.write(fileName, entries, known_roots, maxLength)
+
+    def loadFullFormLexicon(self, fileName: str):
+        """
+        Loads a full form lexicon created with buildFullFormLexicon. After loading, the analyses of the surface forms in
+        the lexicon are read from the lexicon, the other surface forms are still analyzed with the finite state machine.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the lexicon file.
+        """
+        if self.__full_form_lexicon is not None:
+            self.__full_form_lexicon.close()
+        self.__full_form_lexicon = FullFormLexicon(fileName)
+
+    def getFullFormLexicon(self) -> FullFormLexicon:
+        """
+        Getter for the full form lexicon.
+
+        RETURNS
+        -------
+        FullFormLexicon
+            The loaded full form lexicon, None if no lexicon is loaded.
+        """
+        return self.__full_form_lexicon
+
+    def enableSuffixAutomaton(self, maxSuffixLength=7):
+        """
+        Enables the analysis with a suffix automaton. After enabling, the suffix sequences of each class of roots are
+        compiled once into a SuffixTable, and the analyses of a surface form are found by looking up the part of the
+        surface form after the root in the tables of its roots. The surface forms that add more than maxSuffixLength
+        characters to a root are still analyzed with the finite state machine.
+
+        PARAMETERS
+        ----------
+        maxSuffixLength : int
+            Maximum number of characters added to a root by the compiled suffix sequences.
+        """
+        self.__suffix_automaton = SuffixAutomaton(maxSuffixLength)
+
+    def compileSuffixAutomaton(self, roots=None):
+        """
+        Compiles the suffix tables of the classes of the given roots in advance, so that the analyses do not wait for
+        the compilation of a table. The suffix automaton is enabled with the default suffix length if it is not enabled.
+
+        PARAMETERS
+        ----------
+        roots : list
+            Roots whose tables will be compiled. If None, all words in the dictionary are used.
+        """
+        if self.__suffix_automaton is None:
+            self.enableSuffixAutomaton()
+        if roots is None:
+            roots = [self.__dictionary.getWordWithIndex(i) for i in range(self.__dictionary.size())]
+        for root in roots:
+            initial_fsm_parse = []
+            self.__initializeParseListFromRoot(initial_fsm_parse, root, True)
+            self.__initializeParseListFromRoot(initial_fsm_parse, root, False)
+            for parse in self.__initialPartialParses(initial_fsm_parse):
+                self.__suffixTable(parse)
+
+    def getSuffixAutomaton(self) -> SuffixAutomaton:
+        """
+        Getter for the suffix automaton.
+
+        RETURNS
+        -------
+        SuffixAutomaton
+            The suffix automaton, None if it is not enabled.
+        """
+        return self.__suffix_automaton
+
+    def enableSearchStatistics(self, stateTiming=False):
+        """
+        Enables the search statistics. After enabling, the work done for each surface form analyzed with
+        morphologicalAnalysis is counted, see SearchStatistics. The statistics of the last word and the total
+        statistics can be read with getSearchStatistics. When the statistics are disabled, the search does not count
+        anything. Since the statistics are kept for the current word, they should only be enabled while the analyzer
+        is used by a single thread.
+
+        PARAMETERS
+        ----------
+        stateTiming : bool
+            If True, the time spent while expanding the parses of each state is also accumulated.
+        """
+        self.__search_statistics = SearchStatistics(stateTiming)
+
+    def disableSearchStatistics(self):
+        """
+        Disables the search statistics.
+        """
+        self.__search_statistics = None
+
+    def getSearchStatistics(self) -> SearchStatistics:
+        """
+        Getter for the search statistics.
+
+        RETURNS
+        -------
+        SearchStatistics
+            The search statistics, None if they are not enabled.
+        """
+        return self.__search_statistics
+
+    def __suffixTable(self, initialParse: PartialFsmParse) -> SuffixTable:
+        """
+        Returns the suffix table of the class of the given initial parse. If the table is not compiled yet, all
+        accepted paths of the root of the initial parse up to the maximum suffix length are found with the finite state
+        machine and compiled into a table.
+
+        PARAMETERS
+        ----------
+        initialParse : PartialFsmParse
+            Initial node containing the root and the start state.
+
+        RETURNS
+        -------
+        SuffixTable
+            Suffix table of the class.
+        """
+        root = initialParse.getWord()
+        key = SuffixAutomaton.classKey(root, initialParse.getStartState(), initialParse.getRootSignature())
+        table = self.__suffix_automaton.getTable(key)
+        if table is None:
+            max_length = len(initialParse.getSurfaceForm()) + self.__suffix_automaton.getMaxSuffixLength()
+            paths = self.__parsePaths([FsmParse(root, initialParse.getStartState())], max_length)
+            table = SuffixTable(root, [path for path, parse in paths])
+            self.__suffix_automaton.addTable(key, table)
+        return table
+
+    def __parseWordWithSuffixAutomaton(self,
+                                       fsmParse: list,
+                                       surfaceForm: str,
+                                       frontierType=FrontierType.BREADTH_FIRST) -> list:
+        """
+        Finds the analyses of the given surface form using the suffix tables of the initial parses. The initial parses
+        whose suffix is longer than the maximum suffix length, or whose table can not be shared by the roots of its
+        class, are parsed with the finite state machine.
+
+        PARAMETERS
+        ----------
+        fsmParse : list
+            a list of initial FsmParse
+        surfaceForm : str
+            Surface form to analyze.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search with the finite state machine.
+
+        RETURNS
+        -------
+        list
+            Result list which has the analyses of the surface form.
+        """
+        max_suffix_length = self.__suffix_automaton.getMaxSuffixLength()
+        remaining = []
+        result = []
+        result_transition_list = set()
+        for parse, initial_parse in zip(fsmParse, self.__initialPartialParses(fsmParse)):
+            if len(surfaceForm) - len(initial_parse.getSurfaceForm()) > max_suffix_length:
+                remaining.append(parse)
+                continue
+            table = self.__suffixTable(initial_parse)
+            if not table.isTransferable():
+                remaining.append(parse)
+                continue
+            for path in table.paths(initial_parse, surfaceForm):
+                new_fsm_parse = path.toFsmParse()
+                current_transition_list = new_fsm_parse.transitionList()
+                if current_transition_list not in result_transition_list:
+                    result.append(new_fsm_parse)
+                    new_fsm_parse.constructInflectionalGroups()
+                    result_transition_list.add(current_transition_list)
+        if len(remaining) > 0:
+            for new_fsm_parse in self.__parseWord(remaining, surfaceForm, frontierType):
+                current_transition_list = new_fsm_parse.transitionList()
+                if current_transition_list not in result_transition_list:
+                    result.append(new_fsm_parse)
+                    result_transition_list.add(current_transition_list)
+        return result
 
     def replaceRootWord(self,
                         parse: FsmParse,
@@ -879,7 +1637,8 @@ class FsmMorphologicalAnalyzer:
     def __analysisExists(self,
                          rootWord: TxtWord,
                          surfaceForm: str,
-                         isProper: bool) -> bool:
+                         isProper: bool,
+                         frontierType=FrontierType.DEPTH_FIRST) -> bool:
         """
         The analysisExists method checks several cases. If the given surfaceForm is a punctuation or double then it
         returns true. If it is not a root word, then it initializes the parse list and returns the parseExists method with
@@ -893,6 +1652,8 @@ class FsmMorphologicalAnalyzer:
             String input.
         isProper : bool
             boolean variable indicates a word is proper or not.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search.
 
         RETURNS
         -------
@@ -908,11 +1669,12 @@ class FsmMorphologicalAnalyzer:
             self.__initializeParseListFromRoot(initial_fsm_parse, rootWord, isProper)
         else:
             initial_fsm_parse = self.__initializeParseListFromSurfaceForm(surfaceForm, isProper)
-        return self.__parseExists(initial_fsm_parse, surfaceForm)
+        return self.__parseExists(initial_fsm_parse, surfaceForm, frontierType)
 
     def __analysis(self,
                    surfaceForm: str,
-                   isProper: bool) -> list:
+                   isProper: bool,
+                   frontierType=FrontierType.BREADTH_FIRST) -> list:
         """
         The analysis method is used by the morphologicalAnalysis method. It gets String surfaceForm as an input and
         checks its type such as punctuation, number or compares with the regex for date, fraction, percent, time, range,
@@ -925,6 +1687,8 @@ class FsmMorphologicalAnalyzer:
             String to analyse.
         isProper : bool
             is used to indicate the proper words.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search.
 
         RETURNS
         -------
@@ -1013,8 +1777,16 @@ class FsmMorphologicalAnalyzer:
             fsm_parse.constructInflectionalGroups()
             initial_fsm_parse.append(fsm_parse)
             return initial_fsm_parse
+        if self.__full_form_lexicon is not None and len(surfaceForm) > 0:
+            fsm_parse = self.__full_form_lexicon.lookup(surfaceForm, isProper,
+                                                        self.__wordsWithPrefix(surfaceForm),
+                                                        self.__finite_state_machine)
+            if fsm_parse is not None:
+                return fsm_parse
         initial_fsm_parse = self.__initializeParseListFromSurfaceForm(surfaceForm, isProper)
-        return self.__parseWord(initial_fsm_parse, surfaceForm)
+        if self.__suffix_automaton is not None:
+            return self.__parseWordWithSuffixAutomaton(initial_fsm_parse, surfaceForm, frontierType)
+        return self.__parseWord(initial_fsm_parse, surfaceForm, frontierType)
 
     def patternMatches(self,
                        expr: str,
@@ -1035,6 +1807,23 @@ class FsmMorphologicalAnalyzer:
             self.__most_used_patterns[expr] = compiled_expression
             return compiled_expression.fullmatch(value) is not None
 
+    def cacheKey(self, surfaceForm: str) -> tuple:
+        """
+        Returns the key under which the analyses of the given surface form are cached. Surface forms with the same key,
+        such as the same word written with different capital letters after its first letter, have the same analyses.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to analyse.
+
+        RETURNS
+        -------
+        tuple
+            Key of the surface form, see AnalysisCache.normalizedKey.
+        """
+        return AnalysisCache.normalizedKey(surfaceForm, self.__toLower(surfaceForm), self.isProperNoun(surfaceForm))
+
     def isProperNoun(self, surfaceForm: str) -> bool:
         """
         The isProperNoun method takes surfaceForm String as input and checks its each char whether they are in the range
@@ -1105,7 +1894,9 @@ class FsmMorphologicalAnalyzer:
         return self.patternMatches("(\\d\\d|\\d)/(\\d\\d|\\d)/\\d+", surfaceForm) or \
                self.patternMatches("(\\d\\d|\\d)\\.(\\d\\d|\\d)\\.\\d+", surfaceForm)
 
-    def morphologicalAnalysis(self, sentenceOrSurfaceForm):
+    def morphologicalAnalysis(self,
+                              sentenceOrSurfaceForm,
+                              frontierType=FrontierType.BREADTH_FIRST):
         """
         The morphologicalAnalysis method is used to analyse a FsmParseList by comparing with the regex.
         It creates a list fsmParse to hold the result of the analysis method. For each surfaceForm input,
@@ -1126,6 +1917,8 @@ class FsmMorphologicalAnalyzer:
         ----------
         sentenceOrSurfaceForm : str
             String or Sentence to analyse.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search.
 
         RETURNS
         -------
@@ -1142,89 +1935,681 @@ class FsmMorphologicalAnalyzer:
                 spell_corrected_form = self.__dictionary.getCorrectForm(original_form)
                 if len(spell_corrected_form) == 0:
                     spell_corrected_form = original_form
-                word_fsm_parse_list = self.morphologicalAnalysis(spell_corrected_form)
+                word_fsm_parse_list = self.morphologicalAnalysis(spell_corrected_form, frontierType)
                 result.append(word_fsm_parse_list)
             return result
         elif isinstance(sentenceOrSurfaceForm, str):
-            possible_root_lowercased = ""
-            lowercased = self.__toLower(sentenceOrSurfaceForm)
-            is_root_replaced = False
-            surface_form = sentenceOrSurfaceForm
-            if self.__parsed_surface_forms is not None and surface_form in self.__parsed_surface_forms \
-                    and not self.__isRange(surface_form) and not self.__isTime(surface_form) \
-                    and not self.__isInteger(surface_form) and not self.__isDouble(surface_form) \
-                    and not self.__isDate(surface_form) and not self.__isPercent(surface_form):
-                return FsmParseList([FsmParse(Word(surface_form))])
-            if self.__cache.contains(surface_form):
-                return self.__cache.get(surface_form)
-            if self.patternMatches("(\\w|Ç|Ş|İ|Ü|Ö)\\.", surface_form):
-                self.__dictionary_trie.addWord(lowercased, TxtWord(lowercased, "IS_OA"))
-            default_fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-            if len(default_fsm_parse) > 0:
-                fsm_parse_list = FsmParseList(default_fsm_parse)
-                self.__cache.add(surface_form, fsm_parse_list)
+            if self.__search_statistics is None:
+                return self.__surfaceFormAnalysis(sentenceOrSurfaceForm, frontierType)
+            return self.__surfaceFormAnalysisWithStatistics(sentenceOrSurfaceForm, frontierType)
+
+    def __surfaceFormAnalysisWithStatistics(self,
+                                            surfaceForm: str,
+                                            frontierType=FrontierType.BREADTH_FIRST) -> FsmParseList:
+        """
+        Analyzes the given surface form with surfaceFormAnalysis and records the statistics of the analysis as the
+        statistics of a new word. The hits and misses of the allomorph resolution cache are counted as the change of
+        its counters during the analysis.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to analyse.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search.
+
+        RETURNS
+        -------
+        FsmParseList
+            fsmParseList which holds the analysis.
+        """
+        statistics = self.__search_statistics
+        statistics.startWord(surfaceForm)
+        hits = self.__allomorph_cache.getHits()
+        misses = self.__allomorph_cache.getMisses()
+        fsm_parse_list = self.__surfaceFormAnalysis(surfaceForm, frontierType)
+        statistics.increment("allomorph_cache_hits", self.__allomorph_cache.getHits() - hits)
+        statistics.increment("allomorph_cache_misses", self.__allomorph_cache.getMisses() - misses)
+        statistics.endWord()
+        return fsm_parse_list
+
+    def __isParsedSurfaceForm(self, surfaceForm: str) -> bool:
+        """
+        Checks whether the given surface form is one of the parsed surface forms, which are answered with the surface
+        form itself as the root. Numbers, dates, times, percents and ranges are always analyzed.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to check.
+
+        RETURNS
+        -------
+        bool
+            True if the surface form is answered from the parsed surface forms, False otherwise.
+        """
+        return self.__parsed_surface_forms is not None and surfaceForm in self.__parsed_surface_forms \
+            and not self.__isRange(surfaceForm) and not self.__isTime(surfaceForm) \
+            and not self.__isInteger(surfaceForm) and not self.__isDouble(surfaceForm) \
+            and not self.__isDate(surfaceForm) and not self.__isPercent(surfaceForm)
+
+    def __surfaceFormAnalysis(self,
+                              surfaceForm: str,
+                              frontierType=FrontierType.BREADTH_FIRST) -> FsmParseList:
+        """
+        Analyzes a single surface form for morphologicalAnalysis. The surface form is first searched in the parsed
+        surface forms, in the cache and in the negative cache, then analyzed with the uncachedAnalysis method. Surface
+        forms without any analysis are stored in the negative cache. The caches are shared by the threads using the
+        analyzer and are only accessed while holding its lock, the analysis itself runs without the lock.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to analyse.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search.
+
+        RETURNS
+        -------
+        FsmParseList
+            fsmParseList which holds the analysis.
+        """
+        lowercased = self.__toLower(surfaceForm)
+        surface_form = surfaceForm
+        if self.__isParsedSurfaceForm(surface_form):
+            return FsmParseList([FsmParse(Word(surface_form))])
+        cache_key = AnalysisCache.normalizedKey(surface_form, lowercased, self.isProperNoun(surface_form))
+        with self.__lock:
+            fsm_parse_list = self.__cache.get(cache_key)
+            if fsm_parse_list is not None:
+                if self.__search_statistics is not None:
+                    self.__search_statistics.increment("analysis_cache_hits")
                 return fsm_parse_list
-            fsm_parse = []
-            if "'" in surface_form:
-                possible_root = surface_form[:surface_form.index('\'')]
-                if len(possible_root) > 0:
-                    if "/" in possible_root or "\\/" in possible_root:
-                        self.__dictionary_trie.addWord(possible_root, TxtWord(possible_root, "IS_KESIR"))
-                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-                    elif self.__isDate(possible_root):
-                        self.__dictionary_trie.addWord(possible_root, TxtWord(possible_root, "IS_DATE"))
-                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-                    elif self.patternMatches("\\d+/\\d+", possible_root):
-                        self.__dictionary_trie.addWord(possible_root, TxtWord(possible_root, "IS_KESIR"))
-                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-                    elif self.__isPercent(possible_root):
-                        self.__dictionary_trie.addWord(possible_root, TxtWord(possible_root, "IS_PERCENT"))
-                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-                    elif self.__isTime(possible_root):
-                        self.__dictionary_trie.addWord(possible_root, TxtWord(possible_root, "IS_ZAMAN"))
-                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-                    elif self.__isRange(possible_root):
-                        self.__dictionary_trie.addWord(possible_root, TxtWord(possible_root, "IS_RANGE"))
-                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-                    elif self.__isInteger(possible_root):
-                        self.__dictionary_trie.addWord(possible_root, TxtWord(possible_root, "IS_SAYI"))
-                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-                    elif self.__isDouble(possible_root):
-                        self.__dictionary_trie.addWord(possible_root, TxtWord(possible_root, "IS_REELSAYI"))
-                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-                    elif Word.isCapital(possible_root) or possible_root[0:1] in "QXW":
-                        possible_root_lowercased = self.__toLower(possible_root)
-                        if possible_root_lowercased in self.__pronunciations:
-                            is_root_replaced = True
-                            pronunciation = self.__pronunciations[possible_root_lowercased]
-                            word = self.__dictionary.getWord(pronunciation)
-                            if word is not None and isinstance(word, TxtWord):
-                                word.addFlag("IS_OA")
-                            else:
-                                new_word = TxtWord(pronunciation, "IS_OA")
-                                self.__dictionary_trie.addWord(pronunciation, new_word)
-                            replaced_word = pronunciation + lowercased[len(possible_root_lowercased):]
-                            fsm_parse = self.__analysis(replaced_word, self.isProperNoun(surface_form))
+            if self.__persistent_cache is not None:
+                parses = self.__persistent_cache.get(cache_key)
+                if parses is not None:
+                    fsm_parse_list = FsmParseList(parses)
+                    self.__cache.add(cache_key, fsm_parse_list)
+                    return fsm_parse_list
+            if self.__negative_cache.contains(cache_key):
+                if self.__search_statistics is not None:
+                    self.__search_statistics.increment("negative_cache_hits")
+                return FsmParseList([])
+            if self.__search_statistics is not None:
+                self.__search_statistics.increment("analysis_cache_misses")
+        self.__call.overlay = None
+        try:
+            fsm_parse_list = FsmParseList(self.__uncachedAnalysis(surface_form, lowercased, frontierType))
+        finally:
+            self.__call.overlay = None
+        if fsm_parse_list.size() > 0:
+            self.__addToCache(cache_key, fsm_parse_list)
+        else:
+            with self.__lock:
+                self.__negative_cache.add(cache_key)
+        return fsm_parse_list
+
+    def __uncachedAnalysis(self,
+                           surfaceForm: str,
+                           lowercased: str,
+                           frontierType=FrontierType.BREADTH_FIRST) -> list:
+        """
+        Analyzes a surface form which is not found in the caches with the analysis method. If there is no analysis and
+        the surface form contains an apostrophe, the part before the apostrophe is added to the overlay of the current
+        analysis as a new root and the surface form is analyzed again. The roots added here are discarded after the
+        analysis, so the shared trie is never modified.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to analyse.
+        lowercased : str
+            Lowercase form of the surface form.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search.
+
+        RETURNS
+        -------
+        list
+            Analyses of the surface form.
+        """
+        possible_root_lowercased = ""
+        is_root_replaced = False
+        surface_form = surfaceForm
+        if self.patternMatches("(\\w|Ç|Ş|İ|Ü|Ö)\\.", surface_form):
+            self.__addRootToTrie(lowercased, TxtWord(lowercased, "IS_OA"))
+        default_fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+        if len(default_fsm_parse) > 0:
+            return default_fsm_parse
+        fsm_parse = []
+        if "'" in surface_form:
+            possible_root = surface_form[:surface_form.index('\'')]
+            if len(possible_root) > 0:
+                if "/" in possible_root or "\\/" in possible_root:
+                    self.__addRootToTrie(possible_root, TxtWord(possible_root, "IS_KESIR"))
+                    fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+                elif self.__isDate(possible_root):
+                    self.__addRootToTrie(possible_root, TxtWord(possible_root, "IS_DATE"))
+                    fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+                elif self.patternMatches("\\d+/\\d+", possible_root):
+                    self.__addRootToTrie(possible_root, TxtWord(possible_root, "IS_KESIR"))
+                    fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+                elif self.__isPercent(possible_root):
+                    self.__addRootToTrie(possible_root, TxtWord(possible_root, "IS_PERCENT"))
+                    fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+                elif self.__isTime(possible_root):
+                    self.__addRootToTrie(possible_root, TxtWord(possible_root, "IS_ZAMAN"))
+                    fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+                elif self.__isRange(possible_root):
+                    self.__addRootToTrie(possible_root, TxtWord(possible_root, "IS_RANGE"))
+                    fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+                elif self.__isInteger(possible_root):
+                    self.__addRootToTrie(possible_root, TxtWord(possible_root, "IS_SAYI"))
+                    fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+                elif self.__isDouble(possible_root):
+                    self.__addRootToTrie(possible_root, TxtWord(possible_root, "IS_REELSAYI"))
+                    fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+                elif Word.isCapital(possible_root) or possible_root[0:1] in "QXW":
+                    possible_root_lowercased = self.__toLower(possible_root)
+                    pronunciations = self.__core.getPronunciations()
+                    if possible_root_lowercased in pronunciations:
+                        is_root_replaced = True
+                        pronunciation = pronunciations[possible_root_lowercased]
+                        word = self.__dictionary.getWord(pronunciation)
+                        if word is not None and isinstance(word, TxtWord):
+                            self.__addFlagToRoot(word, "IS_OA")
                         else:
-                            word = self.__dictionary.getWord(possible_root_lowercased)
-                            if word is not None and isinstance(word, TxtWord):
-                                word.addFlag("IS_OA")
-                            else:
-                                new_word = TxtWord(possible_root_lowercased, "IS_OA")
-                                self.__dictionary_trie.addWord(possible_root_lowercased, new_word)
-                            fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form))
-            if is_root_replaced:
-                for parse in fsm_parse:
-                    parse.restoreOriginalForm(possible_root_lowercased, pronunciation)
-            fsm_parse_list = FsmParseList(fsm_parse)
-            if fsm_parse_list.size() > 0:
-                self.__cache.add(surface_form, fsm_parse_list)
-            return fsm_parse_list
+                            new_word = TxtWord(pronunciation, "IS_OA")
+                            self.__addRootToTrie(pronunciation, new_word)
+                        replaced_word = pronunciation + lowercased[len(possible_root_lowercased):]
+                        fsm_parse = self.__analysis(replaced_word, self.isProperNoun(surface_form), frontierType)
+                    else:
+                        word = self.__dictionary.getWord(possible_root_lowercased)
+                        if word is not None and isinstance(word, TxtWord):
+                            self.__addFlagToRoot(word, "IS_OA")
+                        else:
+                            new_word = TxtWord(possible_root_lowercased, "IS_OA")
+                            self.__addRootToTrie(possible_root_lowercased, new_word)
+                        fsm_parse = self.__analysis(lowercased, self.isProperNoun(surface_form), frontierType)
+        if is_root_replaced:
+            for parse in fsm_parse:
+                parse.restoreOriginalForm(possible_root_lowercased, pronunciation)
+        return fsm_parse
+
+    def __addToCache(self,
+                     key: tuple,
+                     fsmParseList: FsmParseList):
+        """
+        Stores the analyses of a surface form in the analysis cache and in the persistent cache. The analyses are not
+        stored in the persistent cache after rootOfPossiblyNewWord added guessed roots to the trie, since they may
+        depend on these roots, which are not known by the later runs.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by AnalysisCache.normalizedKey.
+        fsmParseList : FsmParseList
+            Analyses of the surface form.
+        """
+        with self.__lock:
+            self.__cache.add(key, fsmParseList)
+            if self.__persistent_cache is not None and not self.__roots_guessed:
+                self.__persistent_cache.add(key, fsmParseList.toTuple())
+
+    def __cacheStamp(self) -> str:
+        """
+        Returns the hash of the finite state machine file and of the words of the dictionary with their flags, which
+        identifies the analyses stored in a persistent cache or in a cache snapshot.
+
+        RETURNS
+        -------
+        str
+            Hexadecimal SHA-256 hash.
+        """
+        return self.__core.getStamp()
+
+    def __frequentSurfaceForms(self,
+                               wordsOrFile,
+                               topN=None) -> list:
+        """
+        Counts the surface forms of a frequency list or a corpus and returns the most frequent ones. A line of a file
+        containing a word followed by a number is read as an entry of a frequency list, any other line as a sentence
+        of the corpus. A dictionary is read as a map from the surface forms to their counts, and any other collection
+        as a list of tokens.
+
+        PARAMETERS
+        ----------
+        wordsOrFile : str, dict or list
+            Name of a file, a map from surface forms to counts, or a list of surface forms.
+        topN : int
+            Number of surface forms to return. If None, all surface forms are returned.
+
+        RETURNS
+        -------
+        list
+            Surface forms ordered by their frequency.
+        """
+        counts = collections.Counter()
+        if isinstance(wordsOrFile, str):
+            with open(wordsOrFile, "r", encoding="utf8") as input_file:
+                for line in input_file:
+                    items = line.split()
+                    if len(items) == 2 and items[1].isdigit():
+                        counts[items[0]] += int(items[1])
+                    else:
+                        counts.update(items)
+        else:
+            counts.update(wordsOrFile)
+        return [surface_form for surface_form, _ in counts.most_common(topN)]
+
+    def warmCache(self,
+                  wordsOrFile,
+                  topN=None,
+                  workers=1) -> int:
+        """
+        Fills the analysis cache with the analyses of the most frequent surface forms of a frequency list or a corpus,
+        so that they are not analyzed while the analyzer is in use. If more than one worker is given and the platform
+        can fork processes, the surface forms are analyzed in parallel by worker processes sharing this analyzer, and
+        their analyses are added to the cache of this analyzer. The warmed surface forms can be written to a snapshot
+        with saveCacheSnapshot.
+
+        PARAMETERS
+        ----------
+        wordsOrFile : str, dict or list
+            Name of a frequency list or corpus file, a map from surface forms to counts, or a list of surface forms.
+        topN : int
+            Number of most frequent surface forms to analyze. If None, all surface forms are analyzed.
+        workers : int
+            Number of worker processes.
+
+        RETURNS
+        -------
+        int
+            Number of warmed surface forms with at least one analysis.
+        """
+        surface_forms = self.__frequentSurfaceForms(wordsOrFile, topN)
+        count = 0
+        for surface_form, parses in self.__analyzeDistinct(surface_forms, workers).items():
+            if len(parses) > 0:
+                key = self.cacheKey(surface_form)
+                self.__warmed_keys[key] = None
+                count = count + 1
+        return count
+
+    def __canUseWorkers(self,
+                        size: int,
+                        workers: int) -> bool:
+        """
+        Checks whether the given number of surface forms should be analyzed by worker processes. The workers are
+        forked, so that they share the analyzer built by this process instead of building their own.
+
+        PARAMETERS
+        ----------
+        size : int
+            Number of surface forms to analyze.
+        workers : int
+            Number of worker processes requested.
+
+        RETURNS
+        -------
+        bool
+            True if more than one worker is requested, the platform can fork processes and there are more surface forms
+            than workers.
+        """
+        return workers > 1 and "fork" in multiprocessing.get_all_start_methods() and size > workers
+
+    def __analyzeInWorkers(self,
+                           surfaceForms: list,
+                           workers: int,
+                           chunkSize=None) -> list:
+        """
+        Analyzes the given surface forms in forked worker processes sharing this analyzer, and adds their analyses to
+        the caches of this analyzer. The components loaded on first use are loaded before forking, so that the workers
+        do not load them separately. The locks of the analyzer are held while forking, see registerForForks, so the
+        analyzer can be used by other threads at the same time.
+
+        PARAMETERS
+        ----------
+        surfaceForms : list
+            Surface forms to analyze.
+        workers : int
+            Number of worker processes.
+        chunkSize : int
+            Number of surface forms sent to a worker at once. If None, the surface forms are divided equally among the
+            workers.
+
+        RETURNS
+        -------
+        list
+            Surface forms and their analyses as tuples, in the order of the given surface forms.
+        """
+        global _worker_analyzer
+        if chunkSize is None:
+            chunkSize = (len(surfaceForms) + workers - 1) // workers
+        chunks = [surfaceForms[i: i + chunkSize] for i in range(0, len(surfaceForms), chunkSize)]
+        serializer = ParseSerializer(self.__finite_state_machine, self.__dictionary)
+        self.preload()
+        _worker_analyzer = self
+        try:
+            with multiprocessing.get_context("fork").Pool(workers) as pool:
+                results = pool.map(_analyzeInWorker, chunks)
+        finally:
+            _worker_analyzer = None
+        analyses = []
+        for data in results:
+            for surface_form, parses in serializer.decode(data):
+                key = self.cacheKey(surface_form)
+                if len(parses) > 0:
+                    self.__addToCache(key, FsmParseList(parses))
+                else:
+                    with self.__lock:
+                        self.__negative_cache.add(key)
+                analyses.append((surface_form, parses))
+        return analyses
+
+    def analyzeMany(self,
+                    tokens,
+                    workers=1,
+                    chunkSize=None) -> list:
+        """
+        Analyzes a stream of tokens, such as the tokens of a corpus, and returns their analyses in the order of the
+        tokens. Each distinct token is analyzed once: the tokens found in the caches are answered from the caches, and
+        if more than one worker is given and the platform can fork processes, the remaining ones are analyzed in
+        parallel by worker processes sharing this analyzer. The analyses computed by the workers are added to the
+        caches of this analyzer. Repeated tokens share the analyses of their first occurrence, but each of them gets
+        its own parse list.
+
+        PARAMETERS
+        ----------
+        tokens : iterable
+            Surface forms to analyze.
+        workers : int
+            Number of worker processes.
+        chunkSize : int
+            Number of distinct tokens sent to a worker at once. If None, the tokens are divided equally among the
+            workers.
+
+        RETURNS
+        -------
+        list
+            FsmParseList of each token, in the order of the tokens.
+        """
+        tokens = list(tokens)
+        analyses = self.__analyzeDistinct(list(dict.fromkeys(tokens)), workers, chunkSize)
+        return [FsmParseList(analyses[token]) for token in tokens]
+
+    def __analyzeDistinct(self,
+                          surfaceForms: list,
+                          workers: int,
+                          chunkSize=None) -> dict:
+        """
+        Analyzes the given distinct surface forms for analyzeMany and warmCache. If worker processes can be used, the
+        surface forms answered by the caches are taken from them, and only the remaining ones are sent to the workers.
+        The surface forms not analyzed by the workers are analyzed with morphologicalAnalysis.
+
+        PARAMETERS
+        ----------
+        surfaceForms : list
+            Distinct surface forms to analyze.
+        workers : int
+            Number of worker processes.
+        chunkSize : int
+            Number of surface forms sent to a worker at once. If None, the surface forms are divided equally among the
+            workers.
+
+        RETURNS
+        -------
+        dict
+            Map from the surface forms to their analyses as tuples.
+        """
+        analyses = dict.fromkeys(surfaceForms)
+        if self.__canUseWorkers(len(analyses), workers):
+            pending = []
+            for surface_form in analyses:
+                analyses[surface_form] = self.__knownAnalyses(surface_form)
+                if analyses[surface_form] is None:
+                    pending.append(surface_form)
+            if self.__canUseWorkers(len(pending), workers):
+                for surface_form, parses in self.__analyzeInWorkers(pending, workers, chunkSize):
+                    analyses[surface_form] = parses
+        for surface_form in analyses:
+            if analyses[surface_form] is None:
+                analyses[surface_form] = self.morphologicalAnalysis(surface_form).toTuple()
+        return analyses
+
+    def __knownAnalyses(self, surfaceForm: str) -> tuple:
+        """
+        Returns the analyses of the given surface form if they are known without analyzing it, that is if it is one of
+        the parsed surface forms, or it is in the analysis cache, the persistent cache or the negative cache, in the
+        same order as surfaceFormAnalysis. The analyses found in the persistent cache are added to the analysis cache.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to search.
+
+        RETURNS
+        -------
+        tuple
+            Analyses of the surface form, None if it must be analyzed.
+        """
+        if self.__isParsedSurfaceForm(surfaceForm):
+            return (FsmParse(Word(surfaceForm)),)
+        key = self.cacheKey(surfaceForm)
+        with self.__lock:
+            fsm_parse_list = self.__cache.get(key)
+            if fsm_parse_list is not None:
+                return fsm_parse_list.toTuple()
+            if self.__persistent_cache is not None:
+                parses = self.__persistent_cache.get(key)
+                if parses is not None:
+                    self.__cache.add(key, FsmParseList(parses))
+                    return parses
+            if self.__negative_cache.contains(key):
+                return ()
+        return None
+
+    def saveCacheSnapshot(self, fileName: str) -> int:
+        """
+        Writes the analyses of the surface forms warmed with warmCache, which are still in the analysis cache, to a
+        snapshot file. The snapshot is stamped like a persistent cache and can be loaded by a new analyzer with
+        loadCacheSnapshot much faster than analyzing the surface forms again.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the snapshot file.
+
+        RETURNS
+        -------
+        int
+            Number of surface forms written.
+        """
+        entries = []
+        with self.__lock:
+            for key in self.__warmed_keys:
+                parses = self.__cache.peek(key)
+                if parses is not None:
+                    entries.append((key, parses))
+        serializer = ParseSerializer(self.__finite_state_machine, self.__dictionary)
+        with open(fileName, "wb") as output_file:
+            serializer.dump((FsmMorphologicalAnalyzer.SNAPSHOT_MAGIC, self.__cacheStamp(), entries), output_file)
+        return len(entries)
+
+    def loadCacheSnapshot(self, fileName: str) -> int:
+        """
+        Adds the analyses of a snapshot written with saveCacheSnapshot to the analysis cache.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the snapshot file.
+
+        RETURNS
+        -------
+        int
+            Number of surface forms loaded.
+        """
+        serializer = ParseSerializer(self.__finite_state_machine, self.__dictionary)
+        with open(fileName, "rb") as input_file:
+            magic, stamp, entries = serializer.load(input_file)
+        if magic != FsmMorphologicalAnalyzer.SNAPSHOT_MAGIC:
+            raise ValueError(fileName + " is not a cache snapshot file")
+        if stamp != self.__cacheStamp():
+            raise ValueError(fileName + " was written with another dictionary or finite state machine")
+        with self.__lock:
+            for key, parses in entries:
+                self.__cache.add(key, FsmParseList(parses))
+                self.__warmed_keys[key] = None
+        return len(entries)
+
+    def enablePersistentCache(self,
+                              fileName: str,
+                              readOnly=False):
+        """
+        Adds a persistent cache behind the analysis cache. The surface forms not found in the analysis cache are
+        searched in the persistent cache before they are analyzed, and the new analyses are stored in both caches, so
+        that later runs start with the analyses of the earlier runs. A database built with another dictionary or
+        finite state machine is cleared, or ignored if it is opened read only.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the SQLite database file.
+        readOnly : bool
+            If True, the analyses are only read from the database, which can be shared by many processes.
+        """
+        self.disablePersistentCache()
+        self.__persistent_cache = PersistentAnalysisCache(fileName, self.__cacheStamp(), self.__finite_state_machine,
+                                                          self.__dictionary, readOnly)
+
+    def disablePersistentCache(self):
+        """
+        Writes the waiting analyses to the persistent cache and closes it.
+        """
+        if self.__persistent_cache is not None:
+            self.__persistent_cache.close()
+            self.__persistent_cache = None
+
+    def getPersistentCache(self) -> PersistentAnalysisCache:
+        """
+        Getter for the persistent cache.
+
+        RETURNS
+        -------
+        PersistentAnalysisCache
+            Persistent cache of the analyzer, None if it is not enabled.
+        """
+        return self.__persistent_cache
+
+    def __callOverlay(self) -> LexiconOverlay:
+        """
+        Returns the overlay of the roots added by the analysis running in the current thread, and creates it if the
+        analysis did not add any root yet. The overlay extends the overlay of the roots added by rootOfPossiblyNewWord
+        and is discarded when the analysis ends.
+
+        RETURNS
+        -------
+        LexiconOverlay
+            Overlay of the current analysis.
+        """
+        overlay = getattr(self.__call, "overlay", None)
+        if overlay is None:
+            overlay = LexiconOverlay(self.__session_overlay)
+            self.__call.overlay = overlay
+        return overlay
+
+    def __addRootToTrie(self,
+                        key: str,
+                        root: TxtWord):
+        """
+        Adds a new root, derived from the surface form being analyzed, to the overlay of the current analysis. The root
+        is only visible to this analysis, so the analyses of the other surface forms do not depend on the order in
+        which the surface forms are analyzed.
+
+        PARAMETERS
+        ----------
+        key : str
+            Prefix of the surface forms under which the root is stored.
+        root : TxtWord
+            Root to add.
+        """
+        self.__callOverlay().addRoot(key, root)
+
+    def __addFlagToRoot(self,
+                        root: TxtWord,
+                        flag: str):
+        """
+        Adds a flag to a root of the dictionary for the current analysis. Since the dictionary is shared, the flag is
+        added to a copy of the root, which replaces the root in the words returned by the trie during this analysis.
+        The copies are created once for each root and flag and reused by the later analyses.
+
+        PARAMETERS
+        ----------
+        root : TxtWord
+            Root to which the flag is added.
+        flag : str
+            Flag to add.
+        """
+        overlay = self.__callOverlay()
+        current_root = overlay.getRoot(root)
+        if current_root.containsFlag(flag):
+            return
+        if current_root is not root:
+            flagged_root = copy.deepcopy(current_root)
+            flagged_root.addFlag(flag)
+        else:
+            entry = self.__flagged_roots.get((id(root), flag))
+            if entry is None or entry[0] is not root:
+                flagged_root = copy.deepcopy(root)
+                flagged_root.addFlag(flag)
+                entry = (root, flagged_root)
+                self.__flagged_roots[(id(root), flag)] = entry
+            flagged_root = entry[1]
+        overlay.replaceRoot(root, flagged_root)
+
+    def getAnalysisCache(self) -> AnalysisCache:
+        """
+        Getter for the cache of the analyses.
+
+        RETURNS
+        -------
+        AnalysisCache
+            Analysis cache of the analyzer.
+        """
+        return self.__cache
+
+    def getNegativeCache(self) -> NegativeAnalysisCache:
+        """
+        Getter for the cache of the surface forms without any analysis.
+
+        RETURNS
+        -------
+        NegativeAnalysisCache
+            Negative cache of the analyzer.
+        """
+        return self.__negative_cache
+
+    def invalidateNegativeCache(self, prefix=""):
+        """
+        Removes the surface forms starting with the given prefix from the negative cache. It must be called after the
+        dictionary or the trie returned by getDictionary is changed outside the analyzer. An empty prefix removes all
+        surface forms.
+
+        PARAMETERS
+        ----------
+        prefix : str
+            Lowercase prefix of the surface forms that may have new analyses.
+        """
+        with self.__lock:
+            self.__negative_cache.invalidate(prefix)
 
     def rootOfPossiblyNewWord(self, surfaceForm: str) -> [TxtWord]:
         """
-        Identifies a possible new root word for a given surface form. It also adds the new root form to the dictionary
-        for further usage. The method first searches the suffix trie for the reverse string of the surface form. This
+        Identifies a possible new root word for a given surface form. It also adds the new root form to the overlay of
+        the analyzer for further usage, so the later analyses of this analyzer, in any thread, also use it, while the
+        shared dictionary trie is not modified. Like the roots of the dictionary, the root in the overlay is lowercase,
+        so that the capitalized surface forms, which are analyzed in lowercase, find it too. The method first searches the suffix trie for the reverse string of the surface form. This
         way, it can identify if the word has a suffix that is in the most frequently used suffix list. Since a word can
         have multiple possible suffixes, the method identifies the longest suffix and returns the substring of the
         surface form tht does not contain the suffix. Let say the word is 'googlelaştırdık', it will identify 'tık' as
@@ -1235,19 +2620,27 @@ class FsmMorphologicalAnalyzer:
         :param surfaceForm: Surface form for which we will identify a possible new root form.
         :return: Possible new root form.
         """
-        words = self.__suffix_trie.getWordsWithPrefix(self.reverseString(surfaceForm))
+        words = self.__core.getSuffixTrie().getWordsWithPrefix(self.reverseString(surfaceForm))
         candidate_list = []
         for word in words:
             candidate_word = surfaceForm[0: len(surfaceForm) - len(word.getName())]
             if candidate_word.endswith("ğ"):
                 candidate_word = candidate_word[0: len(candidate_word) - 1] + "k"
-                new_word = TxtWord(candidate_word, "CL_ISIM")
-                new_word.addFlag("IS_SD")
+                flag = "IS_SD"
             else:
-                new_word = TxtWord(candidate_word, "CL_ISIM")
-                new_word.addFlag("CL_FIIL")
+                flag = "CL_FIIL"
+            new_word = TxtWord(candidate_word, "CL_ISIM")
+            new_word.addFlag(flag)
             candidate_list.append(new_word)
-            self.__dictionary_trie.addWord(candidate_word, new_word)
+            lowercased = self.__toLower(candidate_word)
+            if lowercased != candidate_word:
+                new_word = TxtWord(lowercased, "CL_ISIM")
+                new_word.addFlag(flag)
+            self.__session_overlay.addRoot(lowercased, new_word)
+            with self.__lock:
+                self.__negative_cache.invalidate(lowercased)
+        if len(candidate_list) > 0:
+            self.__roots_guessed = True
         return candidate_list
 
     def robustMorphologicalAnalysis(self, sentenceOrSurfaceForm):
@@ -1397,7 +2790,8 @@ class FsmMorphologicalAnalyzer:
 
     def morphologicalAnalysisExists(self,
                                     rootWord: TxtWord,
-                                    surfaceForm: str) -> bool:
+                                    surfaceForm: str,
+                                    frontierType=FrontierType.DEPTH_FIRST) -> bool:
         """
         The morphologicalAnalysisExists method calls analysisExists to check the existence of the analysis with given
         root and surfaceForm.
@@ -1408,10 +2802,13 @@ class FsmMorphologicalAnalyzer:
             String to check.
         rootWord : TxtWord
             TxtWord input root.
+        frontierType : FrontierType
+            Order in which the parses are expanded during the search. Since the first accepting parse is enough, the
+            search is depth first by default.
 
         RETURNS
         -------
         bool
             True an analysis exists, otherwise return False.
         """
-        return self.__analysisExists(rootWord, self.__toLower(surfaceForm), True)
+        return self.__analysisExists(rootWord, self.__toLower(surfaceForm), True, frontierType)
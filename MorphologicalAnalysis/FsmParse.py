@@ -58,6 +58,30 @@ class FsmParse(MorphologicalParse):
         self.__verb_agreement = None
         self.__possesive_agreement = None
 
+    def clone(self) -> FsmParse:
+        """
+        Returns a copy of the parse, whose suffix, form, transition and with lists can be changed without changing the
+        lists of this parse. The root, the states and the inflectional groups themselves are shared.
+
+        RETURNS
+        -------
+        FsmParse
+            Copy of the parse.
+        """
+        result = FsmParse(self.root)
+        result.__form = self.__form
+        result.__pos = self.__pos
+        result.__initial_pos = self.__initial_pos
+        result.__suffix_list = list(self.__suffix_list)
+        result.__form_list = list(self.__form_list)
+        result.__transition_list = list(self.__transition_list)
+        result.__with_list = list(self.__with_list)
+        result.__verb_agreement = self.__verb_agreement
+        result.__possesive_agreement = self.__possesive_agreement
+        if hasattr(self, "inflectional_groups"):
+            result.inflectional_groups = list(self.inflectional_groups)
+        return result
+
     def __eq__(self, other):
         return self.transitionList() == other.transitionList()
 
@@ -85,17 +85,24 @@ class FsmParseList:
         "üne ün VERB NOUN", "unun un VERB NOUN", "ince i NOUN VERB", "unca u NOUN VERB", "ınca ı NOUN VERB",
         "unca un NOUN VERB", "ilen ile VERB VERB"]
 
-    def __init__(self, fsmParses: list):
+    def __init__(self, fsmParses):
         """
         A constructor of FsmParseList class which takes a list fsmParses as an input. First it sorts
         the items of the list then loops through it, if the current item's transitions equal to the next item's
         transitions, it removes the latter item. At the end, it assigns this list to the fsmParses variable.
 
+        If a tuple is given, it should be sorted and reduced already, such as the tuples returned by toTuple. The tuple
+        is shared without copying, and it is only copied into a list when the parse list is modified for the first
+        time.
+
         PARAMETERS
         ----------
         fsmParses : list
-            FsmParse list input.
+            FsmParse list input, or a tuple of sorted and reduced FsmParse.
         """
+        if isinstance(fsmParses, tuple):
+            self.__fsm_parses = fsmParses
+            return
         fsmParses.sort()
         i = 0
         while i < len(fsmParses) - 1:
@@ -105,6 +112,24 @@ class FsmParseList:
             i = i + 1
         self.__fsm_parses = fsmParses
 
+    def __ownParses(self):
+        """
+        Copies the shared tuple of parses into a list before the list is modified.
+        """
+        if isinstance(self.__fsm_parses, tuple):
+            self.__fsm_parses = list(self.__fsm_parses)
+
+    def toTuple(self) -> tuple:
+        """
+        Returns the parses of the list as a tuple, which can be shared by the parse lists constructed from it.
+
+        RETURNS
+        -------
+        tuple
+            Sorted and reduced parses of the list.
+        """
+        return tuple(self.__fsm_parses)
+
     def size(self) -> int:
         """
         The size method returns the size of fsmParses list.
@@ -162,6 +187,7 @@ class FsmParseList:
         currentWithPos : Word
             Word input.
         """
+        self.__ownParses()
         i = 0
         while i < len(self.__fsm_parses):
             if self.__fsm_parses[i].getWordWithPos() != currentWithPos:
@@ -224,6 +250,7 @@ class FsmParseList:
         currentRoot : str
             String input.
         """
+        self.__ownParses()
         i = 0
         while i < len(self.__fsm_parses):
             if self.__fsm_parses[i].getWord().getName() != currentRoot:
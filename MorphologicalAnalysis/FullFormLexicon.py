@@ -0,0 +1,359 @@
+import bisect
+import mmap
+import struct
+
+from Dictionary.TxtWord import TxtWord
+
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.PartialFsmParse import PartialFsmParse
+
+
+class FullFormLexicon:
+
+    MAGIC = b"FFLEX001"
+    BLOCK_SIZE = 16
+    HEADER = struct.Struct("<IIIQQ")
+    KEY_HEADER = struct.Struct("<HH")
+    LENGTH = struct.Struct("<I")
+    OFFSET = struct.Struct("<Q")
+    FIELD_SEPARATOR = "\x1f"
+    RECORD_SEPARATOR = "\x1e"
+    NONE = "\x00"
+    PROPER_AND_NOT_PROPER = "B"
+    ONLY_PROPER = "P"
+    ONLY_NOT_PROPER = "N"
+
+    __file: object
+    __map: mmap.mmap
+    __max_length: int
+    __entry_count: int
+    __block_count: int
+    __index_offset: int
+    __roots: set
+    __first_keys: list
+
+    def __init__(self, fileName: str):
+        """
+        Constructor of FullFormLexicon class. A full form lexicon maps surface forms to their analyses, which are
+        computed offline with the finite state machine. The file is memory mapped, the entries are sorted by their
+        surface forms and stored in blocks. In each block, the first surface form is stored as it is, and the other
+        surface forms are stored with the length of the prefix they share with the previous surface form and the rest
+        of them. Only the first surface forms of the blocks are read into memory, so a lookup is a binary search over
+        the blocks followed by a scan of a single block.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the lexicon file created with write.
+        """
+        self.__file = open(fileName, "rb")
+        self.__map = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.__map[:len(FullFormLexicon.MAGIC)] != FullFormLexicon.MAGIC:
+            self.close()
+            raise ValueError(fileName + " is not a full form lexicon file")
+        self.__max_length, self.__entry_count, self.__block_count, self.__index_offset, roots_offset = \
+            FullFormLexicon.HEADER.unpack_from(self.__map, len(FullFormLexicon.MAGIC))
+        roots_length = FullFormLexicon.LENGTH.unpack_from(self.__map, roots_offset)[0]
+        roots = self.__map[roots_offset + FullFormLexicon.LENGTH.size:
+                           roots_offset + FullFormLexicon.LENGTH.size + roots_length].decode("utf8")
+        if len(roots) > 0:
+            self.__roots = set(roots.split(FullFormLexicon.RECORD_SEPARATOR))
+        else:
+            self.__roots = set()
+        self.__first_keys = []
+        for i in range(self.__block_count):
+            offset = self.__blockOffset(i)
+            suffix_length = FullFormLexicon.KEY_HEADER.unpack_from(self.__map, offset)[1]
+            start = offset + FullFormLexicon.KEY_HEADER.size
+            self.__first_keys.append(self.__map[start: start + suffix_length])
+
+    @staticmethod
+    def rootKey(root: TxtWord) -> str:
+        """
+        Returns the string identifying a root together with its flags.
+
+        PARAMETERS
+        ----------
+        root : TxtWord
+            Root word.
+
+        RETURNS
+        -------
+        str
+            Name of the root followed by its flags.
+        """
+        return root.__str__()
+
+    @staticmethod
+    def __encodeValue(value) -> str:
+        """
+        Encodes an optional string field of a parse.
+
+        PARAMETERS
+        ----------
+        value : str
+            Value to encode, may be None.
+
+        RETURNS
+        -------
+        str
+            The value itself, or the none marker if the value is None.
+        """
+        if value is None:
+            return FullFormLexicon.NONE
+        return value
+
+    @staticmethod
+    def __decodeValue(value: str):
+        """
+        Decodes an optional string field of a parse.
+
+        PARAMETERS
+        ----------
+        value : str
+            Encoded value.
+
+        RETURNS
+        -------
+        str
+            The value, or None if the none marker is given.
+        """
+        if value == FullFormLexicon.NONE:
+            return None
+        return value
+
+    @staticmethod
+    def encodeParses(parses: list) -> str:
+        """
+        Encodes the analyses of a surface form. Each analysis is given with a marker showing whether it is an analysis
+        of the proper form, of the lowercase form, or of both.
+
+        PARAMETERS
+        ----------
+        parses : list
+            List of (marker, PartialFsmParse) tuples.
+
+        RETURNS
+        -------
+        str
+            Encoded analyses.
+        """
+        records = []
+        for marker, parse in parses:
+            nodes = []
+            node = parse
+            while node.getParent() is not None:
+                nodes.append(node)
+                node = node.getParent()
+            root = parse.getWord()
+            fields = [marker, root.getName(), FullFormLexicon.rootKey(root)[len(root.getName()) + 1:],
+                      str(parse.getStartState().getIndex())]
+            for i in range(len(nodes) - 1, -1, -1):
+                node = nodes[i]
+                fields.append(str(node.getFinalSuffix().getIndex()))
+                fields.append(node.getSurfaceForm())
+                fields.append(FullFormLexicon.__encodeValue(node.getTransition()))
+                fields.append(FullFormLexicon.__encodeValue(node.getWithName()))
+                fields.append(FullFormLexicon.__encodeValue(node.getToPos()))
+            records.append(FullFormLexicon.FIELD_SEPARATOR.join(fields))
+        return FullFormLexicon.RECORD_SEPARATOR.join(records)
+
+    @staticmethod
+    def write(fileName: str,
+              entries: dict,
+              roots: set,
+              maxLength: int):
+        """
+        Writes a full form lexicon file.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the file to write.
+        entries : dict
+            Map from the surface forms to their analyses encoded with encodeParses.
+        roots : set
+            Keys of the roots, as returned by rootKey, used while computing the analyses.
+        maxLength : int
+            Maximum length of the surface forms generated for the lexicon.
+        """
+        keys = sorted(entries.keys())
+        with open(fileName, "wb") as output:
+            output.write(FullFormLexicon.MAGIC)
+            output.write(bytes(FullFormLexicon.HEADER.size))
+            block_offsets = []
+            previous = b""
+            for i in range(len(keys)):
+                key = keys[i].encode("utf8")
+                if i % FullFormLexicon.BLOCK_SIZE == 0:
+                    block_offsets.append(output.tell())
+                    common = 0
+                else:
+                    common = 0
+                    length = min(len(key), len(previous))
+                    while common < length and key[common] == previous[common]:
+                        common = common + 1
+                output.write(FullFormLexicon.KEY_HEADER.pack(common, len(key) - common))
+                output.write(key[common:])
+                payload = entries[keys[i]].encode("utf8")
+                output.write(FullFormLexicon.LENGTH.pack(len(payload)))
+                output.write(payload)
+                previous = key
+            index_offset = output.tell()
+            for offset in block_offsets:
+                output.write(FullFormLexicon.OFFSET.pack(offset))
+            roots_offset = output.tell()
+            encoded_roots = FullFormLexicon.RECORD_SEPARATOR.join(sorted(roots)).encode("utf8")
+            output.write(FullFormLexicon.LENGTH.pack(len(encoded_roots)))
+            output.write(encoded_roots)
+            output.seek(len(FullFormLexicon.MAGIC))
+            output.write(FullFormLexicon.HEADER.pack(maxLength, len(keys), len(block_offsets), index_offset,
+                                                     roots_offset))
+
+    def __blockOffset(self, index: int) -> int:
+        """
+        Returns the position of the block with the given index in the file.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the block.
+
+        RETURNS
+        -------
+        int
+            Offset of the block.
+        """
+        position = self.__index_offset + index * FullFormLexicon.OFFSET.size
+        return FullFormLexicon.OFFSET.unpack_from(self.__map, position)[0]
+
+    def getPayload(self, surfaceForm: str):
+        """
+        Returns the encoded analyses of the given surface form.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to search.
+
+        RETURNS
+        -------
+        str
+            Encoded analyses of the surface form, None if the surface form is not in the lexicon.
+        """
+        key = surfaceForm.encode("utf8")
+        block = bisect.bisect_right(self.__first_keys, key) - 1
+        if block < 0:
+            return None
+        offset = self.__blockOffset(block)
+        count = min(FullFormLexicon.BLOCK_SIZE, self.__entry_count - block * FullFormLexicon.BLOCK_SIZE)
+        current = b""
+        for i in range(count):
+            common, suffix_length = FullFormLexicon.KEY_HEADER.unpack_from(self.__map, offset)
+            offset = offset + FullFormLexicon.KEY_HEADER.size
+            current = current[:common] + self.__map[offset: offset + suffix_length]
+            offset = offset + suffix_length
+            payload_length = FullFormLexicon.LENGTH.unpack_from(self.__map, offset)[0]
+            offset = offset + FullFormLexicon.LENGTH.size
+            if current == key:
+                return self.__map[offset: offset + payload_length].decode("utf8")
+            if current > key:
+                return None
+            offset = offset + payload_length
+        return None
+
+    def lookup(self,
+               surfaceForm: str,
+               isProper: bool,
+               trieWords: set,
+               finiteStateMachine: FiniteStateMachine):
+        """
+        Returns the analyses of the given surface form stored in the lexicon. The stored analyses are only valid if
+        the roots that can start the surface form are the same as the roots used while building the lexicon, therefore
+        if one of the given roots is not known by the lexicon, None is returned and the analyses should be computed
+        with the finite state machine.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Lowercase surface form to analyze.
+        isProper : bool
+            True if the surface form is a proper noun.
+        trieWords : set
+            Dictionary words that can be the root of the surface form.
+        finiteStateMachine : FiniteStateMachine
+            Finite state machine used while building the lexicon.
+
+        RETURNS
+        -------
+        list
+            List of FsmParse, or None if the surface form can not be answered from the lexicon.
+        """
+        if len(surfaceForm) > self.__max_length:
+            return None
+        roots = {}
+        for word in trieWords:
+            root_key = FullFormLexicon.rootKey(word)
+            if root_key not in self.__roots:
+                return None
+            roots[root_key] = word
+        payload = self.getPayload(surfaceForm)
+        if payload is None:
+            return None
+        result = []
+        for record in payload.split(FullFormLexicon.RECORD_SEPARATOR):
+            fields = record.split(FullFormLexicon.FIELD_SEPARATOR)
+            if fields[0] == FullFormLexicon.ONLY_PROPER and not isProper:
+                continue
+            if fields[0] == FullFormLexicon.ONLY_NOT_PROPER and isProper:
+                continue
+            if len(fields[2]) > 0:
+                root_key = fields[1] + " " + fields[2]
+            else:
+                root_key = fields[1]
+            if root_key in roots:
+                root = roots[root_key]
+            else:
+                root = TxtWord(fields[1])
+                if len(fields[2]) > 0:
+                    for flag in fields[2].split(" "):
+                        root.addFlag(flag)
+            parse = PartialFsmParse(root, finiteStateMachine.getStateWithIndex(int(fields[3])), root.getName())
+            for i in range(4, len(fields), 5):
+                parse = parse.addSuffix(finiteStateMachine.getStateWithIndex(int(fields[i])), fields[i + 1],
+                                        FullFormLexicon.__decodeValue(fields[i + 2]),
+                                        FullFormLexicon.__decodeValue(fields[i + 3]),
+                                        FullFormLexicon.__decodeValue(fields[i + 4]))
+            fsm_parse = parse.toFsmParse()
+            fsm_parse.constructInflectionalGroups()
+            result.append(fsm_parse)
+        return result
+
+    def getMaxLength(self) -> int:
+        """
+        Getter for the maximum length of the surface forms in the lexicon.
+
+        RETURNS
+        -------
+        int
+            Maximum length used while building the lexicon.
+        """
+        return self.__max_length
+
+    def size(self) -> int:
+        """
+        Returns the number of surface forms in the lexicon.
+
+        RETURNS
+        -------
+        int
+            Number of surface forms.
+        """
+        return self.__entry_count
+
+    def close(self):
+        """
+        Closes the memory map and the lexicon file.
+        """
+        self.__map.close()
+        self.__file.close()
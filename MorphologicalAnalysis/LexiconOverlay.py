@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+
+from Dictionary.Trie.Trie import Trie
+from Dictionary.TxtWord import TxtWord
+
+
+class LexiconOverlay:
+
+    __trie: Trie
+    __flagged_roots: dict
+    __parent: LexiconOverlay
+    __lock: threading.Lock
+    __size: int
+
+    def __init__(self, parent=None):
+        """
+        Constructor of LexiconOverlay class. The overlay stores the roots added to a read-only dictionary trie and the
+        copies of the dictionary roots whose flags are changed, without modifying the trie or the dictionary. The words
+        of an overlay are added to the words of its parent overlay, so a short-lived overlay can extend a long-lived
+        one. The overlay can be read and extended by several threads at the same time.
+
+        PARAMETERS
+        ----------
+        parent : LexiconOverlay
+            Overlay extended by this overlay, None if the overlay only extends the trie.
+        """
+        self.__trie = Trie()
+        self.__flagged_roots = {}
+        self.__parent = parent
+        self.__lock = threading.Lock()
+        self.__size = 0
+
+    def addRoot(self,
+                key: str,
+                root: TxtWord):
+        """
+        Adds a new root under the given prefix.
+
+        PARAMETERS
+        ----------
+        key : str
+            Prefix of the surface forms under which the root is stored.
+        root : TxtWord
+            Root to add.
+        """
+        with self.__lock:
+            self.__trie.addWord(key, root)
+            self.__size += 1
+
+    def replaceRoot(self,
+                    root: TxtWord,
+                    flaggedRoot: TxtWord):
+        """
+        Replaces a root of the trie with a copy of it, whose flags are changed.
+
+        PARAMETERS
+        ----------
+        root : TxtWord
+            Root of the trie.
+        flaggedRoot : TxtWord
+            Copy of the root returned instead of it.
+        """
+        with self.__lock:
+            self.__flagged_roots[id(root)] = (root, flaggedRoot)
+            self.__size += 1
+
+    def getRoot(self, root: TxtWord) -> TxtWord:
+        """
+        Returns the root replacing the given root of the trie in this overlay or in its parents.
+
+        PARAMETERS
+        ----------
+        root : TxtWord
+            Root of the trie.
+
+        RETURNS
+        -------
+        TxtWord
+            Copy of the root with changed flags, the root itself if it is not replaced.
+        """
+        overlay = self
+        while overlay is not None:
+            entry = overlay.__flagged_roots.get(id(root))
+            if entry is not None and entry[0] is root:
+                return entry[1]
+            overlay = overlay.__parent
+        return root
+
+    def getWordsWithPrefix(self,
+                           trie: Trie,
+                           surfaceForm: str) -> set:
+        """
+        Returns the roots stored in the given trie under the prefixes of the given surface form, where the replaced
+        roots are substituted, together with the roots added to this overlay and to its parents.
+
+        PARAMETERS
+        ----------
+        trie : Trie
+            Read-only trie extended by the overlay.
+        surfaceForm : str
+            Surface form to search.
+
+        RETURNS
+        -------
+        set
+            Possible roots of the surface form.
+        """
+        words = trie.getWordsWithPrefix(surfaceForm)
+        overlay = self
+        replaced = False
+        while overlay is not None:
+            replaced = replaced or len(overlay.__flagged_roots) > 0
+            overlay = overlay.__parent
+        if replaced:
+            words = {self.getRoot(word) for word in words}
+        overlay = self
+        while overlay is not None:
+            if overlay.__size > 0:
+                with overlay.__lock:
+                    words.update(overlay.__trie.getWordsWithPrefix(surfaceForm))
+            overlay = overlay.__parent
+        return words
+
+    def getLock(self) -> threading.Lock:
+        """
+        Getter for the lock guarding the roots added to the overlay. It is held by FsmMorphologicalAnalyzer while the
+        process forks, so that the child process does not inherit it locked by another thread.
+
+        RETURNS
+        -------
+        threading.Lock
+            Lock of the overlay.
+        """
+        return self.__lock
+
+    def resetLock(self):
+        """
+        Replaces the lock of the overlay with a new one. It is called in a child process after a fork, where the
+        inherited lock may be held by a thread that does not exist in the child.
+        """
+        self.__lock = threading.Lock()
+
+    def size(self) -> int:
+        """
+        Returns the number of roots added or replaced in this overlay, without its parents.
+
+        RETURNS
+        -------
+        int
+            Number of roots of the overlay.
+        """
+        return self.__size
+
+    def isEmpty(self) -> bool:
+        """
+        Checks whether neither this overlay nor its parents contain any root.
+
+        RETURNS
+        -------
+        bool
+            True if the overlay does not change the words of the trie, False otherwise.
+        """
+        overlay = self
+        while overlay is not None:
+            if overlay.__size > 0:
+                return False
+            overlay = overlay.__parent
+        return True
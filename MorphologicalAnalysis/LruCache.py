@@ -0,0 +1,103 @@
+import collections
+
+
+class LruCache:
+
+    __cache_size: int
+    __map: collections.OrderedDict
+
+    def __init__(self, cacheSize: int):
+        """
+        Constructor of LruCache class. The cache is limited by the number of its entries and evicts the least recently
+        used entry when it is full, like the LRUCache of DataStructure. Unlike that class, its entries can be read
+        with peek without changing their recency.
+
+        PARAMETERS
+        ----------
+        cacheSize : int
+            Maximum number of entries.
+        """
+        self.__cache_size = cacheSize
+        self.__map = collections.OrderedDict()
+
+    def contains(self, key: object) -> bool:
+        """
+        Checks whether the given key is in the cache. It does not count as an access to the key.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to check.
+
+        RETURNS
+        -------
+        bool
+            True if the key is in the cache, False otherwise.
+        """
+        return key in self.__map
+
+    def get(self, key: object) -> object:
+        """
+        Returns the value of the given key and makes it the most recently used entry.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to search.
+
+        RETURNS
+        -------
+        object
+            Value of the key, None if the key is not in the cache.
+        """
+        if key in self.__map:
+            self.__map.move_to_end(key)
+            return self.__map[key]
+        return None
+
+    def peek(self, key: object) -> object:
+        """
+        Returns the value of the given key without changing its recency.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to search.
+
+        RETURNS
+        -------
+        object
+            Value of the key, None if the key is not in the cache.
+        """
+        return self.__map.get(key)
+
+    def add(self,
+            key: object,
+            data: object):
+        """
+        Adds the given entry as the most recently used one. If the cache is full, the least recently used entry is
+        evicted first.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key of the entry.
+        data : object
+            Value of the entry.
+        """
+        if key in self.__map:
+            self.__map.move_to_end(key)
+        elif len(self.__map) >= self.__cache_size:
+            self.__map.popitem(last=False)
+        self.__map[key] = data
+
+    def size(self) -> int:
+        """
+        Returns the number of entries in the cache.
+
+        RETURNS
+        -------
+        int
+            Number of entries.
+        """
+        return len(self.__map)
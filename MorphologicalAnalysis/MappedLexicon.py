@@ -0,0 +1,579 @@
+import array
+import mmap
+import struct
+import zlib
+
+from Dictionary.Trie.Trie import Trie
+from Dictionary.TxtDictionary import TxtDictionary
+from Dictionary.TxtWord import TxtWord
+
+
+class MappedLexicon:
+
+    __buffer: memoryview
+    __mmap: mmap.mmap
+    __views: list
+    __word_offsets: memoryview
+    __word_data: memoryview
+    __name_order: memoryview
+    __key_offsets: memoryview
+    __key_data: memoryview
+    __key_table: memoryview
+    __posting_offsets: memoryview
+    __postings: memoryview
+    __misspelled_offsets: memoryview
+    __misspelled_data: memoryview
+    __words: dict
+
+    MAGIC = b"FSMLEX1\x00"
+    BYTE_ORDER_MARK = 0x01020304
+    HEADER = struct.Struct("=9I")
+
+    def __init__(self, source):
+        """
+        Constructor of MappedLexicon class. The lexicon contains the words of a dictionary with their flags, the keys
+        under which they are stored in the dictionary trie and the misspelled words, in flat arrays of a file written
+        with save. The arrays are read directly from the memory map of the file or from the given buffer, so any
+        number of processes can attach to the same lexicon without loading it and share its pages. Only the words
+        returned by the lexicon are created as TxtWord objects, once for each process.
+
+        The lexicon can be used both as the dictionary and as the dictionary trie of an AnalyzerCore, see
+        AnalyzerCore.fromMappedLexicon.
+
+        PARAMETERS
+        ----------
+        source : str or buffer
+            Name of the lexicon file, or a buffer containing it, such as the buffer of a SharedMemory.
+        """
+        if isinstance(source, str):
+            with open(source, "rb") as input_file:
+                self.__mmap = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.__buffer = memoryview(self.__mmap)
+        else:
+            self.__mmap = None
+            self.__buffer = memoryview(source)
+        self.__views = []
+        magic = MappedLexicon.MAGIC
+        if len(self.__buffer) < len(magic) + MappedLexicon.HEADER.size or self.__buffer[:len(magic)] != magic:
+            self.close()
+            raise ValueError("The source is not a mapped lexicon")
+        header = MappedLexicon.HEADER.unpack_from(self.__buffer, len(magic))
+        if header[0] != MappedLexicon.BYTE_ORDER_MARK:
+            self.close()
+            raise ValueError("The mapped lexicon was written on a platform with another byte order")
+        word_count, key_count, slot_count, posting_count, misspelled_count, word_bytes, key_bytes, \
+            misspelled_bytes = header[1:]
+        offset = len(magic) + MappedLexicon.HEADER.size
+        self.__word_offsets, offset = self.__integers(offset, word_count + 1)
+        self.__name_order, offset = self.__integers(offset, word_count)
+        self.__key_offsets, offset = self.__integers(offset, key_count + 1)
+        self.__key_table, offset = self.__integers(offset, slot_count)
+        self.__posting_offsets, offset = self.__integers(offset, key_count + 1)
+        self.__postings, offset = self.__integers(offset, posting_count)
+        self.__misspelled_offsets, offset = self.__integers(offset, 2 * misspelled_count + 1)
+        self.__word_data = self.__view(offset, word_bytes)
+        offset = offset + word_bytes
+        self.__key_data = self.__view(offset, key_bytes)
+        offset = offset + key_bytes
+        self.__misspelled_data = self.__view(offset, misspelled_bytes)
+        self.__words = {}
+
+    def __view(self,
+               offset: int,
+               length: int) -> memoryview:
+        """
+        Returns the part of the buffer of the given length starting at the given offset, without copying it.
+
+        PARAMETERS
+        ----------
+        offset : int
+            Offset of the part in bytes.
+        length : int
+            Length of the part in bytes.
+
+        RETURNS
+        -------
+        memoryview
+            View of the part of the buffer.
+        """
+        view = self.__buffer[offset: offset + length]
+        self.__views.append(view)
+        return view
+
+    def __integers(self,
+                   offset: int,
+                   count: int) -> tuple:
+        """
+        Returns the array of unsigned integers of the given length starting at the given offset of the buffer.
+
+        PARAMETERS
+        ----------
+        offset : int
+            Offset of the array in bytes.
+        count : int
+            Number of integers.
+
+        RETURNS
+        -------
+        tuple
+            Array as a memoryview and the offset following the array.
+        """
+        view = self.__view(offset, 4 * count).cast("I")
+        self.__views.append(view)
+        return view, offset + 4 * count
+
+    @staticmethod
+    def __softenedKey(last: str,
+                      root: str) -> str:
+        """
+        Returns the key of a root whose last consonant softens during suffixation, as in the addWordWhenRootSoften
+        method of TxtDictionary.
+
+        PARAMETERS
+        ----------
+        last : str
+            Last character of the word.
+        root : str
+            Word without its last one or two characters.
+
+        RETURNS
+        -------
+        str
+            Key of the softened root, None if the last character does not soften.
+        """
+        if last == 'p':
+            return root + 'b'
+        elif last == 'ç':
+            return root + 'c'
+        elif last == 't':
+            return root + 'd'
+        elif last == 'k' or last == 'g':
+            return root + 'ğ'
+        return None
+
+    @staticmethod
+    def __wordKeys(word: TxtWord,
+                   lastBefore: str) -> list:
+        """
+        Returns the keys under which the prepareTrie method of TxtDictionary stores the given word, that is the word
+        itself and its variants after vowel drops, softening, portmanteau changes and vowel changes.
+
+        PARAMETERS
+        ----------
+        word : TxtWord
+            Word of the dictionary.
+        lastBefore : str
+            Character before the last character of the word. As in prepareTrie, for a word of one character it is the
+            one of the previous word.
+
+        RETURNS
+        -------
+        list
+            Keys of the word.
+        """
+        keys = []
+        root = word.getName()
+        length = len(root)
+        if root == "ben":
+            keys.append("bana")
+        if root == "sen":
+            keys.append("sana")
+        root_without_last = root[0:length - 1]
+        root_without_last_two = root[0:length - 2] if length > 1 else ""
+        last = root[length - 1]
+        keys.append(root)
+        if word.lastIdropsDuringSuffixation() or word.lastIdropsDuringPassiveSuffixation():
+            if word.rootSoftenDuringSuffixation():
+                keys.append(MappedLexicon.__softenedKey(last, root_without_last_two))
+            else:
+                keys.append(root_without_last_two + last)
+        if word.isPortmanteauEndingWithSI():
+            keys.append(root_without_last_two)
+        if word.rootSoftenDuringSuffixation():
+            keys.append(MappedLexicon.__softenedKey(last, root_without_last))
+        if word.isPortmanteau():
+            if word.isPortmanteauFacedVowelEllipsis():
+                keys.append(root_without_last_two + last + lastBefore)
+            elif word.isPortmanteauFacedSoftening():
+                if lastBefore == 'b':
+                    keys.append(root_without_last_two + 'p')
+                elif lastBefore == 'c':
+                    keys.append(root_without_last_two + 'ç')
+                elif lastBefore == 'd':
+                    keys.append(root_without_last_two + 't')
+                elif lastBefore == 'ğ':
+                    keys.append(root_without_last_two + 'k')
+            else:
+                keys.append(root_without_last)
+        if (word.vowelEChangesToIDuringYSuffixation() or word.vowelAChangesToIDuringYSuffixation()) and \
+                (last == 'e' or last == 'a'):
+            keys.append(root_without_last)
+        if word.endingKChangesIntoG():
+            keys.append(root_without_last + 'g')
+        return [key for key in keys if key is not None]
+
+    @staticmethod
+    def __trieKeys(dictionary: TxtDictionary,
+                   trie: Trie) -> dict:
+        """
+        Returns the keys of the trie prepared from the given dictionary with the words stored under them. The keys are
+        computed from the words in the same way as the prepareTrie method of TxtDictionary, and each of them is
+        checked in the given trie.
+
+        PARAMETERS
+        ----------
+        dictionary : TxtDictionary
+            Dictionary whose trie is written.
+        trie : Trie
+            Trie of the dictionary, see TxtDictionary.prepareTrie.
+
+        RETURNS
+        -------
+        dict
+            Map from the keys to the sets of words stored under them.
+        """
+        keys = {}
+        last_before = ' '
+        for i in range(dictionary.size()):
+            word = dictionary.getWordWithIndex(i)
+            if not isinstance(word, TxtWord):
+                continue
+            if len(word.getName()) > 1:
+                last_before = word.getName()[-2]
+            for key in MappedLexicon.__wordKeys(word, last_before):
+                keys.setdefault(key, set()).add(word)
+        for key, words in keys.items():
+            if not words.issubset(trie.getWordsWithPrefix(key)):
+                raise ValueError("The trie is not prepared from the dictionary, the words of " + key + " differ")
+        return keys
+
+    @staticmethod
+    def save(fileName: str,
+             dictionary: TxtDictionary,
+             trie: Trie,
+             misspelledWords: dict):
+        """
+        Writes the words of the given dictionary, the keys of the given trie prepared from the dictionary and the
+        given misspelled words to a lexicon file. The words keep their order in the dictionary. The keys are found with
+        a hash table with linear probing on their CRC-32, the names of the words and the misspelled words are sorted,
+        so that they can be searched with binary search. A ValueError is raised if the trie or the misspelled words do
+        not belong to the dictionary.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the lexicon file.
+        dictionary : TxtDictionary
+            Dictionary to write.
+        trie : Trie
+            Trie of the dictionary, see TxtDictionary.prepareTrie.
+        misspelledWords : dict
+            Map from the misspelled words of the dictionary to their correct forms.
+        """
+        for misspelled, correct in misspelledWords.items():
+            if dictionary.getCorrectForm(misspelled) != correct:
+                raise ValueError("The misspelled word " + misspelled + " does not belong to the dictionary")
+        word_offsets = array.array("I", [0])
+        word_data = bytearray()
+        word_indexes = {}
+        names = []
+        for i in range(dictionary.size()):
+            word = dictionary.getWordWithIndex(i)
+            flags = word.__str__()[len(word.getName()) + 1:]
+            morphology = word.getMorphology() if isinstance(word, TxtWord) else ""
+            word_data += (word.getName() + "\0" + flags + "\0" + morphology).encode("utf8")
+            word_offsets.append(len(word_data))
+            word_indexes[id(word)] = i
+            names.append((word.getName().encode("utf8"), i))
+        name_order = array.array("I", [i for _, i in sorted(names)])
+        keys = sorted((key.encode("utf8"), words) for key, words in MappedLexicon.__trieKeys(dictionary, trie).items())
+        key_offsets = array.array("I", [0])
+        key_data = bytearray()
+        slot_count = 1
+        while slot_count < 2 * len(keys):
+            slot_count = 2 * slot_count
+        key_table = array.array("I", [0] * slot_count)
+        posting_offsets = array.array("I", [0])
+        postings = array.array("I")
+        for key, words in keys:
+            slot = zlib.crc32(key) & (slot_count - 1)
+            while key_table[slot] != 0:
+                slot = (slot + 1) & (slot_count - 1)
+            key_table[slot] = len(key_offsets)
+            key_data += key
+            key_offsets.append(len(key_data))
+            postings.extend(sorted(word_indexes[id(word)] for word in words))
+            posting_offsets.append(len(postings))
+        misspelled_offsets = array.array("I", [0])
+        misspelled_data = bytearray()
+        for misspelled, correct in sorted((key.encode("utf8"), value.encode("utf8"))
+                                          for key, value in misspelledWords.items()):
+            misspelled_data += misspelled
+            misspelled_offsets.append(len(misspelled_data))
+            misspelled_data += correct
+            misspelled_offsets.append(len(misspelled_data))
+        with open(fileName, "wb") as output_file:
+            output_file.write(MappedLexicon.MAGIC)
+            output_file.write(MappedLexicon.HEADER.pack(MappedLexicon.BYTE_ORDER_MARK, dictionary.size(), len(keys),
+                                                        slot_count, len(postings), len(misspelledWords), len(word_data),
+                                                        len(key_data), len(misspelled_data)))
+            for integers in (word_offsets, name_order, key_offsets, key_table, posting_offsets, postings,
+                             misspelled_offsets):
+                output_file.write(integers.tobytes())
+            output_file.write(word_data)
+            output_file.write(key_data)
+            output_file.write(misspelled_data)
+
+    def __word(self, index: int) -> TxtWord:
+        """
+        Returns the word with the given index, and creates it from the buffer if it is not created yet. Each word is
+        created once, so the same object is returned for a word.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the word.
+
+        RETURNS
+        -------
+        TxtWord
+            Word with the given index.
+        """
+        word = self.__words.get(index)
+        if word is None:
+            data = bytes(self.__word_data[self.__word_offsets[index]: self.__word_offsets[index + 1]])
+            name, flags, morphology = data.decode("utf8").split("\0")
+            word = TxtWord(name)
+            for flag in flags.split():
+                word.addFlag(flag)
+            if len(morphology) > 0:
+                word.setMorphology(morphology)
+            word = self.__words.setdefault(index, word)
+        return word
+
+    def __name(self, index: int) -> bytes:
+        """
+        Returns the encoded name of the word with the given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the word.
+
+        RETURNS
+        -------
+        bytes
+            Name of the word in UTF-8.
+        """
+        data = bytes(self.__word_data[self.__word_offsets[index]: self.__word_offsets[index + 1]])
+        return data[:data.index(0)]
+
+    def __key(self, index: int) -> bytes:
+        """
+        Returns the key of the trie with the given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the key.
+
+        RETURNS
+        -------
+        bytes
+            Key in UTF-8.
+        """
+        return bytes(self.__key_data[self.__key_offsets[index]: self.__key_offsets[index + 1]])
+
+    def __findKey(self, key: bytes) -> int:
+        """
+        Returns the index of the given key of the trie.
+
+        PARAMETERS
+        ----------
+        key : bytes
+            Key to search in UTF-8.
+
+        RETURNS
+        -------
+        int
+            Index of the key, -1 if the key is not in the trie.
+        """
+        table = self.__key_table
+        mask = len(table) - 1
+        slot = zlib.crc32(key) & mask
+        while table[slot] != 0:
+            index = table[slot] - 1
+            if self.__key(index) == key:
+                return index
+            slot = (slot + 1) & mask
+        return -1
+
+    def __keyWords(self, index: int) -> set:
+        """
+        Returns the words stored under the key with the given index.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the key.
+
+        RETURNS
+        -------
+        set
+            Words of the key.
+        """
+        return {self.__word(self.__postings[i])
+                for i in range(self.__posting_offsets[index], self.__posting_offsets[index + 1])}
+
+    def getWordsWithPrefix(self, surfaceForm: str) -> set:
+        """
+        Returns the words stored under the prefixes of the given surface form, like the getWordsWithPrefix method of
+        the dictionary trie.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to search.
+
+        RETURNS
+        -------
+        set
+            Words of the prefixes.
+        """
+        words = set()
+        for i in range(1, len(surfaceForm) + 1):
+            index = self.__findKey(surfaceForm[:i].encode("utf8"))
+            if index >= 0:
+                words.update(self.__keyWords(index))
+        return words
+
+    def getCompundWordStartingWith(self, _hash: str) -> TxtWord:
+        """
+        Returns a portmanteau word stored under the given key, like the getCompundWordStartingWith method of the
+        dictionary trie.
+
+        PARAMETERS
+        ----------
+        _hash : str
+            Key to search.
+
+        RETURNS
+        -------
+        TxtWord
+            Portmanteau word of the key, None if there is none.
+        """
+        index = self.__findKey(_hash.encode("utf8"))
+        if index >= 0:
+            for word in self.__keyWords(index):
+                if word.isPortmanteau():
+                    return word
+        return None
+
+    def getWord(self, name: str) -> TxtWord:
+        """
+        Returns the word with the given name.
+
+        PARAMETERS
+        ----------
+        name : str
+            Name of the word.
+
+        RETURNS
+        -------
+        TxtWord
+            Word with the given name, None if it is not in the lexicon.
+        """
+        key = name.encode("utf8")
+        low = 0
+        high = len(self.__name_order)
+        while low < high:
+            middle = (low + high) // 2
+            if self.__name(self.__name_order[middle]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self.__name_order) and self.__name(self.__name_order[low]) == key:
+            return self.__word(self.__name_order[low])
+        return None
+
+    def getWordWithIndex(self, index: int) -> TxtWord:
+        """
+        Returns the word with the given index in the dictionary.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the word.
+
+        RETURNS
+        -------
+        TxtWord
+            Word with the given index.
+        """
+        return self.__word(index)
+
+    def size(self) -> int:
+        """
+        Returns the number of words in the lexicon.
+
+        RETURNS
+        -------
+        int
+            Number of words.
+        """
+        return len(self.__name_order)
+
+    def getCorrectForm(self, misspelledWord: str) -> str:
+        """
+        Returns the correct form of the given misspelled word.
+
+        PARAMETERS
+        ----------
+        misspelledWord : str
+            Misspelled word.
+
+        RETURNS
+        -------
+        str
+            Correct form of the word, empty string if the word is not a known misspelling.
+        """
+        key = misspelledWord.encode("utf8")
+        offsets = self.__misspelled_offsets
+        low = 0
+        high = (len(offsets) - 1) // 2
+        while low < high:
+            middle = (low + high) // 2
+            if bytes(self.__misspelled_data[offsets[2 * middle]: offsets[2 * middle + 1]]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < (len(offsets) - 1) // 2 and \
+                bytes(self.__misspelled_data[offsets[2 * low]: offsets[2 * low + 1]]) == key:
+            return bytes(self.__misspelled_data[offsets[2 * low + 1]: offsets[2 * low + 2]]).decode("utf8")
+        return ""
+
+    def getMisspelledWords(self) -> dict:
+        """
+        Returns the misspelled words of the lexicon with their correct forms.
+
+        RETURNS
+        -------
+        dict
+            Map from the misspelled words to their correct forms.
+        """
+        offsets = self.__misspelled_offsets
+        result = {}
+        for i in range((len(offsets) - 1) // 2):
+            result[bytes(self.__misspelled_data[offsets[2 * i]: offsets[2 * i + 1]]).decode("utf8")] = \
+                bytes(self.__misspelled_data[offsets[2 * i + 1]: offsets[2 * i + 2]]).decode("utf8")
+        return result
+
+    def close(self):
+        """
+        Releases the buffer and closes the memory map of the lexicon. The words already returned stay valid.
+        """
+        for view in reversed(self.__views):
+            view.release()
+        self.__buffer.release()
+        if self.__mmap is not None:
+            self.__mmap.close()
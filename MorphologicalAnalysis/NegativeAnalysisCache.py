@@ -0,0 +1,153 @@
+class NegativeAnalysisCache:
+
+    __entries: dict
+    __buckets: dict
+    __max_size: int
+    __hits: int
+    __invalidations: int
+
+    BUCKET_LENGTH = 2
+
+    def __init__(self, maxSize=100000):
+        """
+        Constructor of NegativeAnalysisCache class. The cache stores the keys of the surface forms without any analysis,
+        such as typos, urls or foreign words, so that they are not searched again each time they occur. Since the
+        analyses of a surface form only depend on the roots stored in the trie with a prefix of the surface form, the
+        keys are grouped by the first characters of their lowercase form and, when a root is added to the trie, only
+        the keys starting with the root are removed. When the cache is full, the oldest key is removed.
+
+        PARAMETERS
+        ----------
+        maxSize : int
+            Maximum number of surface forms stored in the cache.
+        """
+        self.__entries = {}
+        self.__buckets = {}
+        self.__max_size = maxSize
+        self.__hits = 0
+        self.__invalidations = 0
+
+    def contains(self, key: tuple) -> bool:
+        """
+        Checks whether the given key is known to have no analysis.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by AnalysisCache.normalizedKey.
+
+        RETURNS
+        -------
+        bool
+            True if the surface form of the key has no analysis, False otherwise.
+        """
+        if key in self.__entries:
+            self.__hits += 1
+            return True
+        return False
+
+    def add(self, key: tuple):
+        """
+        Stores the given key as a key without any analysis. If the cache is full, the oldest key is removed first.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by AnalysisCache.normalizedKey.
+        """
+        if self.__max_size <= 0 or key in self.__entries:
+            return
+        if len(self.__entries) >= self.__max_size:
+            self.__remove(next(iter(self.__entries)))
+        self.__entries[key] = None
+        bucket = key[0][:NegativeAnalysisCache.BUCKET_LENGTH]
+        if bucket not in self.__buckets:
+            self.__buckets[bucket] = set()
+        self.__buckets[bucket].add(key)
+
+    def __remove(self, key: tuple):
+        """
+        Removes the given key from the entries and from its bucket.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key to remove.
+        """
+        del self.__entries[key]
+        bucket = key[0][:NegativeAnalysisCache.BUCKET_LENGTH]
+        keys = self.__buckets[bucket]
+        keys.discard(key)
+        if len(keys) == 0:
+            del self.__buckets[bucket]
+
+    def invalidate(self, prefix=""):
+        """
+        Removes the keys whose lowercase form starts with the given prefix. It is called when a root is added to the
+        trie or the flags of a root are changed, since the surface forms starting with that root may have an analysis
+        afterwards. An empty prefix removes all keys.
+
+        PARAMETERS
+        ----------
+        prefix : str
+            Prefix of the surface forms to remove.
+        """
+        if len(self.__entries) == 0:
+            return
+        self.__invalidations += 1
+        if len(prefix) == 0:
+            self.__entries.clear()
+            self.__buckets.clear()
+            return
+        if len(prefix) >= NegativeAnalysisCache.BUCKET_LENGTH:
+            buckets = [prefix[:NegativeAnalysisCache.BUCKET_LENGTH]]
+        else:
+            buckets = [bucket for bucket in self.__buckets if bucket.startswith(prefix)]
+        for bucket in buckets:
+            keys = self.__buckets.get(bucket)
+            if keys is None:
+                continue
+            for key in [key for key in keys if key[0].startswith(prefix)]:
+                self.__remove(key)
+
+    def size(self) -> int:
+        """
+        Returns the number of keys stored.
+
+        RETURNS
+        -------
+        int
+            Number of surface forms without any analysis stored in the cache.
+        """
+        return len(self.__entries)
+
+    def getHits(self) -> int:
+        """
+        Getter for the number of lookups answered by the cache.
+
+        RETURNS
+        -------
+        int
+            Number of hits.
+        """
+        return self.__hits
+
+    def getInvalidations(self) -> int:
+        """
+        Getter for the number of invalidations removing keys from the cache.
+
+        RETURNS
+        -------
+        int
+            Number of invalidations.
+        """
+        return self.__invalidations
+
+    def clear(self):
+        """
+        Removes all keys and resets the counters.
+        """
+        self.__entries.clear()
+        self.__buckets.clear()
+        self.__hits = 0
+        self.__invalidations = 0
@@ -0,0 +1,100 @@
+import heapq
+from collections import deque
+
+from MorphologicalAnalysis.FrontierType import FrontierType
+
+
+class ParseFrontier:
+
+    __frontier_type: FrontierType
+    __items: deque
+    __heap: list
+    __counter: int
+
+    def __init__(self,
+                 frontierType=FrontierType.BREADTH_FIRST,
+                 parses=None):
+        """
+        Constructor of ParseFrontier class. The frontier holds the partial parses waiting to be expanded during the
+        morphological search. Breadth first and depth first frontiers keep the parses in a deque, the longest surface
+        first frontier keeps them in a heap ordered by the length of the surface form consumed so far. Parses with the
+        same length are expanded in the order they are added.
+
+        PARAMETERS
+        ----------
+        frontierType : FrontierType
+            Order in which the parses are expanded.
+        parses : list
+            Initial parses of the frontier.
+        """
+        self.__frontier_type = frontierType
+        self.__items = deque()
+        self.__heap = []
+        self.__counter = 0
+        if parses is not None:
+            for parse in parses:
+                self.add(parse)
+
+    def add(self, parse):
+        """
+        Adds a parse to the frontier.
+
+        PARAMETERS
+        ----------
+        parse : PartialFsmParse
+            Parse to be expanded later.
+        """
+        if self.__frontier_type == FrontierType.LONGEST_SURFACE_FIRST:
+            heapq.heappush(self.__heap, (-len(parse.getSurfaceForm()), self.__counter, parse))
+            self.__counter = self.__counter + 1
+        else:
+            self.__items.append(parse)
+
+    def remove(self):
+        """
+        Removes and returns the next parse to be expanded.
+
+        RETURNS
+        -------
+        PartialFsmParse
+            Next parse according to the frontier type.
+        """
+        if self.__frontier_type == FrontierType.BREADTH_FIRST:
+            return self.__items.popleft()
+        elif self.__frontier_type == FrontierType.DEPTH_FIRST:
+            return self.__items.pop()
+        else:
+            return heapq.heappop(self.__heap)[2]
+
+    def isEmpty(self) -> bool:
+        """
+        Checks if there is no parse left in the frontier.
+
+        RETURNS
+        -------
+        bool
+            True if the frontier is empty, false otherwise.
+        """
+        return len(self.__items) == 0 and len(self.__heap) == 0
+
+    def size(self) -> int:
+        """
+        Returns the number of parses in the frontier.
+
+        RETURNS
+        -------
+        int
+            Number of parses waiting to be expanded.
+        """
+        return len(self.__items) + len(self.__heap)
+
+    def getFrontierType(self) -> FrontierType:
+        """
+        Getter for the frontier type.
+
+        RETURNS
+        -------
+        FrontierType
+            Order in which the parses are expanded.
+        """
+        return self.__frontier_type
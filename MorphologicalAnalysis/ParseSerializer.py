@@ -0,0 +1,209 @@
+import io
+import pickle
+
+from Dictionary.TxtDictionary import TxtDictionary
+from Dictionary.Word import Word
+
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.State import State
+
+
+class _AnalysisUnpickler(pickle.Unpickler):
+
+    def find_class(self,
+                   module: str,
+                   name: str):
+        """
+        Returns the class with the given module and name if it is one of the classes of the analyses, see
+        ParseSerializer.ALLOWED_CLASSES. Any other class or function is refused, so that loading a serialized object
+        can not call arbitrary code.
+
+        PARAMETERS
+        ----------
+        module : str
+            Module of the class.
+        name : str
+            Name of the class.
+
+        RETURNS
+        -------
+        type
+            Class with the given module and name.
+        """
+        if name not in ParseSerializer.ALLOWED_CLASSES.get(module, ()):
+            raise pickle.UnpicklingError(module + "." + name + " is not allowed in serialized analyses")
+        return super().find_class(module, name)
+
+
+class ParseSerializer:
+
+    __finite_state_machine: FiniteStateMachine
+    __dictionary: TxtDictionary
+    __words: dict
+    __word_count: int
+
+    STATE = "S"
+    WORD = "W"
+    ALLOWED_CLASSES = {"MorphologicalAnalysis.FsmParse": ("FsmParse",),
+                       "MorphologicalAnalysis.Transition": ("Transition",),
+                       "MorphologicalAnalysis.InflectionalGroup": ("InflectionalGroup",),
+                       "MorphologicalAnalysis.MorphologicalTag": ("MorphologicalTag",),
+                       "MorphologicalAnalysis.State": ("State",),
+                       "Dictionary.TxtWord": ("TxtWord",),
+                       "Dictionary.Word": ("Word",),
+                       "builtins": ("set", "frozenset", "list", "tuple", "dict", "str", "bytes", "int", "float",
+                                    "bool", "complex")}
+
+    def __init__(self,
+                 finiteStateMachine: FiniteStateMachine,
+                 dictionary: TxtDictionary):
+        """
+        Constructor of ParseSerializer class. The serializer converts analyses to bytes and back with pickle, but the
+        states of the finite state machine and the roots taken from the dictionary are stored by their index and name.
+        Therefore the serialized analyses are small and, after they are loaded, share these objects with the analyzer.
+        Only the classes of the analyses can be loaded, so a file written by someone else can not run code in the
+        process loading it. The words of the dictionary are found by their identity in a map built once, when the first
+        word is serialized, instead of searching each word in the dictionary.
+
+        PARAMETERS
+        ----------
+        finiteStateMachine : FiniteStateMachine
+            Finite state machine whose states are used by the analyses.
+        dictionary : TxtDictionary
+            Dictionary whose words are used as roots by the analyses.
+        """
+        self.__finite_state_machine = finiteStateMachine
+        self.__dictionary = dictionary
+        self.__words = None
+        self.__word_count = 0
+
+    def dump(self,
+             obj: object,
+             outputFile):
+        """
+        Serializes the given object to the given binary file.
+
+        PARAMETERS
+        ----------
+        obj : object
+            Analyses, or any structure containing analyses.
+        outputFile : file
+            Binary file to write.
+        """
+        pickler = pickle.Pickler(outputFile, pickle.HIGHEST_PROTOCOL)
+        pickler.persistent_id = self.__persistentId
+        pickler.dump(obj)
+
+    def load(self, inputFile) -> object:
+        """
+        Deserializes an object written with dump from the given binary file. An UnpicklingError is raised if the file
+        contains any class other than the classes of the analyses.
+
+        PARAMETERS
+        ----------
+        inputFile : file
+            Binary file to read.
+
+        RETURNS
+        -------
+        object
+            Deserialized object.
+        """
+        unpickler = _AnalysisUnpickler(inputFile)
+        unpickler.persistent_load = self.__persistentLoad
+        return unpickler.load()
+
+    def encode(self, obj: object) -> bytes:
+        """
+        Serializes the given object.
+
+        PARAMETERS
+        ----------
+        obj : object
+            Analyses, or any structure containing analyses.
+
+        RETURNS
+        -------
+        bytes
+            Serialized object.
+        """
+        output = io.BytesIO()
+        self.dump(obj, output)
+        return output.getvalue()
+
+    def decode(self, data: bytes) -> object:
+        """
+        Deserializes an object serialized with encode.
+
+        PARAMETERS
+        ----------
+        data : bytes
+            Serialized object.
+
+        RETURNS
+        -------
+        object
+            Deserialized object.
+        """
+        return self.load(io.BytesIO(data))
+
+    def __persistentId(self, obj: object):
+        """
+        Returns the reference used instead of the given object if it is a state of the finite state machine or a word
+        of the dictionary.
+
+        PARAMETERS
+        ----------
+        obj : object
+            Object to serialize.
+
+        RETURNS
+        -------
+        tuple
+            Type and index or name of the object, None if the object is serialized by value.
+        """
+        if isinstance(obj, State):
+            index = obj.getIndex()
+            if index >= 0 and self.__finite_state_machine.getStateWithIndex(index) is obj:
+                return ParseSerializer.STATE, index
+        elif isinstance(obj, Word):
+            if self.__words is None or self.__word_count != self.__dictionary.size():
+                self.__word_count = self.__dictionary.size()
+                self.__words = self.__dictionaryWords()
+            if self.__words.get(id(obj)) is obj:
+                return ParseSerializer.WORD, obj.getName()
+        return None
+
+    def __dictionaryWords(self) -> dict:
+        """
+        Returns the words of the dictionary by their identity. The map keeps the words, so their ids can not be reused
+        by other objects while the map is used.
+
+        RETURNS
+        -------
+        dict
+            Map from the ids of the words of the dictionary to the words.
+        """
+        words = {}
+        for i in range(self.__dictionary.size()):
+            word = self.__dictionary.getWordWithIndex(i)
+            words[id(word)] = word
+        return words
+
+    def __persistentLoad(self, persistentId: tuple) -> object:
+        """
+        Returns the object referenced by the given persistent id.
+
+        PARAMETERS
+        ----------
+        persistentId : tuple
+            Type and index or name of the object.
+
+        RETURNS
+        -------
+        object
+            State of the finite state machine or word of the dictionary.
+        """
+        if persistentId[0] == ParseSerializer.STATE:
+            return self.__finite_state_machine.getStateWithIndex(persistentId[1])
+        return self.__dictionary.getWord(persistentId[1])
@@ -0,0 +1,277 @@
+from __future__ import annotations
+
+from Dictionary.Word import Word
+
+from MorphologicalAnalysis.FsmParse import FsmParse
+from MorphologicalAnalysis.State import State
+
+
+class PartialFsmParse:
+
+    __parent: PartialFsmParse
+    __root: Word
+    __start_state: State
+    __state: State
+    __form: str
+    __transition: str
+    __with_name: str
+    __to_pos: str
+    __length: int
+    __root_signature: tuple
+
+    def __init__(self,
+                 root: Word,
+                 startState: State,
+                 form: str,
+                 parent=None,
+                 state=None,
+                 transition=None,
+                 withName=None,
+                 toPos=None,
+                 rootSignature=None):
+        """
+        Constructor of PartialFsmParse class. A partial parse is an immutable node of a parent-pointer list, which
+        represents a path in the finite state machine during the morphological search. A child node only stores the
+        suffix it adds, and shares the root, the start state and all previous suffixes with its ancestors. Therefore,
+        extending a parse does not copy anything. A full FsmParse is constructed with toFsmParse only for the accepted
+        parses.
+
+        PARAMETERS
+        ----------
+        root : Word
+            Root word of the parse.
+        startState : State
+            Start state of the parse.
+        form : str
+            Surface form of the parse after this node.
+        parent : PartialFsmParse
+            Parent node, None for the initial node.
+        state : State
+            State reached with this node. If None, the start state is used.
+        transition : str
+            Name of the transition added by this node.
+        withName : str
+            Transition (with) of the suffix added by this node.
+        toPos : str
+            Pos of the transition added by this node.
+        rootSignature : tuple
+            Signature of the root used by AllomorphResolutionCache. It is computed once for the initial node and shared
+            by all its descendants.
+        """
+        self.__root = root
+        self.__start_state = startState
+        self.__form = form
+        self.__parent = parent
+        if state is None:
+            self.__state = startState
+        else:
+            self.__state = state
+        self.__transition = transition
+        self.__with_name = withName
+        self.__to_pos = toPos
+        self.__root_signature = rootSignature
+        if parent is None:
+            self.__length = 1
+        else:
+            self.__length = parent.__length + 1
+
+    @staticmethod
+    def fromFsmParse(fsmParse: FsmParse, rootSignature=None) -> PartialFsmParse:
+        """
+        Creates the initial node of a search from an initial FsmParse, that is a parse which only contains the start
+        state.
+
+        PARAMETERS
+        ----------
+        fsmParse : FsmParse
+            Initial FsmParse containing only the root and the start state.
+        rootSignature : tuple
+            Signature of the root used by AllomorphResolutionCache.
+
+        RETURNS
+        -------
+        PartialFsmParse
+            Initial node of the search.
+        """
+        return PartialFsmParse(fsmParse.getWord(), fsmParse.getStartState(), fsmParse.getSurfaceForm(),
+                               rootSignature=rootSignature)
+
+    def addSuffix(self,
+                  suffix: State,
+                  form: str,
+                  transition: str,
+                  withName: str,
+                  toPos: str) -> PartialFsmParse:
+        """
+        Returns a new node extending this parse with the given suffix. This node is not modified.
+
+        PARAMETERS
+        ----------
+        suffix : State
+            State reached with the suffix.
+        form : str
+            Surface form after adding the suffix.
+        transition : str
+            Name of the transition.
+        withName : str
+            Transition (with) of the suffix.
+        toPos : str
+            Pos of the transition.
+
+        RETURNS
+        -------
+        PartialFsmParse
+            New node whose parent is this node.
+        """
+        return PartialFsmParse(self.__root, self.__start_state, form, self, suffix, transition, withName, toPos,
+                               self.__root_signature)
+
+    def withParent(self, parent: PartialFsmParse) -> PartialFsmParse:
+        """
+        Returns a new node adding the same suffix as this node to another parent. The given parent must end in the same
+        state with the same surface form as the parent of this node.
+
+        PARAMETERS
+        ----------
+        parent : PartialFsmParse
+            New parent node.
+
+        RETURNS
+        -------
+        PartialFsmParse
+            New node whose parent is the given node.
+        """
+        return PartialFsmParse(self.__root, self.__start_state, self.__form, parent, self.__state, self.__transition,
+                               self.__with_name, self.__to_pos, self.__root_signature)
+
+    def getWord(self) -> Word:
+        """
+        Getter for the root word.
+
+        RETURNS
+        -------
+        Word
+            Root word of the parse.
+        """
+        return self.__root
+
+    def getSurfaceForm(self) -> str:
+        """
+        Getter for the current surface form.
+
+        RETURNS
+        -------
+        str
+            Surface form of the parse.
+        """
+        return self.__form
+
+    def getStartState(self) -> State:
+        """
+        Getter for the start state.
+
+        RETURNS
+        -------
+        State
+            Start state of the parse.
+        """
+        return self.__start_state
+
+    def getRootSignature(self) -> tuple:
+        """
+        Getter for the signature of the root.
+
+        RETURNS
+        -------
+        tuple
+            Signature of the root used by AllomorphResolutionCache, None if it is not given.
+        """
+        return self.__root_signature
+
+    def getFinalSuffix(self) -> State:
+        """
+        Getter for the last state reached by the parse.
+
+        RETURNS
+        -------
+        State
+            Last state of the parse.
+        """
+        return self.__state
+
+    def getTransition(self) -> str:
+        """
+        Getter for the name of the transition added by this node.
+
+        RETURNS
+        -------
+        str
+            Name of the transition, None for the initial node.
+        """
+        return self.__transition
+
+    def getWithName(self) -> str:
+        """
+        Getter for the transition (with) of the suffix added by this node.
+
+        RETURNS
+        -------
+        str
+            Transition (with) of the suffix, None for the initial node.
+        """
+        return self.__with_name
+
+    def getToPos(self) -> str:
+        """
+        Getter for the pos of the transition added by this node.
+
+        RETURNS
+        -------
+        str
+            Pos of the transition, None for the initial node or if the transition does not change the pos.
+        """
+        return self.__to_pos
+
+    def getParent(self) -> PartialFsmParse:
+        """
+        Getter for the parent node.
+
+        RETURNS
+        -------
+        PartialFsmParse
+            Parent node, None for the initial node.
+        """
+        return self.__parent
+
+    def size(self) -> int:
+        """
+        Returns the number of states in the parse, including the start state.
+
+        RETURNS
+        -------
+        int
+            Number of states in the parse.
+        """
+        return self.__length
+
+    def toFsmParse(self) -> FsmParse:
+        """
+        Constructs the full FsmParse represented by this node by replaying the suffixes from the start state to this
+        node.
+
+        RETURNS
+        -------
+        FsmParse
+            FsmParse equivalent to the path ending in this node.
+        """
+        nodes = []
+        node = self
+        while node.__parent is not None:
+            nodes.append(node)
+            node = node.__parent
+        fsm_parse = FsmParse(self.__root, self.__start_state)
+        for i in range(len(nodes) - 1, -1, -1):
+            node = nodes[i]
+            fsm_parse.addSuffix(node.__state, node.__form, node.__transition, node.__with_name, node.__to_pos)
+            fsm_parse.setAgreement(node.__transition)
+        return fsm_parse
@@ -0,0 +1,204 @@
+import pathlib
+import sqlite3
+
+from Dictionary.TxtDictionary import TxtDictionary
+
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.ParseSerializer import ParseSerializer
+
+
+class PersistentAnalysisCache:
+
+    __connection: sqlite3.Connection
+    __serializer: ParseSerializer
+    __read_only: bool
+    __valid: bool
+    __pending: dict
+    __hits: int
+    __misses: int
+
+    BATCH_SIZE = 1000
+
+    def __init__(self,
+                 fileName: str,
+                 stamp: str,
+                 finiteStateMachine: FiniteStateMachine,
+                 dictionary: TxtDictionary,
+                 readOnly=False):
+        """
+        Constructor of PersistentAnalysisCache class. The cache stores the analyses of the surface forms in an SQLite
+        database, so that they can be reused by later runs and read by many processes at the same time. The database
+        is stamped with a hash of the dictionary and the finite state machine. If the stamp of an existing database is
+        different, its analyses are removed, or ignored if the cache is read only.
+
+        The analyses are stored with a ParseSerializer, so they are small and share the states and the roots with the
+        analyzer after they are loaded.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the database file.
+        stamp : str
+            Hash of the dictionary and the finite state machine used for the analyses.
+        finiteStateMachine : FiniteStateMachine
+            Finite state machine whose states are used by the analyses.
+        dictionary : TxtDictionary
+            Dictionary whose words are used as roots by the analyses.
+        readOnly : bool
+            If True, the database is not modified.
+        """
+        self.__serializer = ParseSerializer(finiteStateMachine, dictionary)
+        self.__read_only = readOnly
+        self.__pending = {}
+        self.__hits = 0
+        self.__misses = 0
+        if readOnly:
+            self.__connection = sqlite3.connect(pathlib.Path(fileName).resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False)
+            try:
+                row = self.__connection.execute("SELECT value FROM meta WHERE name = 'stamp'").fetchone()
+            except sqlite3.DatabaseError:
+                row = None
+            self.__valid = row is not None and row[0] == stamp
+            return
+        self.__connection = sqlite3.connect(fileName, timeout=30, check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+        self.__connection.execute("CREATE TABLE IF NOT EXISTS analyses (surface_form TEXT PRIMARY KEY, parses BLOB)")
+        row = self.__connection.execute("SELECT value FROM meta WHERE name = 'stamp'").fetchone()
+        if row is None or row[0] != stamp:
+            self.__connection.execute("DELETE FROM analyses")
+            self.__connection.execute("INSERT OR REPLACE INTO meta VALUES ('stamp', ?)", (stamp,))
+        self.__connection.commit()
+        self.__valid = True
+
+    @staticmethod
+    def encodeKey(key: tuple) -> str:
+        """
+        Converts a key returned by AnalysisCache.normalizedKey to the string stored in the database.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Lowercase form, proper noun flag and capital flag of a surface form.
+
+        RETURNS
+        -------
+        str
+            Flags followed by the lowercase form.
+        """
+        return ("1" if key[1] else "0") + ("1" if key[2] else "0") + key[0]
+
+    def get(self, key: tuple) -> tuple:
+        """
+        Returns the stored analyses of the given key.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by AnalysisCache.normalizedKey.
+
+        RETURNS
+        -------
+        tuple
+            Analyses of the surface form, None if the surface form is not stored.
+        """
+        if not self.__valid:
+            self.__misses += 1
+            return None
+        encoded_key = PersistentAnalysisCache.encodeKey(key)
+        data = self.__pending.get(encoded_key)
+        if data is None:
+            row = self.__connection.execute("SELECT parses FROM analyses WHERE surface_form = ?",
+                                            (encoded_key,)).fetchone()
+            if row is None:
+                self.__misses += 1
+                return None
+            data = row[0]
+        self.__hits += 1
+        return self.__serializer.decode(data)
+
+    def add(self,
+            key: tuple,
+            parses: tuple):
+        """
+        Stores the analyses of the given key. The analyses are written to the database in batches of BATCH_SIZE
+        surface forms, or when flush is called.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key returned by AnalysisCache.normalizedKey.
+        parses : tuple
+            Analyses of the surface form.
+        """
+        if self.__read_only:
+            return
+        self.__pending[PersistentAnalysisCache.encodeKey(key)] = self.__serializer.encode(parses)
+        if len(self.__pending) >= PersistentAnalysisCache.BATCH_SIZE:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the analyses waiting in memory to the database.
+        """
+        if len(self.__pending) == 0:
+            return
+        with self.__connection:
+            self.__connection.executemany("INSERT OR REPLACE INTO analyses VALUES (?, ?)",
+                                          list(self.__pending.items()))
+        self.__pending.clear()
+
+    def isValid(self) -> bool:
+        """
+        Returns whether the stamp of the database matches the analyzer.
+
+        RETURNS
+        -------
+        bool
+            False if the database was built with another dictionary or finite state machine and is read only.
+        """
+        return self.__valid
+
+    def size(self) -> int:
+        """
+        Returns the number of surface forms stored in the database.
+
+        RETURNS
+        -------
+        int
+            Number of surface forms.
+        """
+        if not self.__valid:
+            return 0
+        self.flush()
+        return self.__connection.execute("SELECT COUNT(*) FROM analyses").fetchone()[0]
+
+    def getHits(self) -> int:
+        """
+        Getter for the number of lookups finding their surface form.
+
+        RETURNS
+        -------
+        int
+            Number of hits.
+        """
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """
+        Getter for the number of lookups not finding their surface form.
+
+        RETURNS
+        -------
+        int
+            Number of misses.
+        """
+        return self.__misses
+
+    def close(self):
+        """
+        Writes the waiting analyses and closes the database.
+        """
+        if not self.__read_only:
+            self.flush()
+        self.__connection.close()
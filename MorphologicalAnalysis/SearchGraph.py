@@ -0,0 +1,108 @@
+from MorphologicalAnalysis.PartialFsmParse import PartialFsmParse
+
+
+class SearchGraph:
+
+    __nodes: dict
+    __alternatives: dict
+    __paths: dict
+
+    def __init__(self):
+        """
+        Constructor of SearchGraph class. Different paths of the morphological search often reach the same state with
+        the same surface form, the same root and the same start state. Since the expansions of a parse only depend on
+        these values, such parses are merged: only the first one is expanded, and the later ones are kept as
+        alternatives of it. The alternatives are fanned out again when the accepted parses are enumerated.
+        """
+        self.__nodes = {}
+        self.__alternatives = {}
+        self.__paths = {}
+
+    @staticmethod
+    def __key(parse: PartialFsmParse) -> tuple:
+        """
+        Returns the values that determine the expansions of a parse.
+
+        PARAMETERS
+        ----------
+        parse : PartialFsmParse
+            Parse of the search.
+
+        RETURNS
+        -------
+        tuple
+            Final state, surface form, root and start state of the parse.
+        """
+        return id(parse.getFinalSuffix()), parse.getSurfaceForm(), id(parse.getWord()), id(parse.getStartState())
+
+    def add(self, parse: PartialFsmParse) -> bool:
+        """
+        Adds a parse to the graph. If an equivalent parse is already added, the parse is stored as its alternative.
+
+        PARAMETERS
+        ----------
+        parse : PartialFsmParse
+            New parse of the search.
+
+        RETURNS
+        -------
+        bool
+            True if the parse is not equivalent to an earlier parse and should be expanded, false otherwise.
+        """
+        key = SearchGraph.__key(parse)
+        node = self.__nodes.get(key)
+        if node is None:
+            self.__nodes[key] = parse
+            return True
+        if id(node) in self.__alternatives:
+            self.__alternatives[id(node)].append(parse)
+        else:
+            self.__alternatives[id(node)] = [parse]
+        self.__paths.clear()
+        return False
+
+    def size(self) -> int:
+        """
+        Returns the number of distinct parses added to the graph.
+
+        RETURNS
+        -------
+        int
+            Number of expanded parses.
+        """
+        return len(self.__nodes)
+
+    def paths(self, parse: PartialFsmParse) -> list:
+        """
+        Returns one parse for each distinct path reaching the given parse, that is, the parse itself, its alternatives,
+        and the parses obtained by attaching the suffix of each of them to every path reaching its parent. The paths of
+        the parents are shared between the calls until a new alternative is added.
+
+        PARAMETERS
+        ----------
+        parse : PartialFsmParse
+            A parse added to the graph and expanded.
+
+        RETURNS
+        -------
+        list
+            List of PartialFsmParse, one for each path.
+        """
+        if id(parse) in self.__paths:
+            return self.__paths[id(parse)]
+        result = []
+        variants = [parse]
+        if id(parse) in self.__alternatives:
+            variants.extend(self.__alternatives[id(parse)])
+        for variant in variants:
+            parent = variant.getParent()
+            if parent is None:
+                result.append(variant)
+            else:
+                for parent_path in self.paths(parent):
+                    if parent_path is parent:
+                        result.append(variant)
+                    else:
+                        result.append(variant.withParent(parent_path))
+        self.__paths[id(parse)] = result
+        return result
@@ -0,0 +1,183 @@
+import time
+
+
+class SearchStatistics:
+
+    COUNTERS = ("frontier_pushes", "frontier_pops", "transitions_tried", "rejected_by_surface_form",
+                "rejected_by_parse", "rejected_by_word", "rejected_by_length", "merged_states", "accepted_parses",
+                "make_transition_calls", "allomorph_cache_hits", "allomorph_cache_misses", "deep_copies",
+                "root_variant_hits", "root_variant_misses", "analysis_cache_hits", "analysis_cache_misses",
+                "negative_cache_hits")
+
+    __state_timing: bool
+    __surface_form: str
+    __start_time: float
+    __word_count: int
+    __current: dict
+    __total: dict
+    __current_state_times: dict
+    __total_state_times: dict
+
+    def __init__(self, stateTiming=False):
+        """
+        Constructor of SearchStatistics class. The statistics count the work done by the morphological analyzer, such
+        as the parses added to and removed from the frontier, the transitions tried and the check rejecting them, the
+        calls to makeTransition, the copies of the roots and the hits and misses of the caches. The counters are kept
+        both for the last analyzed word and in total for all words. If state timing is enabled, the time spent while
+        expanding the parses of each state is also accumulated.
+
+        PARAMETERS
+        ----------
+        stateTiming : bool
+            If True, the cumulative expansion time of each state is measured.
+        """
+        self.__state_timing = stateTiming
+        self.reset()
+
+    def reset(self):
+        """
+        Sets all counters and times to zero.
+        """
+        self.__surface_form = None
+        self.__start_time = None
+        self.__word_count = 0
+        self.__current = dict.fromkeys(SearchStatistics.COUNTERS, 0)
+        self.__total = dict.fromkeys(SearchStatistics.COUNTERS, 0)
+        self.__current_state_times = {}
+        self.__total_state_times = {}
+
+    def isStateTiming(self) -> bool:
+        """
+        Returns whether the expansion time of the states is measured.
+
+        RETURNS
+        -------
+        bool
+            True if the state timing is enabled.
+        """
+        return self.__state_timing
+
+    def startWord(self, surfaceForm: str):
+        """
+        Starts the counters of a new word. The counters of the previous word are cleared.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to be analyzed.
+        """
+        self.__surface_form = surfaceForm
+        self.__current = dict.fromkeys(SearchStatistics.COUNTERS, 0)
+        self.__current_state_times = {}
+        self.__start_time = time.perf_counter()
+
+    def endWord(self):
+        """
+        Ends the analysis of the current word and adds its time to the total time.
+        """
+        if self.__start_time is not None:
+            self.__word_count = self.__word_count + 1
+            elapsed = time.perf_counter() - self.__start_time
+            self.__current["time"] = elapsed
+            self.__total["time"] = self.__total.get("time", 0.0) + elapsed
+            self.__start_time = None
+
+    def increment(self,
+                  counter: str,
+                  amount=1):
+        """
+        Increments the given counter of the current word and the total.
+
+        PARAMETERS
+        ----------
+        counter : str
+            Name of the counter, one of COUNTERS.
+        amount : int
+            Value to add.
+        """
+        self.__current[counter] += amount
+        self.__total[counter] += amount
+
+    def addStateTime(self,
+                     stateName: str,
+                     elapsed: float):
+        """
+        Adds the given time to the expansion time of the given state.
+
+        PARAMETERS
+        ----------
+        stateName : str
+            Name of the state.
+        elapsed : float
+            Time spent in seconds.
+        """
+        self.__current_state_times[stateName] = self.__current_state_times.get(stateName, 0.0) + elapsed
+        self.__total_state_times[stateName] = self.__total_state_times.get(stateName, 0.0) + elapsed
+
+    def getCounter(self, counter: str) -> int:
+        """
+        Returns the total value of the given counter.
+
+        PARAMETERS
+        ----------
+        counter : str
+            Name of the counter.
+
+        RETURNS
+        -------
+        int
+            Total value of the counter.
+        """
+        return self.__total[counter]
+
+    def getWordCount(self) -> int:
+        """
+        Returns the number of analyzed words.
+
+        RETURNS
+        -------
+        int
+            Number of words.
+        """
+        return self.__word_count
+
+    def getWordStatistics(self) -> dict:
+        """
+        Returns the statistics of the last analyzed word.
+
+        RETURNS
+        -------
+        dict
+            Surface form, counters, time and the state times of the last word.
+        """
+        result = dict(self.__current)
+        result["surface_form"] = self.__surface_form
+        if self.__state_timing:
+            result["state_times"] = dict(self.__current_state_times)
+        return result
+
+    def getTotalStatistics(self) -> dict:
+        """
+        Returns the statistics of all analyzed words.
+
+        RETURNS
+        -------
+        dict
+            Number of words, counters, time and the state times in total.
+        """
+        result = dict(self.__total)
+        result["words"] = self.__word_count
+        if self.__state_timing:
+            result["state_times"] = dict(self.__total_state_times)
+        return result
+
+    def toDict(self) -> dict:
+        """
+        Exports the statistics as a dictionary.
+
+        RETURNS
+        -------
+        dict
+            Dictionary containing the statistics of the last word and the total statistics.
+        """
+        return {"word": self.getWordStatistics(), "total": self.getTotalStatistics()}
@@ -4,6 +4,9 @@ class State:
     __end_state: bool
     __name: str
     __pos: str
+    __index: int
+    __verbal_root: bool
+    __proper_root: bool
 
     def __init__(self,
                  name: str,
@@ -12,7 +15,9 @@ class State:
                  pos=None):
         """
         Second constructor of the State class which takes 4 parameters as input; String name, boolean startState,
-        boolean endState, and String pos and initializes the private variables of the class.
+        boolean endState, and String pos and initializes the private variables of the class. Whether the state is a
+        verbal or a proper root state is computed once here, so that the transitions do not compare the name on every
+        call.
 
         PARAMETERS
         ----------
@@ -29,6 +34,9 @@ class State:
         self.__start_state = startState
         self.__name = name
         self.__pos = pos
+        self.__index = -1
+        self.__verbal_root = name.startswith("VerbalRoot")
+        self.__proper_root = name.startswith("ProperRoot")
 
     def __str__(self) -> str:
         """
@@ -73,3 +81,47 @@ class State:
             boolean endState.
         """
         return self.__end_state
+
+    def isVerbalRoot(self) -> bool:
+        """
+        Checks if the state is one of the verbal root states, that is its name starts with VerbalRoot.
+
+        RETURNS
+        -------
+        bool
+            True if the state is a verbal root state, false otherwise.
+        """
+        return self.__verbal_root
+
+    def isProperRoot(self) -> bool:
+        """
+        Checks if the state is the proper root state, that is its name starts with ProperRoot.
+
+        RETURNS
+        -------
+        bool
+            True if the state is a proper root state, false otherwise.
+        """
+        return self.__proper_root
+
+    def getIndex(self) -> int:
+        """
+        Getter for the index of the state in the compiled finite state machine.
+
+        RETURNS
+        -------
+        int
+            Index of the state, -1 if the state does not belong to a finite state machine.
+        """
+        return self.__index
+
+    def setIndex(self, index: int):
+        """
+        Setter for the index of the state in the compiled finite state machine.
+
+        PARAMETERS
+        ----------
+        index : int
+            Index of the state.
+        """
+        self.__index = index
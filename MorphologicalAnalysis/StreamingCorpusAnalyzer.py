@@ -0,0 +1,233 @@
+import argparse
+import json
+
+from Corpus.Sentence import Sentence
+
+from DisambiguationCorpus.DisambiguationCorpus import DisambiguationCorpus
+from MorphologicalAnalysis.AnalyzerForkServer import AnalyzerForkServer
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class StreamingCorpusAnalyzer:
+
+    __analyzer: FsmMorphologicalAnalyzer
+    __batch_size: int
+    __workers: int
+    __fork_server: AnalyzerForkServer
+
+    TEXT = "text"
+    DISAMBIGUATION = "disambiguation"
+    TSV = "tsv"
+    JSON = "json"
+    CACHE_SIZE = 100000
+
+    def __init__(self,
+                 analyzer=None,
+                 batchSize=10000,
+                 workers=1):
+        """
+        Constructor of StreamingCorpusAnalyzer class. The corpus is read, analyzed and written sentence by sentence,
+        and only the sentences of one batch are kept in memory, so that the memory used does not grow with the size of
+        the corpus. The analysis cache of the analyzer is the only other structure that grows with the corpus, hence
+        the analyzer constructed by default has a small cache; a given analyzer should also be constructed with a
+        bounded cacheSize or cacheBytes.
+
+        PARAMETERS
+        ----------
+        analyzer : FsmMorphologicalAnalyzer
+            Analyzer of the corpus. If None, a new analyzer with a cache of CACHE_SIZE analyses is constructed.
+        batchSize : int
+            Number of words analyzed together. The sentences are collected until they have that many words.
+        workers : int
+            Number of worker processes. If more than one, the batches are analyzed by an AnalyzerForkServer sharing the
+            analyzer, and the sentences are still returned in the order of the corpus.
+        """
+        if analyzer is None:
+            analyzer = FsmMorphologicalAnalyzer(cacheSize=StreamingCorpusAnalyzer.CACHE_SIZE)
+        self.__analyzer = analyzer
+        self.__batch_size = batchSize
+        self.__workers = workers
+        self.__fork_server = None
+
+    @staticmethod
+    def readSentences(fileName: str, inputFormat=TEXT):
+        """
+        Reads the sentences of a corpus file one by one. In a text file, each line is a sentence whose words are
+        separated by spaces; a disambiguation corpus file is read with DisambiguationCorpus.readSentences.
+
+        PARAMETERS
+        ----------
+        fileName : str
+            Name of the corpus file.
+        inputFormat : str
+            TEXT or DISAMBIGUATION.
+
+        RETURNS
+        -------
+        generator
+            Sentences of the file.
+        """
+        if inputFormat == StreamingCorpusAnalyzer.DISAMBIGUATION:
+            yield from DisambiguationCorpus.readSentences(fileName)
+        elif inputFormat == StreamingCorpusAnalyzer.TEXT:
+            with open(fileName, "r", encoding="utf8") as input_file:
+                for line in input_file:
+                    yield Sentence(line.strip())
+        else:
+            raise ValueError("Unknown input format " + inputFormat)
+
+    def analyzeSentences(self, sentences):
+        """
+        Analyzes a stream of sentences batch by batch and returns the analyses of each sentence as soon as its batch
+        is analyzed, in the order of the sentences. As in morphologicalAnalysis of a sentence, each word is replaced by
+        its correct form in the dictionary, if it has one, before it is analyzed.
+
+        PARAMETERS
+        ----------
+        sentences : iterable
+            Sentences to analyze.
+
+        RETURNS
+        -------
+        generator
+            Pairs of a sentence and the list of the FsmParseList of each of its words.
+        """
+        batch = []
+        size = 0
+        for sentence in sentences:
+            batch.append(sentence)
+            size = size + sentence.wordCount()
+            if size >= self.__batch_size:
+                yield from self.__analyzeBatch(batch)
+                batch = []
+                size = 0
+        if len(batch) > 0:
+            yield from self.__analyzeBatch(batch)
+
+    def __analyzeBatch(self, batch: list) -> list:
+        """
+        Analyzes the words of the given sentences together, with analyzeMany of the analyzer or with the fork server.
+
+        PARAMETERS
+        ----------
+        batch : list
+            Sentences to analyze.
+
+        RETURNS
+        -------
+        list
+            Pairs of a sentence and the list of the FsmParseList of each of its words.
+        """
+        dictionary = self.__analyzer.getDictionary()
+        surface_forms = []
+        for sentence in batch:
+            for i in range(sentence.wordCount()):
+                original_form = sentence.getWord(i).getName()
+                spell_corrected_form = dictionary.getCorrectForm(original_form)
+                if len(spell_corrected_form) == 0:
+                    spell_corrected_form = original_form
+                surface_forms.append(spell_corrected_form)
+        if self.__workers > 1:
+            if self.__fork_server is None:
+                self.__fork_server = AnalyzerForkServer(self.__analyzer, self.__workers)
+                self.__fork_server.start()
+            parse_lists = self.__fork_server.analyze(surface_forms)
+        else:
+            parse_lists = self.__analyzer.analyzeMany(surface_forms)
+        result = []
+        index = 0
+        for sentence in batch:
+            result.append((sentence, parse_lists[index: index + sentence.wordCount()]))
+            index = index + sentence.wordCount()
+        return result
+
+    def analyzeFile(self,
+                    inputFileName: str,
+                    outputFileName: str,
+                    inputFormat=TEXT,
+                    outputFormat=TSV) -> int:
+        """
+        Analyzes a corpus file and writes the analyses of each sentence to the output file as soon as they are
+        computed. In the TSV format, each word is written on a line followed by its analyses separated by tabs, and the
+        sentences are separated by empty lines. In the JSON format, each sentence is written on a line as a list of
+        objects with the word and its analyses.
+
+        PARAMETERS
+        ----------
+        inputFileName : str
+            Name of the corpus file.
+        outputFileName : str
+            Name of the output file.
+        inputFormat : str
+            TEXT or DISAMBIGUATION.
+        outputFormat : str
+            TSV or JSON.
+
+        RETURNS
+        -------
+        int
+            Number of sentences written.
+        """
+        if outputFormat != StreamingCorpusAnalyzer.TSV and outputFormat != StreamingCorpusAnalyzer.JSON:
+            raise ValueError("Unknown output format " + outputFormat)
+        count = 0
+        with open(outputFileName, "w", encoding="utf8") as output_file:
+            sentences = StreamingCorpusAnalyzer.readSentences(inputFileName, inputFormat)
+            for sentence, parse_lists in self.analyzeSentences(sentences):
+                words = []
+                for i in range(sentence.wordCount()):
+                    words.append((sentence.getWord(i).getName(),
+                                  [parse.__str__() for parse in parse_lists[i].toTuple()]))
+                if outputFormat == StreamingCorpusAnalyzer.TSV:
+                    for word, analyses in words:
+                        output_file.write("\t".join([word] + analyses) + "\n")
+                    output_file.write("\n")
+                else:
+                    output_file.write(json.dumps([{"word": word, "analyses": analyses} for word, analyses in words],
+                                                 ensure_ascii=False) + "\n")
+                count = count + 1
+        return count
+
+    def close(self):
+        """
+        Stops the fork server of the workers, if it is started.
+        """
+        if self.__fork_server is not None:
+            self.__fork_server.stop()
+            self.__fork_server = None
+
+
+def main():
+    """
+    Analyzes a corpus file with the options given on the command line.
+    """
+    parser = argparse.ArgumentParser(description="Analyzes a corpus file with an FsmMorphologicalAnalyzer")
+    parser.add_argument("input", help="corpus file")
+    parser.add_argument("output", help="file of the analyses")
+    parser.add_argument("--input-format", default=StreamingCorpusAnalyzer.TEXT,
+                        choices=[StreamingCorpusAnalyzer.TEXT, StreamingCorpusAnalyzer.DISAMBIGUATION])
+    parser.add_argument("--output-format", default=StreamingCorpusAnalyzer.TSV,
+                        choices=[StreamingCorpusAnalyzer.TSV, StreamingCorpusAnalyzer.JSON])
+    parser.add_argument("--workers", type=int, default=1, help="number of worker processes")
+    parser.add_argument("--batch-size", type=int, default=10000, help="number of words analyzed together")
+    parser.add_argument("--cache-size", type=int, default=StreamingCorpusAnalyzer.CACHE_SIZE,
+                        help="maximum number of analyses in the cache")
+    parser.add_argument("--snapshot", help="analyzer snapshot written with saveSnapshot")
+    parser.add_argument("--lexicon", help="lexicon file written with saveMappedLexicon")
+    arguments = parser.parse_args()
+    if arguments.snapshot is not None:
+        analyzer = FsmMorphologicalAnalyzer.fromSnapshot(arguments.snapshot, cacheSize=arguments.cache_size)
+    elif arguments.lexicon is not None:
+        analyzer = FsmMorphologicalAnalyzer.fromMappedLexicon(arguments.lexicon, cacheSize=arguments.cache_size)
+    else:
+        analyzer = FsmMorphologicalAnalyzer(cacheSize=arguments.cache_size)
+    corpus_analyzer = StreamingCorpusAnalyzer(analyzer, arguments.batch_size, arguments.workers)
+    try:
+        corpus_analyzer.analyzeFile(arguments.input, arguments.output, arguments.input_format,
+                                    arguments.output_format)
+    finally:
+        corpus_analyzer.close()
+
+
+if __name__ == '__main__':
+    main()
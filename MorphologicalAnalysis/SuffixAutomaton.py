@@ -0,0 +1,164 @@
+from Dictionary.TxtWord import TxtWord
+from Dictionary.Word import Word
+
+from MorphologicalAnalysis.AllomorphResolutionCache import AllomorphResolutionCache
+from MorphologicalAnalysis.State import State
+from MorphologicalAnalysis.SuffixTable import SuffixTable
+
+
+class SuffixAutomaton:
+
+    __tables: dict
+    __max_suffix_length: int
+    __max_size: int
+    __hits: int
+    __misses: int
+
+    def __init__(self,
+                 maxSuffixLength=7,
+                 maxSize=20000):
+        """
+        Constructor of SuffixAutomaton class. The suffix automaton is the second level of the analysis after the root
+        lookup in the dictionary trie. The suffixes a root can take only depend on the start state, the flags of the
+        root and its ending, not on the whole root. Therefore the roots are grouped into classes with classKey, and
+        for each class a SuffixTable containing all suffix sequences up to maxSuffixLength characters is compiled once.
+        The surface forms of the other roots of the class are then analyzed with a table lookup.
+
+        PARAMETERS
+        ----------
+        maxSuffixLength : int
+            Maximum number of characters added to a root by the suffix sequences stored in the tables. Longer surface
+            forms are analyzed with the finite state machine.
+        maxSize : int
+            Maximum number of tables stored. When the automaton is full, new tables are compiled but not stored.
+        """
+        self.__tables = {}
+        self.__max_suffix_length = maxSuffixLength
+        self.__max_size = maxSize
+        self.__hits = 0
+        self.__misses = 0
+
+    @staticmethod
+    def classKey(root: TxtWord,
+                 startState: State,
+                 rootSignature=None) -> tuple:
+        """
+        Returns the key of the class of the given root and start state. Besides the signature of the root used by
+        AllomorphResolutionCache, the key contains the flags checked by Transition.transitionPossibleForWord, the last
+        two characters, the last vowel and the vowel before it of the root. Short roots, which are checked by name in
+        Transition.makeTransition, are kept in the key as they are.
+
+        PARAMETERS
+        ----------
+        root : TxtWord
+            Root of the word.
+        startState : State
+            Start state of the search.
+        rootSignature : tuple
+            Signature of the root as returned by AllomorphResolutionCache.rootSignature. If None, it is computed.
+
+        RETURNS
+        -------
+        tuple
+            Key of the class.
+        """
+        if rootSignature is None:
+            rootSignature = AllomorphResolutionCache.rootSignature(root)
+        name = root.getName()
+        if len(name) <= SuffixTable.SHORT_ROOT_LENGTH:
+            context = name
+        else:
+            context = (name[len(name) - SuffixTable.CONTEXT_LENGTH:], Word.lastVowel(name),
+                       Word.beforeLastVowel(name))
+        flags = (root.isExceptional(), root.isPronoun(), root.takesRelativeSuffixKi(), root.takesRelativeSuffixKu(),
+                 root.takesSuffixDIRAsFactitive(), root.takesSuffixIRAsAorist())
+        return startState.getName(), rootSignature, flags, context
+
+    def getTable(self, key: tuple) -> SuffixTable:
+        """
+        Returns the table of the given class.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key of the class as returned by classKey.
+
+        RETURNS
+        -------
+        SuffixTable
+            Table of the class, None if it is not compiled yet.
+        """
+        table = self.__tables.get(key)
+        if table is None:
+            self.__misses += 1
+        else:
+            self.__hits += 1
+        return table
+
+    def addTable(self,
+                 key: tuple,
+                 table: SuffixTable):
+        """
+        Stores the table of the given class, if the automaton is not full.
+
+        PARAMETERS
+        ----------
+        key : tuple
+            Key of the class as returned by classKey.
+        table : SuffixTable
+            Compiled table of the class.
+        """
+        if len(self.__tables) < self.__max_size:
+            self.__tables[key] = table
+
+    def getMaxSuffixLength(self) -> int:
+        """
+        Getter for the maximum suffix length of the tables.
+
+        RETURNS
+        -------
+        int
+            Maximum number of characters added to a root by the stored suffix sequences.
+        """
+        return self.__max_suffix_length
+
+    def size(self) -> int:
+        """
+        Returns the number of tables stored.
+
+        RETURNS
+        -------
+        int
+            Number of compiled tables.
+        """
+        return len(self.__tables)
+
+    def getHits(self) -> int:
+        """
+        Getter for the number of lookups answered with a compiled table.
+
+        RETURNS
+        -------
+        int
+            Number of hits.
+        """
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """
+        Getter for the number of lookups that required compiling a table.
+
+        RETURNS
+        -------
+        int
+            Number of misses.
+        """
+        return self.__misses
+
+    def clear(self):
+        """
+        Removes all tables and resets the counters.
+        """
+        self.__tables.clear()
+        self.__hits = 0
+        self.__misses = 0
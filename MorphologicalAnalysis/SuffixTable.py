@@ -0,0 +1,145 @@
+from Dictionary.Word import Word
+
+from MorphologicalAnalysis.PartialFsmParse import PartialFsmParse
+
+
+class SuffixTable:
+
+    CONTEXT_LENGTH = 2
+    SHORT_ROOT_LENGTH = 3
+
+    __entries: dict
+    __drops: list
+    __transferable: bool
+    __path_count: int
+
+    def __init__(self,
+                 root: Word,
+                 paths: list):
+        """
+        Constructor of SuffixTable class. A suffix table stores all accepted suffix sequences of a root, that is the
+        paths found by the finite state machine from a start state up to a maximum suffix length. Each node of a path
+        is stored relative to the root: the number of characters dropped from the end of the root and the string
+        appended after them. The table is indexed with the final pair, so the analyses of a surface form are found
+        with a single lookup for each possible number of dropped characters.
+
+        Since the nodes are relative to the root, the same table can be used for every root with the same start state,
+        flags and ending, see SuffixAutomaton.classKey. If a path of a long root drops more characters than the ending
+        in the class key, the table can not be shared and is marked as not transferable.
+
+        PARAMETERS
+        ----------
+        root : Word
+            Root from which the paths are found.
+        paths : list
+            List of accepted PartialFsmParse paths of the root.
+        """
+        self.__entries = {}
+        self.__transferable = True
+        self.__path_count = len(paths)
+        name = root.getName()
+        drops = set()
+        for path in paths:
+            nodes = []
+            node = path
+            while node.getParent() is not None:
+                nodes.append(SuffixTable.__relativeNode(node, name))
+                node = node.getParent()
+            nodes.reverse()
+            if len(nodes) > 0:
+                drop, appended = nodes[len(nodes) - 1][1], nodes[len(nodes) - 1][2]
+            else:
+                drop, appended = 0, ""
+            for node in nodes:
+                if node[1] > SuffixTable.CONTEXT_LENGTH and len(name) > SuffixTable.SHORT_ROOT_LENGTH:
+                    self.__transferable = False
+            drops.add(drop)
+            key = (drop, appended)
+            if key not in self.__entries:
+                self.__entries[key] = []
+            self.__entries[key].append(tuple(nodes))
+        self.__drops = sorted(drops)
+
+    @staticmethod
+    def __relativeNode(node: PartialFsmParse, name: str) -> tuple:
+        """
+        Converts a node of a path to a tuple storing its surface form relative to the root.
+
+        PARAMETERS
+        ----------
+        node : PartialFsmParse
+            Node to convert.
+        name : str
+            Name of the root.
+
+        RETURNS
+        -------
+        tuple
+            State, number of dropped characters, appended string, transition, with and pos of the node.
+        """
+        form = node.getSurfaceForm()
+        common = 0
+        length = min(len(name), len(form))
+        while common < length and name[common] == form[common]:
+            common = common + 1
+        return (node.getFinalSuffix(), len(name) - common, form[common:], node.getTransition(), node.getWithName(),
+                node.getToPos())
+
+    def isTransferable(self) -> bool:
+        """
+        Returns whether the table can be used for the other roots of its class.
+
+        RETURNS
+        -------
+        bool
+            False if a path drops more characters than the ending of the root used in the class key.
+        """
+        return self.__transferable
+
+    def paths(self,
+              initialParse: PartialFsmParse,
+              surfaceForm: str) -> list:
+        """
+        Returns the paths of the table that produce the given surface form when applied to the root of the given
+        initial parse.
+
+        PARAMETERS
+        ----------
+        initialParse : PartialFsmParse
+            Initial node containing the root and the start state.
+        surfaceForm : str
+            Surface form to analyze.
+
+        RETURNS
+        -------
+        list
+            List of PartialFsmParse paths starting from initialParse.
+        """
+        name = initialParse.getSurfaceForm()
+        result = []
+        for drop in self.__drops:
+            if drop > len(name):
+                break
+            stem = name[:len(name) - drop]
+            if not surfaceForm.startswith(stem):
+                continue
+            entries = self.__entries.get((drop, surfaceForm[len(stem):]))
+            if entries is None:
+                continue
+            for nodes in entries:
+                path = initialParse
+                for node in nodes:
+                    path = path.addSuffix(node[0], name[:len(name) - node[1]] + node[2], node[3], node[4], node[5])
+                result.append(path)
+        return result
+
+    def size(self) -> int:
+        """
+        Returns the number of paths stored in the table.
+
+        RETURNS
+        -------
+        int
+            Number of paths.
+        """
+        return self.__path_count
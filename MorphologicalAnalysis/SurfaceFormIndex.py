@@ -0,0 +1,115 @@
+class SurfaceFormIndex:
+
+    __character_bits = {}
+
+    __surface_form: str
+    __remaining_masks: list
+
+    def __init__(self, surfaceForm: str):
+        """
+        Constructor of SurfaceFormIndex class. The index is constructed once for each analyzed surface form. For every
+        position i of the surface form, it stores a bitmask of the characters appearing in surfaceForm[i:], so that
+        checking whether a transition can produce one of its characters in the rest of the word is a single integer
+        AND operation.
+
+        PARAMETERS
+        ----------
+        surfaceForm : str
+            Surface form to be analyzed.
+        """
+        self.__surface_form = surfaceForm
+        self.__remaining_masks = [0] * (len(surfaceForm) + 1)
+        mask = 0
+        for i in range(len(surfaceForm) - 1, -1, -1):
+            mask = mask | SurfaceFormIndex.characterBit(surfaceForm[i])
+            self.__remaining_masks[i] = mask
+
+    @staticmethod
+    def characterBit(ch: str) -> int:
+        """
+        Returns the bit assigned to the given character. Bits are assigned to the characters when they are first seen.
+
+        PARAMETERS
+        ----------
+        ch : str
+            Character input.
+
+        RETURNS
+        -------
+        int
+            Bit of the character.
+        """
+        bit = SurfaceFormIndex.__character_bits.get(ch)
+        if bit is None:
+            bit = 1 << len(SurfaceFormIndex.__character_bits)
+            SurfaceFormIndex.__character_bits[ch] = bit
+        return bit
+
+    @staticmethod
+    def characterMask(characters) -> int:
+        """
+        Returns the bitmask of the given characters.
+
+        PARAMETERS
+        ----------
+        characters
+            Characters to include in the mask.
+
+        RETURNS
+        -------
+        int
+            Bitwise or of the bits of the characters.
+        """
+        mask = 0
+        for ch in characters:
+            mask = mask | SurfaceFormIndex.characterBit(ch)
+        return mask
+
+    def getSurfaceForm(self) -> str:
+        """
+        Getter for the indexed surface form.
+
+        RETURNS
+        -------
+        str
+            Surface form of the index.
+        """
+        return self.__surface_form
+
+    def remainingMask(self, position: int) -> int:
+        """
+        Returns the bitmask of the characters of the surface form starting from the given position.
+
+        PARAMETERS
+        ----------
+        position : int
+            Start position in the surface form.
+
+        RETURNS
+        -------
+        int
+            Bitmask of the characters in surfaceForm[position:], 0 if the position is after the end.
+        """
+        if position >= len(self.__remaining_masks):
+            return 0
+        return self.__remaining_masks[position]
+
+    def containsAnyAfter(self, position: int, mask: int) -> bool:
+        """
+        Checks if any of the characters in the mask appears in the surface form starting from the given position.
+
+        PARAMETERS
+        ----------
+        position : int
+            Start position in the surface form.
+        mask : int
+            Bitmask of the characters to search.
+
+        RETURNS
+        -------
+        bool
+            True if one of the characters appears in surfaceForm[position:], false otherwise.
+        """
+        if position >= len(self.__remaining_masks):
+            return False
+        return self.__remaining_masks[position] & mask != 0
@@ -0,0 +1,282 @@
+import collections
+
+from MorphologicalAnalysis.FrequencySketch import FrequencySketch
+
+
+class TinyLfuCache:
+
+    __window: collections.OrderedDict
+    __probation: collections.OrderedDict
+    __protected: collections.OrderedDict
+    __window_bytes: int
+    __probation_bytes: int
+    __protected_bytes: int
+    __max_bytes: int
+    __max_window_bytes: int
+    __max_protected_bytes: int
+    __weigher: object
+    __sketch: FrequencySketch
+    __hits: int
+    __misses: int
+    __evictions: int
+
+    WINDOW_RATIO = 0.01
+    PROTECTED_RATIO = 0.8
+
+    def __init__(self,
+                 maxBytes: int,
+                 weigher,
+                 expectedEntries=None):
+        """
+        Constructor of TinyLfuCache class. The cache is limited by the total size of its values in bytes, as estimated
+        by the weigher, instead of the number of its entries. It follows the W-TinyLFU policy: new entries are added
+        to a small LRU window. The entries leaving the window enter the main cache only if they are accessed more
+        often than the entry they would evict, as estimated by a FrequencySketch. The main cache is a segmented LRU,
+        whose entries accessed a second time move from the probation segment to the protected segment. Therefore,
+        tokens seen once do not evict the frequent words.
+
+        PARAMETERS
+        ----------
+        maxBytes : int
+            Maximum total size of the values in bytes.
+        weigher : function
+            Function returning the approximate size of a value in bytes.
+        expectedEntries : int
+            Expected number of entries, used for the width of the frequency sketch. If None, it is estimated as one
+            entry per kilobyte.
+        """
+        self.__window = collections.OrderedDict()
+        self.__probation = collections.OrderedDict()
+        self.__protected = collections.OrderedDict()
+        self.__window_bytes = 0
+        self.__probation_bytes = 0
+        self.__protected_bytes = 0
+        self.__max_bytes = maxBytes
+        self.__max_window_bytes = max(1, int(maxBytes * TinyLfuCache.WINDOW_RATIO))
+        self.__max_protected_bytes = int((maxBytes - self.__max_window_bytes) * TinyLfuCache.PROTECTED_RATIO)
+        self.__weigher = weigher
+        if expectedEntries is None:
+            expectedEntries = maxBytes // 1024
+        self.__sketch = FrequencySketch(expectedEntries)
+        self.__hits = 0
+        self.__misses = 0
+        self.__evictions = 0
+
+    def contains(self, key: object) -> bool:
+        """
+        Checks whether the given key is in the cache. It does not count as an access to the key.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to check.
+
+        RETURNS
+        -------
+        bool
+            True if the key is in the cache, False otherwise.
+        """
+        return key in self.__window or key in self.__probation or key in self.__protected
+
+    def get(self, key: object) -> object:
+        """
+        Returns the value of the given key and records the access in the frequency sketch. An entry of the probation
+        segment is moved to the protected segment, and if the protected segment is full, its least recently used
+        entries are moved back to the probation segment.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to search.
+
+        RETURNS
+        -------
+        object
+            Value of the key, None if the key is not in the cache.
+        """
+        self.__sketch.increment(key)
+        if key in self.__window:
+            self.__window.move_to_end(key)
+            entry = self.__window[key]
+        elif key in self.__protected:
+            self.__protected.move_to_end(key)
+            entry = self.__protected[key]
+        elif key in self.__probation:
+            entry = self.__probation.pop(key)
+            self.__probation_bytes -= entry[1]
+            self.__protected[key] = entry
+            self.__protected_bytes += entry[1]
+            while self.__protected_bytes > self.__max_protected_bytes:
+                demoted_key, demoted = self.__protected.popitem(last=False)
+                self.__protected_bytes -= demoted[1]
+                self.__probation[demoted_key] = demoted
+                self.__probation_bytes += demoted[1]
+        else:
+            self.__misses += 1
+            return None
+        self.__hits += 1
+        return entry[0]
+
+    def peek(self, key: object) -> object:
+        """
+        Returns the value of the given key without recording an access.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to search.
+
+        RETURNS
+        -------
+        object
+            Value of the key, None if the key is not in the cache.
+        """
+        for segment in (self.__window, self.__probation, self.__protected):
+            entry = segment.get(key)
+            if entry is not None:
+                return entry[0]
+        return None
+
+    def add(self,
+            key: object,
+            value: object):
+        """
+        Adds the given value to the window. The least recently used entries leaving the window are admitted to the
+        main cache or dropped. Values larger than the main cache are not stored.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key of the value.
+        value : object
+            Value to store.
+        """
+        size = self.__weigher(value)
+        self.remove(key)
+        if size > self.__max_bytes - self.__max_window_bytes:
+            self.__evictions += 1
+            return
+        self.__window[key] = (value, size)
+        self.__window_bytes += size
+        while self.__window_bytes > self.__max_window_bytes and len(self.__window) > 0:
+            candidate_key, candidate = self.__window.popitem(last=False)
+            self.__window_bytes -= candidate[1]
+            self.__admit(candidate_key, candidate)
+
+    def __admit(self,
+                key: object,
+                entry: tuple):
+        """
+        Moves an entry leaving the window to the probation segment. While the main cache is full, the entry is
+        compared with the least recently used entry of the main cache: if the entry is more frequent, the victim is
+        evicted, otherwise the entry itself is dropped.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key of the entry.
+        entry : tuple
+            Value and size of the entry.
+        """
+        max_main_bytes = self.__max_bytes - self.__max_window_bytes
+        frequency = None
+        while self.__probation_bytes + self.__protected_bytes + entry[1] > max_main_bytes:
+            if len(self.__probation) > 0:
+                segment = self.__probation
+            else:
+                segment = self.__protected
+            victim_key = next(iter(segment))
+            if frequency is None:
+                frequency = self.__sketch.frequency(key)
+            self.__evictions += 1
+            if frequency <= self.__sketch.frequency(victim_key):
+                return
+            victim = segment.pop(victim_key)
+            if segment is self.__probation:
+                self.__probation_bytes -= victim[1]
+            else:
+                self.__protected_bytes -= victim[1]
+        self.__probation[key] = entry
+        self.__probation_bytes += entry[1]
+
+    def remove(self, key: object):
+        """
+        Removes the given key from the cache.
+
+        PARAMETERS
+        ----------
+        key : object
+            Key to remove.
+        """
+        if key in self.__window:
+            self.__window_bytes -= self.__window.pop(key)[1]
+        elif key in self.__probation:
+            self.__probation_bytes -= self.__probation.pop(key)[1]
+        elif key in self.__protected:
+            self.__protected_bytes -= self.__protected.pop(key)[1]
+
+    def size(self) -> int:
+        """
+        Returns the number of entries in the cache.
+
+        RETURNS
+        -------
+        int
+            Number of entries.
+        """
+        return len(self.__window) + len(self.__probation) + len(self.__protected)
+
+    def getResidentBytes(self) -> int:
+        """
+        Returns the estimated total size of the values in the cache.
+
+        RETURNS
+        -------
+        int
+            Size in bytes.
+        """
+        return self.__window_bytes + self.__probation_bytes + self.__protected_bytes
+
+    def getMaxBytes(self) -> int:
+        """
+        Getter for the memory budget of the cache.
+
+        RETURNS
+        -------
+        int
+            Maximum size in bytes.
+        """
+        return self.__max_bytes
+
+    def getHits(self) -> int:
+        """
+        Getter for the number of lookups finding their key.
+
+        RETURNS
+        -------
+        int
+            Number of hits.
+        """
+        return self.__hits
+
+    def getMisses(self) -> int:
+        """
+        Getter for the number of lookups not finding their key.
+
+        RETURNS
+        -------
+        int
+            Number of misses.
+        """
+        return self.__misses
+
+    def getEvictions(self) -> int:
+        """
+        Getter for the number of entries evicted from or not admitted to the cache.
+
+        RETURNS
+        -------
+        int
+            Number of evictions.
+        """
+        return self.__evictions
@@ -5,6 +5,7 @@ from Language.TurkishLanguage import TurkishLanguage
 from MorphologicalAnalysis.FsmParse import FsmParse
 from MorphologicalAnalysis.MorphotacticEngine import MorphotacticEngine
 from MorphologicalAnalysis.State import State
+from MorphologicalAnalysis.SurfaceFormIndex import SurfaceFormIndex
 
 
 class Transition:
@@ -13,6 +14,23 @@ class Transition:
     __with: str
     __with_name: str
     __to_pos: str
+    __with_first_char: str
+    __starts_with_vowel_or_consonant_drop: bool
+    __search_characters: tuple
+    __search_mask: int
+    __nominal_softening_suffix: bool
+    __verbal_softening_suffix: bool
+    __to_nominal_root_adjective: bool
+    __to_adverb: bool
+    __to_aorist_state: bool
+
+    NOMINAL_SOFTENING_SUFFIXES = {"Hm", "nDAn", "ncA", "nDA", "yA", "yHm", "yHz", "yH", "nH", "nA", "nHn", "H", "sH",
+                                  "Hn", "HnHz", "HmHz"}
+    VERBAL_SOFTENING_SUFFIXES = {"yHs", "yAn", "yA", "yAcAk", "yAsH", "yHncA", "yHp", "yAlH", "yArAk", "yAdur",
+                                 "yHver", "yAgel", "yAgor", "yAbil", "yAyaz", "yAkal", "yAkoy", "yAmA", "yHcH", "HCH",
+                                 "Hr", "Hs", "Hn", "yHn", "yHnHz", "Ar", "Hl"}
+    VERBAL_ROOT_STATE = State("VerbalRoot", True, False)
+    NOMINAL_ROOT_STATE = State("NominalRoot", True, False)
 
     def __init__(self,
                  _with: str,
@@ -38,6 +56,63 @@ class Transition:
         self.__to_state = toState
         self.__with_name = withName
         self.__to_pos = toPos
+        self.__compile()
+
+    def __compile(self):
+        """
+        Precomputes the attributes of the transition that do not depend on the root or the current surface form, that
+        is the first character class of the with variable, the consonant drop and vowel start flags, the softening
+        suffix flags, the bitmask of the searched characters and the flags of the target state. The other methods of
+        the class use these attributes instead of comparing the strings on every call.
+        """
+        self.__with_first_char = "$"
+        self.__starts_with_vowel_or_consonant_drop = False
+        self.__search_characters = None
+        self.__search_mask = 0
+        self.__nominal_softening_suffix = False
+        self.__verbal_softening_suffix = False
+        if self.__with is not None:
+            if len(self.__with) == 0:
+                self.__with_first_char = "$"
+            elif self.__with[0] != "'" or len(self.__with) == 1:
+                self.__with_first_char = self.__with[0]
+            else:
+                self.__with_first_char = self.__with[1]
+            if TurkishLanguage.isConsonantDrop(self.__with_first_char) and self.__with != "ylA" and \
+                    self.__with != "ysA" and self.__with != "ymHs" and self.__with != "yDH" and self.__with != "yken":
+                self.__starts_with_vowel_or_consonant_drop = True
+            elif self.__with_first_char == "A" or self.__with_first_char == "H" or \
+                    TurkishLanguage.isVowel(self.__with_first_char):
+                self.__starts_with_vowel_or_consonant_drop = True
+            for ch in self.__with:
+                if ch == 'C':
+                    self.__search_characters = ('c', 'ç')
+                elif ch == 'D':
+                    self.__search_characters = ('d', 't')
+                elif ch == 'c' or ch == 'e' or ch == 'r' or ch == 'p' or ch == 'l' or ch == 'b' or ch == 'd' \
+                        or ch == 'g' or ch == 'o' or ch == 'm' or ch == 'v' or ch == 'i' or ch == 'ü' or ch == 'z':
+                    self.__search_characters = (ch,)
+                elif ch == 'A':
+                    self.__search_characters = ('a', 'e')
+                elif ch == 'k':
+                    self.__search_characters = ('k', 'g', 'ğ')
+                if self.__search_characters is not None:
+                    break
+            if self.__search_characters is not None:
+                self.__search_mask = SurfaceFormIndex.characterMask(self.__search_characters)
+            self.__nominal_softening_suffix = self.__with in Transition.NOMINAL_SOFTENING_SUFFIXES
+            self.__verbal_softening_suffix = self.__with.startswith("Hyor") or \
+                self.__with in Transition.VERBAL_SOFTENING_SUFFIXES
+        if self.__to_state is not None:
+            to_state_name = self.__to_state.getName()
+            self.__to_nominal_root_adjective = to_state_name == "NominalRoot(ADJ)"
+            self.__to_adverb = to_state_name == "Adverb"
+            self.__to_aorist_state = to_state_name == "AdjectiveRoot(VERB)" or to_state_name == "OtherTense" or \
+                to_state_name == "OtherTense2"
+        else:
+            self.__to_nominal_root_adjective = False
+            self.__to_adverb = False
+            self.__to_aorist_state = False
 
     def toState(self) -> State:
         """
@@ -89,22 +164,39 @@ class Transition:
         bool
             True when the transition is possible according to Turkish grammar, False otherwise.
         """
-        if len(currentSurfaceForm) == 0 or len(currentSurfaceForm) >= len(realSurfaceForm):
+        if len(currentSurfaceForm) == 0 or len(currentSurfaceForm) >= len(realSurfaceForm) \
+                or self.__search_characters is None:
             return True
         search_string = realSurfaceForm[len(currentSurfaceForm):]
-        for ch in self.__with:
-            if ch == 'C':
-                return 'c' in search_string or 'ç' in search_string
-            elif ch == 'D':
-                return 'd' in search_string or 't' in search_string
-            elif ch == 'c' or ch == 'e' or ch == 'r' or ch == 'p' or ch == 'l' or ch == 'b' or ch == 'd' or ch == 'g' \
-                    or ch == 'o' or ch == 'm' or ch == 'v' or ch == 'i' or ch == 'ü' or ch == 'z':
-                return ch in search_string
-            elif ch == 'A':
-                return 'a' in search_string or 'e' in search_string
-            elif ch == 'k':
-                return 'k' in search_string or 'g' in search_string or 'ğ' in search_string
-        return True
+        for ch in self.__search_characters:
+            if ch in search_string:
+                return True
+        return False
+
+    def transitionPossibleForSurfaceFormIndex(self,
+                                              currentSurfaceForm: str,
+                                              surfaceFormIndex: SurfaceFormIndex) -> bool:
+        """
+        Same as transitionPossibleForString, but the realSurfaceForm is given with its SurfaceFormIndex. Instead of
+        searching the characters of the transition in the rest of the surface form, the bitmask of those characters is
+        compared with the precomputed bitmask of the rest of the surface form.
+
+        PARAMETERS
+        ----------
+        currentSurfaceForm : str
+            String input.
+        surfaceFormIndex : SurfaceFormIndex
+            Index of the real surface form.
+
+        RETURNS
+        -------
+        bool
+            True when the transition is possible according to Turkish grammar, False otherwise.
+        """
+        if self.__search_mask == 0 or len(currentSurfaceForm) == 0 or \
+                len(currentSurfaceForm) >= len(surfaceFormIndex.getSurfaceForm()):
+            return True
+        return surfaceFormIndex.containsAnyAfter(len(currentSurfaceForm), self.__search_mask)
 
     def transitionPossibleForParse(self, currentFsmParse: FsmParse) -> bool:
         """
@@ -136,7 +228,7 @@ class Transition:
         :return: true if transition is possible false otherwise
         """
         if root.isAdjective() and ((root.isNominal() and not root.isExceptional()) or root.isPronoun()) \
-                and self.__to_state.getName() == "NominalRoot(ADJ)" and self.__with == "0":
+                and self.__to_nominal_root_adjective and self.__with == "0":
             return False
         if root.isAdjective() and root.isNominal() and self.__with == "^DB+VERB+ZERO+PRES+A3PL" \
                 and fromState.getName() == "AdjectiveRoot":
@@ -148,54 +240,14 @@ class Transition:
         if self.__with == "kü":
             return root.takesRelativeSuffixKu()
         if self.__with == "DHr":
-            if self.__to_state.getName() == "Adverb":
+            if self.__to_adverb:
                 return True
             else:
                 return root.takesSuffixDIRAsFactitive()
-        if self.__with == "Hr" and (
-                self.__to_state.getName() == "AdjectiveRoot(VERB)" or self.__to_state.getName() == "OtherTense" or
-                self.__to_state.getName() == "OtherTense2"):
+        if self.__with == "Hr" and self.__to_aorist_state:
             return root.takesSuffixIRAsAorist()
         return True
 
-    def __withFirstChar(self) -> str:
-        """
-        The withFirstChar method returns the first character of the with variable.
-
-        RETURNS
-        -------
-        str
-            The first character of the with variable.
-        """
-        if len(self.__with) == 0:
-            return "$"
-        if self.__with[0] != "'":
-            return self.__with[0]
-        elif len(self.__with) == 1:
-            return self.__with[0]
-        else:
-            return self.__with[1]
-
-    def __startWithVowelorConsonantDrops(self) -> bool:
-        """
-        The startWithVowelorConsonantDrops method checks for some cases. If the first character of with variable is
-        "nsy", and with variable does not equal to one of the Strings; "ylA, ysA, ymHs, yDH, yken", it returns true. If
-
-        Or, if the first character of with variable is 'A, H: or any other vowels, it returns true.
-
-        RETURNS
-        -------
-        bool
-            True if it starts with vowel or consonant drops, false otherwise.
-        """
-        if TurkishLanguage.isConsonantDrop(self.__withFirstChar()) and self.__with != "ylA" and self.__with != "ysA" \
-                and self.__with != "ymHs" and self.__with != "yDH" and self.__with != "yken":
-            return True
-        if self.__withFirstChar() == "A" or self.__withFirstChar() == "H" or \
-                TurkishLanguage.isVowel(self.__withFirstChar()):
-            return True
-        return False
-
     def softenDuringSuffixation(self, root: TxtWord, startState: State) -> bool:
         """
         The startWithVowelorConsonantDrops method checks for some cases. If the first character of with variable is
@@ -208,21 +260,11 @@ class Transition:
         bool
             True if it starts with vowel or consonant drops, false otherwise.
         """
-        if not startState.getName().startswith("VerbalRoot") and (root.isNominal() or root.isAdjective()) and root.nounSoftenDuringSuffixation() and \
-                (self.__with == "Hm" or self.__with == "nDAn" or self.__with == "ncA" or self.__with == "nDA"
-                 or self.__with == "yA" or self.__with == "yHm" or self.__with == "yHz" or self.__with == "yH"
-                 or self.__with == "nH" or self.__with == "nA" or self.__with == "nHn" or self.__with == "H"
-                 or self.__with == "sH" or self.__with == "Hn" or self.__with == "HnHz" or self.__with == "HmHz"):
+        if self.__nominal_softening_suffix and not startState.isVerbalRoot() and \
+                (root.isNominal() or root.isAdjective()) and root.nounSoftenDuringSuffixation():
             return True
-        if startState.getName().startswith("VerbalRoot") and root.isVerb() and root.verbSoftenDuringSuffixation() and \
-                (self.__with.startswith("Hyor") or self.__with == "yHs" or self.__with == "yAn" or self.__with == "yA"
-                 or self.__with == "yAcAk" or self.__with == "yAsH" or self.__with == "yHncA" or self.__with == "yHp"
-                 or self.__with == "yAlH" or self.__with == "yArAk" or self.__with == "yAdur" or self.__with == "yHver"
-                 or self.__with == "yAgel" or self.__with == "yAgor" or self.__with == "yAbil" or self.__with == "yAyaz"
-                 or self.__with == "yAkal" or self.__with == "yAkoy" or self.__with == "yAmA" or self.__with == "yHcH"
-                 or self.__with == "yHs" or self.__with == "HCH" or self.__with == "Hr" or self.__with == "Hs"
-                 or self.__with == "Hn" or self.__with == "yHn" or self.__with == "yHnHz" or self.__with == "Ar"
-                 or self.__with == "Hl"):
+        if self.__verbal_softening_suffix and startState.isVerbalRoot() and root.isVerb() and \
+                root.verbSoftenDuringSuffixation():
             return True
         return False
 
@@ -245,9 +287,9 @@ class Transition:
             String type output that has the transition.
         """
         if root.isVerb():
-            return self.makeTransition(root, stem, State("VerbalRoot", True, False))
+            return self.makeTransition(root, stem, Transition.VERBAL_ROOT_STATE)
         else:
-            return self.makeTransition(root, stem, State("NominalRoot", True, False))
+            return self.makeTransition(root, stem, Transition.NOMINAL_ROOT_STATE)
 
     def makeTransition(self,
                        root: TxtWord,
@@ -283,7 +325,7 @@ class Transition:
             if stem == "sen":
                 return "sana"
         formation_to_check = stem
-        if root_word and self.__withFirstChar() == "y" and root.vowelEChangesToIDuringYSuffixation() \
+        if root_word and self.__with_first_char == "y" and root.vowelEChangesToIDuringYSuffixation() \
                 and (self.__with[1] != "H" or root.getName() == "ye"):
             formation = stem[:len(stem) - 1] + "i"
             formation_to_check = formation
@@ -292,13 +334,13 @@ class Transition:
                 formation = stem[:len(stem) - 2] + stem[len(stem) - 1]
                 formation_to_check = stem
             else:
-                if root_word and root.showsSuRegularities() and self.__startWithVowelorConsonantDrops():
+                if root_word and root.showsSuRegularities() and self.__starts_with_vowel_or_consonant_drop:
                     formation = stem + 'y'
                     i = 1
                     formation_to_check = formation
                 else:
-                    if root_word and root.duplicatesDuringSuffixation() and not startState.getName().startswith(
-                                    "VerbalRoot") and TurkishLanguage.isConsonantDrop(self.__with[0]):
+                    if root_word and root.duplicatesDuringSuffixation() and not startState.isVerbalRoot() and \
+                            TurkishLanguage.isConsonantDrop(self.__with[0]):
                         if self.softenDuringSuffixation(root, startState):
                             if Word.lastPhoneme(stem) == "p":
                                 formation = stem[:len(stem) - 1] + "bb"
@@ -309,9 +351,8 @@ class Transition:
                         formation_to_check = formation
                     else:
                         if root_word and root.lastIdropsDuringSuffixation() and \
-                                not startState.getName().startswith(
-                                    "VerbalRoot") and not startState.getName().startswith("ProperRoot") \
-                                and self.__startWithVowelorConsonantDrops():
+                                not startState.isVerbalRoot() and not startState.isProperRoot() \
+                                and self.__starts_with_vowel_or_consonant_drop:
                             if self.softenDuringSuffixation(root, startState):
                                 if Word.lastPhoneme(stem) == "p":
                                     formation = stem[:len(stem) - 2] + 'b'
@@ -324,32 +365,33 @@ class Transition:
                             formation_to_check = stem
                         else:
                             if Word.lastPhoneme(stem) == "p":
-                                if self.__startWithVowelorConsonantDrops() and root_word and \
+                                if self.__starts_with_vowel_or_consonant_drop and root_word and \
                                         self.softenDuringSuffixation(root, startState):
                                     formation = stem[:len(stem) - 1] + 'b'
                             elif Word.lastPhoneme(stem) == "t":
-                                if self.__startWithVowelorConsonantDrops() and root_word and \
+                                if self.__starts_with_vowel_or_consonant_drop and root_word and \
                                         self.softenDuringSuffixation(root, startState):
                                     formation = stem[:len(stem) - 1] + 'd'
                             elif Word.lastPhoneme(stem) == "ç":
-                                if self.__startWithVowelorConsonantDrops() and root_word and \
+                                if self.__starts_with_vowel_or_consonant_drop and root_word and \
                                         self.softenDuringSuffixation(root, startState):
                                     formation = stem[:len(stem) - 1] + 'c'
                             elif Word.lastPhoneme(stem) == "g":
-                                if self.__startWithVowelorConsonantDrops() and root_word and \
+                                if self.__starts_with_vowel_or_consonant_drop and root_word and \
                                         self.softenDuringSuffixation(root, startState):
                                     formation = stem[:len(stem) - 1] + 'ğ'
                             elif Word.lastPhoneme(stem) == "k":
-                                if self.__startWithVowelorConsonantDrops() and root_word and root.endingKChangesIntoG() \
-                                        and (not root.isProperNoun() or startState.__str__() != "ProperRoot"):
+                                if self.__starts_with_vowel_or_consonant_drop and root_word and \
+                                        root.endingKChangesIntoG() and \
+                                        (not root.isProperNoun() or not startState.isProperRoot()):
                                     formation = stem[:len(stem) - 1] + 'g'
                                 else:
-                                    if self.__startWithVowelorConsonantDrops() and (not root_word or (
+                                    if self.__starts_with_vowel_or_consonant_drop and (not root_word or (
                                             self.softenDuringSuffixation(root, startState) and (
-                                            not root.isProperNoun() or startState.__str__() != "ProperRoot"))):
+                                            not root.isProperNoun() or not startState.isProperRoot()))):
                                         formation = stem[:len(stem) - 1] + 'ğ'
                             formation_to_check = formation
-        if TurkishLanguage.isConsonantDrop(self.__withFirstChar()) and not TurkishLanguage.isVowel(stem[len(stem) - 1])\
+        if TurkishLanguage.isConsonantDrop(self.__with_first_char) and not TurkishLanguage.isVowel(stem[len(stem) - 1])\
                 and (root.isNumeral() or root.isReal() or root.isFraction() or root.isTime() or root.isDate()
                      or root.isPercent() or root.isRange()) \
                 and (root.getName().endswith("1") or root.getName().endswith("3") or root.getName().endswith("4")
@@ -363,7 +405,7 @@ class Transition:
             else:
                 i = 1
         else:
-            if (TurkishLanguage.isConsonantDrop(self.__withFirstChar()) and TurkishLanguage.isConsonant(
+            if (TurkishLanguage.isConsonantDrop(self.__with_first_char) and TurkishLanguage.isConsonant(
                     Word.lastPhoneme(stem))) or (root_word and root.consonantSMayInsertedDuringPossesiveSuffixation()):
                 if self.__with[0] == "'":
                     formation = formation + "'"
@@ -15,6 +15,8 @@ setup(
     author_email='olcay.yildiz@ozyegin.edu.tr',
     description='Turkish Morphological Analysis',
     install_requires=['NlpToolkit-Dictionary', 'NlpToolkit-Corpus', 'NlpToolkit-DataStructure'],
+    entry_points={'console_scripts': ['fsm-analysis-server=MorphologicalAnalysis.AnalysisServer:main',
+                                    'fsm-analyze-corpus=MorphologicalAnalysis.StreamingCorpusAnalyzer:main']},
     long_description=long_description,
     long_description_content_type='text/markdown'
 )
@@ -0,0 +1,65 @@
+import unittest
+
+from Dictionary.TxtWord import TxtWord
+
+from MorphologicalAnalysis.AllomorphResolutionCache import AllomorphResolutionCache
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.Transition import Transition
+
+
+class AllomorphResolutionCacheTest(unittest.TestCase):
+
+    fsm: FiniteStateMachine
+
+    def setUp(self) -> None:
+        self.fsm = FiniteStateMachine("../MorphologicalAnalysis/data/turkish_finite_state_machine.xml")
+
+    def findTransition(self, stateName: str, _with: str) -> Transition:
+        for transition in self.fsm.getTransitions(self.fsm.getState(stateName)):
+            if transition.__str__() == _with:
+                return transition
+        return None
+
+    def test_SameResultAsMakeTransition(self):
+        cache = AllomorphResolutionCache()
+        nominal_root = self.fsm.getState("NominalRoot")
+        plural = self.findTransition("NominalRoot", "lAr")
+        kitap = TxtWord("kitap", "CL_ISIM")
+        kitap.addFlag("IS_SD")
+        ev = TxtWord("ev", "CL_ISIM")
+        for root, stem in [(kitap, "kitap"), (ev, "ev"), (kitap, "kitabı"), (ev, "evde"), (ev, "evdeki")]:
+            for i in range(2):
+                self.assertEqual(plural.makeTransition(root, stem, nominal_root),
+                                 cache.makeTransition(plural, root, stem, nominal_root))
+
+    def test_Counters(self):
+        cache = AllomorphResolutionCache()
+        nominal_root = self.fsm.getState("NominalRoot")
+        plural = self.findTransition("NominalRoot", "lAr")
+        ev = TxtWord("ev", "CL_ISIM")
+        self.assertEqual(0.0, cache.hitRate())
+        self.assertEqual("evdekiler", cache.makeTransition(plural, ev, "evdeki", nominal_root))
+        self.assertEqual("evimdekiler", cache.makeTransition(plural, ev, "evimdeki", nominal_root))
+        self.assertEqual("eller", cache.makeTransition(plural, ev, "el", nominal_root))
+        self.assertEqual(2, cache.size())
+        self.assertEqual(1, cache.getHits())
+        self.assertEqual(2, cache.getMisses())
+        cache.clear()
+        self.assertEqual(0, cache.size())
+        self.assertEqual(0, cache.getHits())
+
+    def test_AnalyzerHitRate(self):
+        fsm = FsmMorphologicalAnalyzer()
+        cache = fsm.getAllomorphResolutionCache()
+        for word in ["evlerimizde", "kitaplarımızda", "arabalarımızda", "masalarımızda", "okullarımızda"]:
+            self.assertTrue(fsm.morphologicalAnalysis(word).size() != 0)
+        hits = cache.getHits()
+        misses = cache.getMisses()
+        for word in ["evlerimizden", "kitaplarımızdan", "arabalarımızdan", "masalarımızdan", "okullarımızdan"]:
+            self.assertTrue(fsm.morphologicalAnalysis(word).size() != 0)
+        self.assertTrue(cache.getHits() - hits > 9 * (cache.getMisses() - misses))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import unittest
+
+from MorphologicalAnalysis.AnalysisCache import AnalysisCache
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class AnalysisCacheTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+
+    def test_NormalizedKey(self):
+        self.assertEqual(AnalysisCache.normalizedKey("Ankara", "ankara", True),
+                         AnalysisCache.normalizedKey("ANKARA", "ankara", True))
+        self.assertNotEqual(AnalysisCache.normalizedKey("Ankara", "ankara", True),
+                            AnalysisCache.normalizedKey("ankara", "ankara", False))
+
+    def test_SharedEntry(self):
+        self.fsm.enableSearchStatistics()
+        self.fsm.morphologicalAnalysis("Ankara'da")
+        self.fsm.morphologicalAnalysis("ANKARA'DA")
+        self.assertEqual(1, self.fsm.getSearchStatistics().getCounter("analysis_cache_hits"))
+
+    def test_CachedResultNotModified(self):
+        first = self.fsm.morphologicalAnalysis("gelir")
+        size = first.size()
+        self.assertTrue(size > 1)
+        first.reduceToParsesWithSameRoot("gel")
+        self.assertTrue(first.size() < size)
+        second = self.fsm.morphologicalAnalysis("gelir")
+        self.assertEqual(size, second.size())
+        second.reduceToParsesWithSameRoot("gel")
+        self.assertEqual(first.size(), second.size())
+        self.assertEqual(size, self.fsm.morphologicalAnalysis("gelir").size())
+
+    def test_CachedParseNotModified(self):
+        first = self.fsm.morphologicalAnalysis("kitabı")
+        surface_forms = [parse.getSurfaceForm() for parse in first.toTuple()]
+        for parse in first.toTuple():
+            parse.setForm("değişti")
+        second = self.fsm.morphologicalAnalysis("kitabı")
+        self.assertEqual(surface_forms, [parse.getSurfaceForm() for parse in second.toTuple()])
+        second.getFsmParse(0).restoreOriginalForm("Kitap", "kitap")
+        third = self.fsm.morphologicalAnalysis("kitabı")
+        self.assertEqual(surface_forms, [parse.getSurfaceForm() for parse in third.toTuple()])
+        self.assertEqual(second.getFsmParse(1).transitionList(), third.getFsmParse(1).transitionList())
+
+    def test_PeekKeepsRecency(self):
+        cache = AnalysisCache(2)
+        cache.add(("kitabı", False, False), self.fsm.morphologicalAnalysis("kitabı"))
+        cache.add(("gelir", False, False), self.fsm.morphologicalAnalysis("gelir"))
+        self.assertIsNotNone(cache.peek(("kitabı", False, False)))
+        cache.add(("evler", False, False), self.fsm.morphologicalAnalysis("evler"))
+        self.assertFalse(cache.contains(("kitabı", False, False)))
+        self.assertTrue(cache.contains(("gelir", False, False)))
+        self.assertEqual(0, cache.getHits())
+
+    def test_ByteBudget(self):
+        fsm = FsmMorphologicalAnalyzer(cacheBytes=100000)
+        for i in range(3):
+            fsm.morphologicalAnalysis("gelir")
+            fsm.morphologicalAnalysis("kitabı")
+        cache = fsm.getAnalysisCache()
+        self.assertEqual(4, cache.getHits())
+        self.assertEqual(2, cache.getMisses())
+        self.assertTrue(0 < cache.getResidentBytes() <= 100000)
+        self.assertEqual(0, cache.getEvictions())
+
+    def test_WarmCache(self):
+        self.assertEqual(2, self.fsm.warmCache(["kitabı", "gelir", "kitabı", "xqzvw"], 2))
+        self.fsm.enableSearchStatistics()
+        self.fsm.morphologicalAnalysis("kitabı")
+        self.fsm.morphologicalAnalysis("gelir")
+        self.assertEqual(2, self.fsm.getSearchStatistics().getCounter("analysis_cache_hits"))
+
+    def test_CacheSnapshot(self):
+        handle, file_name = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            self.fsm.warmCache({"kitabı": 5, "gelir": 3, "Ankara'da": 1})
+            self.assertEqual(3, self.fsm.saveCacheSnapshot(file_name))
+            fsm = FsmMorphologicalAnalyzer()
+            self.assertEqual(3, fsm.loadCacheSnapshot(file_name))
+            fsm.enableSearchStatistics()
+            for word in ["kitabı", "gelir", "Ankara'da"]:
+                self.assertEqual([parse.__str__() for parse in self.fsm.morphologicalAnalysis(word).toTuple()],
+                                 [parse.__str__() for parse in fsm.morphologicalAnalysis(word).toTuple()])
+            self.assertEqual(3, fsm.getSearchStatistics().getCounter("analysis_cache_hits"))
+        finally:
+            os.remove(file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
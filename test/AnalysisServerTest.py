@@ -0,0 +1,143 @@
+import asyncio
+import gc
+import json
+import os
+import socket
+import tempfile
+import threading
+import unittest
+import warnings
+
+from MorphologicalAnalysis.AnalysisClient import AnalysisClient
+from MorphologicalAnalysis.AnalysisServer import AnalysisServer
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class AnalysisServerTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+    server: AnalysisServer
+    thread: threading.Thread
+    directory: tempfile.TemporaryDirectory
+    socket_path: str
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+        self.directory = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.directory.name, "analyzer.sock")
+        self.thread = None
+        self.startServer(AnalysisServer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()), 0.05))
+
+    def startServer(self, server: AnalysisServer):
+        if self.thread is not None:
+            self.stopServer()
+        self.server = server
+        self.thread = threading.Thread(target=asyncio.run, args=(self.server.serve(self.socket_path),))
+        self.thread.start()
+        self.assertTrue(self.server.waitUntilReady(60))
+
+    def stopServer(self):
+        self.server.close()
+        self.thread.join()
+        self.thread = None
+
+    def tearDown(self) -> None:
+        if self.thread is not None:
+            self.stopServer()
+        self.directory.cleanup()
+
+    def connect(self) -> socket.socket:
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.connect(self.socket_path)
+        return connection
+
+    def test_Analyze(self):
+        words = ["kitabı", "Ankara'da", "gelir", "xyzqw", "kitabı"]
+        client = AnalysisClient(self.socket_path)
+        analyses = client.analyze(words)
+        client.close()
+        for word, word_analyses in zip(words, analyses):
+            self.assertEqual([parse.__str__() for parse in self.fsm.morphologicalAnalysis(word).toTuple()],
+                             word_analyses)
+
+    def test_Batching(self):
+        self.startServer(AnalysisServer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()), 60, 16))
+        results = {}
+
+        def analyze(index: int):
+            client = AnalysisClient(self.socket_path)
+            results[index] = client.analyze(["kitabı", "evlerimizden"])
+            client.close()
+        threads = [threading.Thread(target=analyze, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(8, len(results))
+        self.assertEqual(8, self.server.getRequests())
+        self.assertEqual(1, self.server.getBatches())
+
+    def test_InvalidRequest(self):
+        connection = self.connect()
+        connection.sendall(b"not json\n{\"id\": 3, \"word\": \"ev\"}\n")
+        input_file = connection.makefile("rb")
+        first = json.loads(input_file.readline())
+        second = json.loads(input_file.readline())
+        input_file.close()
+        connection.close()
+        self.assertTrue("error" in first)
+        self.assertEqual(3, second["id"])
+        self.assertTrue(len(second["analyses"]) > 0)
+
+    def test_InvalidWordWithEmptyWords(self):
+        connection = self.connect()
+        connection.sendall(b"{\"id\": 1, \"word\": 5, \"words\": []}\n")
+        input_file = connection.makefile("rb")
+        first = json.loads(input_file.readline())
+        input_file.close()
+        connection.close()
+        self.assertEqual(1, first["id"])
+        self.assertEqual([], first["analyses"])
+        client = AnalysisClient(self.socket_path)
+        analyses = client.analyze(["ev"])
+        client.close()
+        self.assertTrue(len(analyses[0]) > 0)
+
+    def test_LongRequest(self):
+        self.startServer(AnalysisServer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()), 0.05, lineLimit=1024))
+        connection = self.connect()
+        connection.sendall(b"{\"id\": 1, \"words\": [" + b"\"ev\", " * 1000 + b"\"ev\"]}\n")
+        input_file = connection.makefile("rb")
+        first = json.loads(input_file.readline())
+        input_file.close()
+        connection.close()
+        self.assertIsNone(first["id"])
+        self.assertTrue("error" in first)
+        client = AnalysisClient(self.socket_path)
+        analyses = client.analyze(["ev"])
+        client.close()
+        self.assertTrue(len(analyses[0]) > 0)
+
+    def test_CloseWithPendingRequest(self):
+        self.startServer(AnalysisServer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()), 60))
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            with self.assertNoLogs("asyncio", level="WARNING"):
+                connection = self.connect()
+                connection.sendall(b"{\"id\": 1, \"word\": \"ev\"}\n")
+                input_file = connection.makefile("rb")
+                while self.server.getRequests() == 0:
+                    threading.Event().wait(0.01)
+                self.stopServer()
+                first = json.loads(input_file.readline())
+                self.assertEqual(b"", input_file.readline())
+                input_file.close()
+                connection.close()
+                gc.collect()
+        self.assertEqual(1, first["id"])
+        self.assertEqual(AnalysisServer.SHUTDOWN_ERROR, first["error"])
+        self.assertEqual([], [warning for warning in caught if issubclass(warning.category, ResourceWarning)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class AnalyzerCoreTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+
+    def test_SharedCore(self):
+        fsm = FsmMorphologicalAnalyzer(cacheSize=100, core=self.fsm.getCore())
+        self.assertIs(self.fsm.getDictionary(), fsm.getDictionary())
+        self.assertIs(self.fsm.getFiniteStateMachine(), fsm.getFiniteStateMachine())
+        self.assertEqual([parse.__str__() for parse in self.fsm.morphologicalAnalysis("kitabı").toTuple()],
+                         [parse.__str__() for parse in fsm.morphologicalAnalysis("kitabı").toTuple()])
+
+    def test_NewRootsNotShared(self):
+        fsm = FsmMorphologicalAnalyzer(core=self.fsm.getCore())
+        fsm.rootOfPossiblyNewWord("googlelaştırdık")
+        self.assertTrue(fsm.morphologicalAnalysis("googlelaştırdık").size() > 0)
+        self.assertEqual(0, self.fsm.morphologicalAnalysis("googlelaştırdık").size())
+
+    def test_CoreNotModified(self):
+        flags = self.fsm.getDictionary().getWord("ekmek").__str__()
+        self.assertTrue(self.fsm.morphologicalAnalysis("Ekmek'in").size() > 0)
+        self.assertEqual(flags, self.fsm.getDictionary().getWord("ekmek").__str__())
+
+
+if __name__ == '__main__':
+    unittest.main()
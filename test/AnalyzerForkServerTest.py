@@ -0,0 +1,80 @@
+import gc
+import os
+import signal
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from MorphologicalAnalysis.AnalyzerForkServer import AnalyzerForkServer
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class AnalyzerForkServerTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+    server: AnalyzerForkServer
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+        self.server = AnalyzerForkServer(self.fsm, 2)
+        self.server.start()
+
+    def tearDown(self) -> None:
+        self.server.stop()
+
+    def test_Analyze(self):
+        words = ["kitabı", "Ankara'da", "gelir", "kitabı", "xyzqw", "12'de", "evlerimizden"] * 3
+        result = self.server.analyze(words, 2)
+        self.assertEqual(len(words), len(result))
+        for word, parse_list in zip(words, result):
+            self.assertEqual([parse.__str__() for parse in self.fsm.morphologicalAnalysis(word).toTuple()],
+                             [parse.__str__() for parse in parse_list.toTuple()])
+
+    def test_SeveralCallers(self):
+        words = ["kitabı", "Ankara'da", "gelir", "xyzqw", "12'de", "evlerimizden", "çocuklarımızın", "okuldaki"]
+        expected = [[parse.__str__() for parse in self.fsm.morphologicalAnalysis(word).toTuple()] for word in words]
+
+        def analyzeAll(i: int) -> bool:
+            shifted = words[i % len(words):] + words[:i % len(words)]
+            result = self.server.analyze(shifted, 1)
+            return [[parse.__str__() for parse in parse_list.toTuple()] for parse_list in result] == \
+                expected[i % len(words):] + expected[:i % len(words)]
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(analyzeAll, i) for i in range(40)]
+            for future in futures:
+                self.assertTrue(future.result(timeout=60))
+
+    def test_WorkerExited(self):
+        dictionary = self.fsm.getDictionary()
+        words = [dictionary.getWordWithIndex(i).getName() + "lerimizden" for i in range(0, dictionary.size(), 20)]
+        pid = list(self.server.getWorkerMemory().keys())[1]
+        os.kill(pid, signal.SIGKILL)
+        timeout = AnalyzerForkServer.TIMEOUT
+        AnalyzerForkServer.TIMEOUT = 0.1
+        try:
+            self.assertRaises(ValueError, self.server.analyze, words)
+        finally:
+            AnalyzerForkServer.TIMEOUT = timeout
+        self.assertEqual(1, len(self.server.analyze(["kitabı"])))
+        self.assertEqual({}, self.server._AnalyzerForkServer__finished)
+
+    def test_WorkerMemory(self):
+        self.server.analyze(["kitabı", "evlerimizden", "çocuklarımızın"])
+        self.assertTrue(gc.get_freeze_count() > 0)
+        memory = self.server.getWorkerMemory()
+        self.assertEqual(2, len(memory))
+        if not os.path.exists("/proc/self/status") or None in memory.values():
+            self.skipTest("The unique memory of a process can only be read from /proc/<pid>/smaps_rollup")
+        with open("/proc/self/status", "r") as input_file:
+            lines = [line for line in input_file.readlines() if line.startswith("VmRSS:")]
+        server_memory = int(lines[0].split()[1]) * 1024
+        for worker_memory in memory.values():
+            self.assertTrue(worker_memory < server_memory / 2)
+
+    def test_NotStarted(self):
+        self.server.stop()
+        self.assertEqual(0, gc.get_freeze_count())
+        self.assertRaises(ValueError, self.server.analyze, ["kitabı"])
+
+
+if __name__ == '__main__':
+    unittest.main()
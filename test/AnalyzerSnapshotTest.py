@@ -0,0 +1,55 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+
+from MorphologicalAnalysis.AnalyzerCore import AnalyzerCore
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class AnalyzerSnapshotTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+    file_name: str
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+        handle, self.file_name = tempfile.mkstemp(suffix=".snap")
+        os.close(handle)
+
+    def tearDown(self) -> None:
+        os.remove(self.file_name)
+
+    def test_SameAnalyses(self):
+        self.fsm.saveSnapshot(self.file_name)
+        fsm = FsmMorphologicalAnalyzer.fromSnapshot(self.file_name)
+        for word in ["kitabı", "Ankara'da", "gelir", "12'de", "yüzü", "googlelaştırdık"]:
+            self.assertEqual([parse.__str__() for parse in self.fsm.morphologicalAnalysis(word).toTuple()],
+                             [parse.__str__() for parse in fsm.morphologicalAnalysis(word).toTuple()])
+
+    def test_ColdStart(self):
+        self.fsm.saveSnapshot(self.file_name)
+        with mock.patch("MorphologicalAnalysis.FiniteStateMachine.FiniteStateMachine.__init__",
+                        side_effect=AssertionError("finite state machine read")), \
+                mock.patch("Dictionary.TxtDictionary.TxtDictionary.__init__",
+                           side_effect=AssertionError("dictionary read")), \
+                mock.patch("Dictionary.TxtDictionary.TxtDictionary.prepareTrie",
+                           side_effect=AssertionError("trie built")):
+            fsm = FsmMorphologicalAnalyzer.fromSnapshot(self.file_name)
+            self.assertTrue(fsm.morphologicalAnalysis("kitabı").size() > 0)
+
+    def test_InvalidFile(self):
+        with open(self.file_name, "wb") as output_file:
+            output_file.write(b"not a snapshot")
+        self.assertRaises(ValueError, FsmMorphologicalAnalyzer.fromSnapshot, self.file_name)
+
+    def test_RefusesOtherClasses(self):
+        with open(self.file_name, "wb") as output_file:
+            output_file.write(AnalyzerCore.SNAPSHOT_MAGIC + bytes([AnalyzerCore.SNAPSHOT_VERSION]))
+            pickle.dump({"dictionary": os.getcwd}, output_file)
+        self.assertRaises(pickle.UnpicklingError, FsmMorphologicalAnalyzer.fromSnapshot, self.file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class AnalyzerThreadingTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+    words: list
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+        self.words = ["kitabı", "Ankara'da", "Ekmek'in", "ekmeğin", "gelir", "12'de", "3/4'ü", "%12'si", "yüzü",
+                      "T.C.", "Googlea'nın", "googleanın", "abzürtleşenmiş", "evlerimizden", "sabahleyin",
+                      "çocuklarımızın", "okuldaki", "McDonald's'ta"] * 20
+
+    def analyses(self,
+                 fsm: FsmMorphologicalAnalyzer,
+                 word: str) -> list:
+        return [parse.__str__() for parse in fsm.morphologicalAnalysis(word).toTuple()]
+
+    def test_SameAnalysesInThreads(self):
+        expected = [self.analyses(self.fsm, word) for word in self.words]
+        fsm = FsmMorphologicalAnalyzer(core=self.fsm.getCore())
+        with ThreadPoolExecutor(8) as executor:
+            result = list(executor.map(lambda word: self.analyses(fsm, word), self.words))
+        self.assertEqual(expected, result)
+
+    def test_OrderIndependent(self):
+        self.assertTrue(self.fsm.morphologicalAnalysis("Googlea'nın").size() > 0)
+        fsm = FsmMorphologicalAnalyzer(core=self.fsm.getCore())
+        self.assertEqual(self.analyses(fsm, "googleanın"), self.analyses(self.fsm, "googleanın"))
+        self.assertEqual(self.analyses(fsm, "ekmeğin"), self.analyses(self.fsm, "ekmeğin"))
+
+    def test_NewRootsInThreads(self):
+        fsm = FsmMorphologicalAnalyzer(core=self.fsm.getCore())
+        words = ["googlelaştırdık", "zaptıraplaştırılmayana", "abzürtleşenmiş", "vışlığından"]
+        with ThreadPoolExecutor(4) as executor:
+            list(executor.map(fsm.rootOfPossiblyNewWord, words * 10))
+        self.assertTrue(fsm.morphologicalAnalysis("googlelaştırdık").size() > 0)
+        self.assertEqual(0, self.fsm.morphologicalAnalysis("googlelaştırdık").size())
+
+    def test_AnalyzeManyWhileAnalyzing(self):
+        fsm = FsmMorphologicalAnalyzer(core=self.fsm.getCore(), cacheSize=1)
+        words = list(dict.fromkeys(self.words))
+        expected = [self.analyses(fsm, word) for word in words]
+        stopped = threading.Event()
+
+        def analyzeInBackground():
+            while not stopped.is_set():
+                for word in words:
+                    fsm.morphologicalAnalysis(word)
+
+        background = threading.Thread(target=analyzeInBackground, daemon=True)
+        background.start()
+        try:
+            for i in range(20):
+                result = []
+                worker = threading.Thread(target=lambda: result.append(fsm.analyzeMany(words, 4)), daemon=True)
+                worker.start()
+                worker.join(60)
+                self.assertFalse(worker.is_alive())
+                self.assertEqual(expected, [[parse.__str__() for parse in parse_list.toTuple()]
+                                            for parse_list in result[0]])
+        finally:
+            stopped.set()
+            background.join()
+
+
+if __name__ == '__main__':
+    unittest.main()
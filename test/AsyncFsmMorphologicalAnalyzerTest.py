@@ -0,0 +1,81 @@
+import asyncio
+import unittest
+
+from Corpus.Sentence import Sentence
+
+from MorphologicalAnalysis.AsyncFsmMorphologicalAnalyzer import AsyncFsmMorphologicalAnalyzer
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class AsyncFsmMorphologicalAnalyzerTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+    analyzer: AsyncFsmMorphologicalAnalyzer
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+        self.analyzer = AsyncFsmMorphologicalAnalyzer(self.fsm, 2)
+
+    def tearDown(self) -> None:
+        self.analyzer.close()
+
+    def test_Coalescing(self):
+        async def analyzeAll():
+            return await asyncio.gather(*[self.analyzer.analyze("kitaplarımızdan") for _ in range(50)])
+        parse_lists = asyncio.run(analyzeAll())
+        self.assertEqual(1, self.analyzer.getAnalyses())
+        self.assertEqual(49, self.analyzer.getCoalesced())
+        self.assertEqual(0, self.fsm.getAnalysisCache().getHits())
+        self.assertIsNot(parse_lists[0], parse_lists[1])
+        self.assertEqual(self.fsm.morphologicalAnalysis("kitaplarımızdan").size(), parse_lists[0].size())
+
+    def test_ExactSurfaceForm(self):
+        async def analyzeAll():
+            return await asyncio.gather(self.analyzer.analyze("Kitabı"), self.analyzer.analyze("KİTABI"))
+        first, second = asyncio.run(analyzeAll())
+        self.assertEqual(first.size(), second.size())
+        self.assertEqual(2, self.analyzer.getAnalyses())
+        self.assertEqual(0, self.analyzer.getCoalesced())
+
+    def test_MaxPending(self):
+        analyzer = AsyncFsmMorphologicalAnalyzer(self.fsm, 2, maxPending=3)
+        words = ["kitabı", "Ankara'da", "gelir", "evlerimizden", "okula", "gittiler", "çocuklar", "yüzü", "sabahleyin",
+                 "okuldaki"]
+        task_counts = []
+
+        async def count(analyses: asyncio.Future):
+            while not analyses.done():
+                task_counts.append(len(asyncio.all_tasks()))
+                await asyncio.sleep(0)
+
+        async def analyzeAll():
+            analyses = asyncio.gather(*[analyzer.analyze(word) for word in words])
+            await asyncio.gather(analyses, count(analyses))
+            return analyses.result()
+        result = asyncio.run(analyzeAll())
+        analyzer.close()
+        self.assertEqual(len(words), len(result))
+        self.assertEqual(len(words), analyzer.getAnalyses())
+        self.assertTrue(max(task_counts) <= 2 + len(words) + 3)
+
+    def test_AnalyzeSentence(self):
+        sentence = Sentence("Ankara'da kitapları okuyan çocuklar okula gittiler .")
+        expected = [[parse.__str__() for parse in parse_list.toTuple()]
+                    for parse_list in self.fsm.morphologicalAnalysis(sentence)]
+        result = asyncio.run(self.analyzer.analyzeSentence(sentence))
+        self.assertEqual(expected, [[parse.__str__() for parse in parse_list.toTuple()] for parse_list in result])
+
+    def test_SeveralEventLoops(self):
+        words = ["kitabı", "Ankara'da", "gelir", "evlerimizden", "okula", "gittiler", "çocuklar", "yüzü", "sabahleyin",
+                 "okuldaki"]
+        expected = [[parse.__str__() for parse in self.fsm.morphologicalAnalysis(word).toTuple()] for word in words]
+
+        async def analyzeAll():
+            return await asyncio.gather(*[self.analyzer.analyze(word) for word in words])
+        for i in range(2):
+            result = asyncio.run(analyzeAll())
+            self.assertEqual(expected, [[parse.__str__() for parse in parse_list.toTuple()] for parse_list in result])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,6 +41,17 @@ class FiniteStateMachineTest(unittest.TestCase):
         self.assertEqual(1, posCounts.get("DUP"))
         self.assertEqual(11, posCounts.get("NOUN"))
 
+    def test_RootStates(self):
+        verbalRootCount = 0
+        properRootCount = 0
+        for state in self.stateList:
+            if state.isVerbalRoot():
+                verbalRootCount = verbalRootCount + 1
+            if state.isProperRoot():
+                properRootCount = properRootCount + 1
+        self.assertEqual(25, verbalRootCount)
+        self.assertEqual(1, properRootCount)
+
     def test_TransitionCount(self):
         transitionCount = 0
         for state in self.stateList:
@@ -225,6 +225,26 @@ class FsmMorphologicalAnalyzerTest(unittest.TestCase):
         self.assertEqual("Yemin billah vermişlerdi vazoyu kırmadığına", self.fsm.replaceWord(Sentence("Yemin etmişlerdi vazoyu kırmadığına"), "yemin et", "yemin billah ver").__str__())
         self.assertEqual("Yemin etmişlerdi vazoyu kırmadığına", self.fsm.replaceWord(Sentence("Yemin billah vermişlerdi vazoyu kırmadığına"), "yemin billah ver", "yemin et").__str__())
 
+    def test_preload(self):
+        self.fsm.preload()
+        self.assertTrue(len(self.fsm.rootOfPossiblyNewWord("googlelaştırdık")) > 0)
+        self.assertTrue(self.fsm.morphologicalAnalysis("Won'u").size() != 0)
+
+    def test_analyzeMany(self):
+        tokens = ["kitabı", "Ankara'da", "gelir", "kitabı", "xyzqw", "12'de", "gelir", "evlerimizden"] * 3
+        expected = [[parse.__str__() for parse in self.fsm.morphologicalAnalysis(token).toTuple()]
+                    for token in tokens]
+        for workers in [1, 2]:
+            fsm = FsmMorphologicalAnalyzer(core=self.fsm.getCore())
+            result = fsm.analyzeMany(iter(tokens), workers=workers, chunkSize=2)
+            self.assertEqual(expected, [[parse.__str__() for parse in parse_list.toTuple()] for parse_list in result])
+            self.assertIsNot(result[0], result[3])
+            self.assertEqual(1, fsm.getNegativeCache().size())
+            self.assertEqual(0, fsm.getNegativeCache().getHits())
+            result = fsm.analyzeMany(tokens, workers=workers, chunkSize=2)
+            self.assertEqual(expected, [[parse.__str__() for parse in parse_list.toTuple()] for parse_list in result])
+            self.assertEqual(1, fsm.getNegativeCache().getHits())
+
 
 if __name__ == '__main__':
     unittest.main()
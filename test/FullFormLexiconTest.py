@@ -0,0 +1,45 @@
+import os
+import tempfile
+import unittest
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.FullFormLexicon import FullFormLexicon
+
+
+class FullFormLexiconTest(unittest.TestCase):
+
+    def test_WriteAndRead(self):
+        file_name = os.path.join(tempfile.mkdtemp(), "lexicon.bin")
+        entries = {}
+        for i in range(100):
+            entries["ev" + str(i)] = "payload" + str(i)
+        FullFormLexicon.write(file_name, entries, {"ev CL_ISIM"}, 5)
+        lexicon = FullFormLexicon(file_name)
+        self.assertEqual(100, lexicon.size())
+        self.assertEqual(5, lexicon.getMaxLength())
+        for i in range(100):
+            self.assertEqual("payload" + str(i), lexicon.getPayload("ev" + str(i)))
+        self.assertIsNone(lexicon.getPayload("a"))
+        self.assertIsNone(lexicon.getPayload("ev"))
+        self.assertIsNone(lexicon.getPayload("ev100"))
+        lexicon.close()
+        os.remove(file_name)
+
+    def test_SameAsFiniteStateMachine(self):
+        fsm = FsmMorphologicalAnalyzer()
+        file_name = os.path.join(tempfile.mkdtemp(), "lexicon.bin")
+        fsm.buildFullFormLexicon(file_name, 6, [fsm.getDictionary().getWord("ev")])
+        lexicon_fsm = FsmMorphologicalAnalyzer()
+        lexicon_fsm.loadFullFormLexicon(file_name)
+        self.assertTrue(lexicon_fsm.getFullFormLexicon().size() > 0)
+        for word in ["ev", "evde", "Evde", "evler", "evine", "evimiz"]:
+            expected = fsm.morphologicalAnalysis(word)
+            found = lexicon_fsm.morphologicalAnalysis(word)
+            self.assertEqual(sorted([expected.getFsmParse(i).__str__() for i in range(expected.size())]),
+                             sorted([found.getFsmParse(i).__str__() for i in range(found.size())]))
+        lexicon_fsm.getFullFormLexicon().close()
+        os.remove(file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
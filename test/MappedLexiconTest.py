@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+from multiprocessing import shared_memory
+
+from Dictionary.Trie.Trie import Trie
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.MappedLexicon import MappedLexicon
+
+
+class MappedLexiconTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+    file_name: str
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+        handle, self.file_name = tempfile.mkstemp(suffix=".lex")
+        os.close(handle)
+        self.fsm.saveMappedLexicon(self.file_name)
+
+    def tearDown(self) -> None:
+        os.remove(self.file_name)
+
+    def test_Words(self):
+        lexicon = MappedLexicon(self.file_name)
+        dictionary = self.fsm.getDictionary()
+        self.assertEqual(dictionary.size(), lexicon.size())
+        for i in range(0, dictionary.size(), 101):
+            word = dictionary.getWordWithIndex(i)
+            self.assertEqual(word.__str__(), lexicon.getWord(word.getName()).__str__())
+            self.assertIs(lexicon.getWord(word.getName()), lexicon.getWordWithIndex(i))
+        self.assertIsNone(lexicon.getWord("xyzqw"))
+        self.assertEqual(dictionary.getCorrectForm("yanlız"), lexicon.getCorrectForm("yanlız"))
+        self.assertEqual("", lexicon.getCorrectForm("kitap"))
+        lexicon.close()
+
+    def test_WordsWithPrefix(self):
+        lexicon = MappedLexicon(self.file_name)
+        trie = self.fsm.getCore().getDictionaryTrie()
+        for surface_form in ["kitabı", "ahengi", "metni", "bana", "yiyiniz", "mısıryağları", "evlerimizden", "xyzqw"]:
+            self.assertEqual({word.__str__() for word in trie.getWordsWithPrefix(surface_form)},
+                             {word.__str__() for word in lexicon.getWordsWithPrefix(surface_form)})
+        lexicon.close()
+
+    def test_SameAnalyses(self):
+        fsm = FsmMorphologicalAnalyzer.fromMappedLexicon(self.file_name)
+        self.assertEqual(self.fsm.getCore().getStamp(), fsm.getCore().getStamp())
+        for word in ["kitabı", "Ankara'da", "gelir", "12'de", "yüzü", "ekmeğin", "T.C.", "Won'u"]:
+            self.assertEqual([parse.__str__() for parse in self.fsm.morphologicalAnalysis(word).toTuple()],
+                             [parse.__str__() for parse in fsm.morphologicalAnalysis(word).toTuple()])
+
+    def test_SharedMemory(self):
+        with open(self.file_name, "rb") as input_file:
+            data = input_file.read()
+        memory = shared_memory.SharedMemory(create=True, size=len(data))
+        try:
+            memory.buf[:len(data)] = data
+            fsm = FsmMorphologicalAnalyzer.fromMappedLexicon(memory.buf)
+            self.assertEqual(self.fsm.morphologicalAnalysis("kitabı").size(), fsm.morphologicalAnalysis("kitabı").size())
+            fsm.getDictionary().close()
+        finally:
+            memory.close()
+            memory.unlink()
+
+    def test_MisspelledWords(self):
+        lexicon = MappedLexicon(self.file_name)
+        misspelled_words = lexicon.getMisspelledWords()
+        self.assertTrue(len(misspelled_words) > 1000)
+        dictionary = self.fsm.getDictionary()
+        for misspelled, correct in list(misspelled_words.items())[::97]:
+            self.assertEqual(dictionary.getCorrectForm(misspelled), correct)
+        fsm = FsmMorphologicalAnalyzer.fromMappedLexicon(self.file_name)
+        handle, file_name = tempfile.mkstemp(suffix=".lex")
+        os.close(handle)
+        try:
+            fsm.saveMappedLexicon(file_name)
+            copy = MappedLexicon(file_name)
+            self.assertEqual(misspelled_words, copy.getMisspelledWords())
+            copy.close()
+        finally:
+            fsm.getDictionary().close()
+            os.remove(file_name)
+        lexicon.close()
+
+    def test_SaveChecksItsInputs(self):
+        dictionary = self.fsm.getDictionary()
+        self.assertRaises(ValueError, MappedLexicon.save, self.file_name, dictionary, Trie(), {})
+        self.assertRaises(ValueError, MappedLexicon.save, self.file_name, dictionary,
+                          self.fsm.getCore().getDictionaryTrie(), {"kitap": "defter"})
+
+    def test_InvalidFile(self):
+        with open(self.file_name, "wb") as output_file:
+            output_file.write(b"not a lexicon")
+        self.assertRaises(ValueError, MappedLexicon, self.file_name)
+
+
+if __name__ == '__main__':
+    unittest.main()
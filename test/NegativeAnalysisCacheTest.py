@@ -0,0 +1,51 @@
+import unittest
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.NegativeAnalysisCache import NegativeAnalysisCache
+
+
+class NegativeAnalysisCacheTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+
+    def test_Invalidate(self):
+        cache = NegativeAnalysisCache(2)
+        cache.add(("googleladık", False, False))
+        cache.add(("xqzvw", False, False))
+        cache.invalidate("google")
+        self.assertFalse(cache.contains(("googleladık", False, False)))
+        self.assertTrue(cache.contains(("xqzvw", False, False)))
+        cache.add(("abc", False, False))
+        cache.add(("abd", False, False))
+        self.assertEqual(2, cache.size())
+        self.assertFalse(cache.contains(("xqzvw", False, False)))
+        cache.invalidate("a")
+        self.assertEqual(0, cache.size())
+
+    def test_UnanalyzableWord(self):
+        self.fsm.enableSearchStatistics()
+        self.assertEqual(0, self.fsm.morphologicalAnalysis("xqzvw").size())
+        self.assertEqual(0, self.fsm.morphologicalAnalysis("xqzvw").size())
+        self.assertEqual(1, self.fsm.getSearchStatistics().getCounter("negative_cache_hits"))
+
+    def test_NewRoot(self):
+        self.assertEqual(0, self.fsm.morphologicalAnalysis("googlelaştırdık").size())
+        self.assertEqual(0, self.fsm.morphologicalAnalysis("xqzvw").size())
+        self.fsm.rootOfPossiblyNewWord("googlelaştırdık")
+        self.assertEqual(1, self.fsm.getNegativeCache().size())
+        self.assertTrue(self.fsm.morphologicalAnalysis("googlelaştırdık").size() > 0)
+
+
+    def test_NewCapitalizedRoot(self):
+        self.assertEqual(0, self.fsm.morphologicalAnalysis("Googlelaştırdık").size())
+        self.assertEqual(1, self.fsm.getNegativeCache().size())
+        self.assertTrue("Googlelaştır" in [root.getName() for root in
+                                           self.fsm.rootOfPossiblyNewWord("Googlelaştırdık")])
+        self.assertEqual(0, self.fsm.getNegativeCache().size())
+        self.assertTrue(self.fsm.morphologicalAnalysis("Googlelaştırdık").size() > 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import unittest
+
+from Dictionary.TxtWord import TxtWord
+
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.FrontierType import FrontierType
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.PartialFsmParse import PartialFsmParse
+from MorphologicalAnalysis.ParseFrontier import ParseFrontier
+
+
+class ParseFrontierTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        fsm = FiniteStateMachine("../MorphologicalAnalysis/data/turkish_finite_state_machine.xml")
+        state = fsm.getState("NominalRoot")
+        root = TxtWord("ev", "CL_ISIM")
+        self.short = PartialFsmParse(root, state, "ev")
+        self.long = PartialFsmParse(root, state, "evler")
+        self.middle = PartialFsmParse(root, state, "evde")
+
+    def test_BreadthFirst(self):
+        frontier = ParseFrontier(FrontierType.BREADTH_FIRST, [self.short, self.long, self.middle])
+        self.assertEqual(3, frontier.size())
+        self.assertIs(self.short, frontier.remove())
+        self.assertIs(self.long, frontier.remove())
+        self.assertIs(self.middle, frontier.remove())
+        self.assertTrue(frontier.isEmpty())
+
+    def test_DepthFirst(self):
+        frontier = ParseFrontier(FrontierType.DEPTH_FIRST, [self.short, self.long, self.middle])
+        self.assertIs(self.middle, frontier.remove())
+        self.assertIs(self.long, frontier.remove())
+        self.assertIs(self.short, frontier.remove())
+        self.assertTrue(frontier.isEmpty())
+
+    def test_LongestSurfaceFirst(self):
+        frontier = ParseFrontier(FrontierType.LONGEST_SURFACE_FIRST, [self.short, self.long, self.middle])
+        self.assertIs(self.long, frontier.remove())
+        self.assertIs(self.middle, frontier.remove())
+        self.assertIs(self.short, frontier.remove())
+        self.assertTrue(frontier.isEmpty())
+
+    def test_SameAnalysesForAllFrontiers(self):
+        fsm = FsmMorphologicalAnalyzer()
+        root = fsm.getDictionary().getWord("kitap")
+        for word in ["kitaplarımızdan", "kitapçıklar", "kitabı"]:
+            expected = sorted([parse.transitionList() for parse in fsm.morphologicalAnalysisRoot(word, root)])
+            self.assertTrue(len(expected) > 0)
+            for frontier_type in FrontierType:
+                analyses = fsm.morphologicalAnalysisRoot(word, root, None, frontier_type)
+                self.assertEqual(expected, sorted([parse.transitionList() for parse in analyses]))
+        expected = sorted([parse.transitionList() for parse in fsm.generateAllParses(root, 8)])
+        for frontier_type in FrontierType:
+            self.assertEqual(expected, sorted([parse.transitionList()
+                                               for parse in fsm.generateAllParses(root, 8, frontier_type)]))
+        for frontier_type in FrontierType:
+            self.assertTrue(fsm.morphologicalAnalysisExists(root, "kitaplarımızdan", frontier_type))
+            self.assertFalse(fsm.morphologicalAnalysisExists(root, "kitaplarımızdanx", frontier_type))
+
+
+if __name__ == '__main__':
+    unittest.main()
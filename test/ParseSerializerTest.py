@@ -0,0 +1,41 @@
+import copy
+import os
+import pickle
+import unittest
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.ParseSerializer import ParseSerializer
+
+
+class ParseSerializerTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+
+    def test_SharedStatesAndRoots(self):
+        serializer = ParseSerializer(self.fsm.getFiniteStateMachine(), self.fsm.getDictionary())
+        parses = self.fsm.morphologicalAnalysis("kitabı").toTuple()
+        loaded = serializer.decode(serializer.encode(parses))
+        self.assertEqual([parse.__str__() for parse in parses], [parse.__str__() for parse in loaded])
+        for parse, loaded_parse in zip(parses, loaded):
+            self.assertIs(parse.getStartState(), loaded_parse.getStartState())
+            self.assertIs(self.fsm.getDictionary().getWord("kitap"), loaded_parse.getWord())
+
+    def test_CopiedRootByValue(self):
+        serializer = ParseSerializer(self.fsm.getFiniteStateMachine(), self.fsm.getDictionary())
+        root = copy.deepcopy(self.fsm.getDictionary().getWord("kitap"))
+        loaded = serializer.decode(serializer.encode([root, self.fsm.getDictionary().getWord("kitap")]))
+        self.assertIsNot(self.fsm.getDictionary().getWord("kitap"), loaded[0])
+        self.assertEqual("kitap", loaded[0].getName())
+        self.assertIs(self.fsm.getDictionary().getWord("kitap"), loaded[1])
+
+    def test_RefusesOtherClasses(self):
+        serializer = ParseSerializer(self.fsm.getFiniteStateMachine(), self.fsm.getDictionary())
+        self.assertRaises(pickle.UnpicklingError, serializer.decode, pickle.dumps([os.getcwd]))
+        self.assertEqual([{1, 2}], serializer.decode(serializer.encode([{1, 2}])))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+
+from Dictionary.TxtWord import TxtWord
+
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.FsmParse import FsmParse
+from MorphologicalAnalysis.PartialFsmParse import PartialFsmParse
+
+
+class PartialFsmParseTest(unittest.TestCase):
+
+    fsm: FiniteStateMachine
+
+    def setUp(self) -> None:
+        self.fsm = FiniteStateMachine("../MorphologicalAnalysis/data/turkish_finite_state_machine.xml")
+
+    def addTransition(self, node: PartialFsmParse, _with: str) -> PartialFsmParse:
+        for transition in self.fsm.getTransitions(node.getFinalSuffix()):
+            if transition.__str__() == _with:
+                form = transition.makeTransition(node.getWord(), node.getSurfaceForm(), node.getStartState())
+                return node.addSuffix(transition.toState(), form, transition.withName(), transition.__str__(),
+                                      transition.toPos())
+        return None
+
+    def test_StructureSharing(self):
+        root = TxtWord("ev", "CL_ISIM")
+        initial = PartialFsmParse.fromFsmParse(FsmParse(root, self.fsm.getState("NominalRoot")))
+        plural = self.addTransition(initial, "lAr")
+        self.assertEqual("evler", plural.getSurfaceForm())
+        self.assertIs(initial, plural.getParent())
+        self.assertIs(root, plural.getWord())
+        self.assertIs(initial.getStartState(), plural.getStartState())
+        self.assertEqual("ev", initial.getSurfaceForm())
+        self.assertEqual(1, initial.size())
+        self.assertEqual(2, plural.size())
+
+    def test_ToFsmParse(self):
+        root = TxtWord("ev", "CL_ISIM")
+        initial = PartialFsmParse.fromFsmParse(FsmParse(root, self.fsm.getState("NominalRoot")))
+        plural = self.addTransition(initial, "lAr")
+        self.assertEqual("ev+NOUN", initial.toFsmParse().transitionList())
+        fsm_parse = plural.toFsmParse()
+        self.assertEqual("ev+NOUN+A3PL", fsm_parse.transitionList())
+        self.assertEqual("evler", fsm_parse.getSurfaceForm())
+        self.assertEqual("ev+lAr", fsm_parse.withList())
+        self.assertEqual("A3PL", fsm_parse.getVerbAgreement())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import os
+import tempfile
+import unittest
+
+from MorphologicalAnalysis.AnalysisCache import AnalysisCache
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.PersistentAnalysisCache import PersistentAnalysisCache
+
+
+class PersistentAnalysisCacheTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+    file_name: str
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+        handle, self.file_name = tempfile.mkstemp(suffix=".db")
+        os.close(handle)
+
+    def tearDown(self) -> None:
+        for suffix in ["", "-wal", "-shm"]:
+            if os.path.exists(self.file_name + suffix):
+                os.remove(self.file_name + suffix)
+
+    def test_SharedAcrossRuns(self):
+        words = ["gelir", "kitabı", "Ankara'da", "masalarımız", "12"]
+        self.fsm.enablePersistentCache(self.file_name)
+        expected = {}
+        for word in words:
+            expected[word] = [parse.__str__() for parse in self.fsm.morphologicalAnalysis(word).toTuple()]
+        self.fsm.disablePersistentCache()
+        fsm = FsmMorphologicalAnalyzer()
+        fsm.enablePersistentCache(self.file_name, True)
+        for word in words:
+            fsm_parse_list = fsm.morphologicalAnalysis(word)
+            self.assertEqual(expected[word], [parse.__str__() for parse in fsm_parse_list.toTuple()])
+        self.assertEqual(len(words), fsm.getPersistentCache().getHits())
+        self.assertEqual(0, fsm.getPersistentCache().getMisses())
+        fsm.disablePersistentCache()
+
+    def test_ReadOnlyFileNameWithUriCharacters(self):
+        handle, file_name = tempfile.mkstemp(prefix="cache?#", suffix=".db")
+        os.close(handle)
+        key = AnalysisCache.normalizedKey("gelir", "gelir", False)
+        cache = PersistentAnalysisCache(file_name, "stamp", self.fsm.getFiniteStateMachine(), self.fsm.getDictionary())
+        cache.add(key, self.fsm.morphologicalAnalysis("gelir").toTuple())
+        cache.close()
+        cache = PersistentAnalysisCache(file_name, "stamp", self.fsm.getFiniteStateMachine(),
+                                        self.fsm.getDictionary(), True)
+        self.assertTrue(cache.isValid())
+        self.assertIsNotNone(cache.get(key))
+        cache.close()
+        for suffix in ["", "-wal", "-shm"]:
+            if os.path.exists(file_name + suffix):
+                os.remove(file_name + suffix)
+
+    def test_StaleStamp(self):
+        key = AnalysisCache.normalizedKey("gelir", "gelir", False)
+        parses = self.fsm.morphologicalAnalysis("gelir").toTuple()
+        cache = PersistentAnalysisCache(self.file_name, "first", self.fsm.getFiniteStateMachine(),
+                                        self.fsm.getDictionary())
+        cache.add(key, parses)
+        self.assertEqual(1, cache.size())
+        cache.close()
+        cache = PersistentAnalysisCache(self.file_name, "second", self.fsm.getFiniteStateMachine(),
+                                        self.fsm.getDictionary(), True)
+        self.assertFalse(cache.isValid())
+        self.assertIsNone(cache.get(key))
+        cache.close()
+        cache = PersistentAnalysisCache(self.file_name, "second", self.fsm.getFiniteStateMachine(),
+                                        self.fsm.getDictionary())
+        self.assertEqual(0, cache.size())
+        cache.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from Dictionary.TxtWord import TxtWord
+
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.PartialFsmParse import PartialFsmParse
+from MorphologicalAnalysis.SearchGraph import SearchGraph
+
+
+class SearchGraphTest(unittest.TestCase):
+
+    fsm: FiniteStateMachine
+
+    def setUp(self) -> None:
+        self.fsm = FiniteStateMachine("../MorphologicalAnalysis/data/turkish_finite_state_machine.xml")
+
+    def test_MergeAndFanOut(self):
+        root = TxtWord("ev", "CL_ISIM")
+        nominal_root = self.fsm.getState("NominalRoot")
+        noun_state = self.fsm.getState("NominalRootNoPossesive")
+        initial = PartialFsmParse(root, nominal_root, "ev")
+        first = initial.addSuffix(noun_state, "evler", "A3PL", "lAr", "NOUN")
+        second = initial.addSuffix(noun_state, "evler", "A3SG", "0", "NOUN")
+        final = first.addSuffix(nominal_root, "evlerde", "LOC", "DA", "NOUN")
+        graph = SearchGraph()
+        self.assertTrue(graph.add(initial))
+        self.assertTrue(graph.add(first))
+        self.assertFalse(graph.add(second))
+        self.assertTrue(graph.add(final))
+        self.assertEqual(3, graph.size())
+        paths = graph.paths(final)
+        self.assertEqual(2, len(paths))
+        self.assertIs(final, paths[0])
+        self.assertIs(second, paths[1].getParent())
+        self.assertEqual("evlerde", paths[1].getSurfaceForm())
+        self.assertEqual(3, paths[1].size())
+
+    def test_DifferentRootsAreNotMerged(self):
+        nominal_root = self.fsm.getState("NominalRoot")
+        graph = SearchGraph()
+        self.assertTrue(graph.add(PartialFsmParse(TxtWord("ev", "CL_ISIM"), nominal_root, "ev")))
+        self.assertTrue(graph.add(PartialFsmParse(TxtWord("ev", "CL_FIIL"), nominal_root, "ev")))
+        self.assertEqual(2, graph.size())
+
+
+if __name__ == '__main__':
+    unittest.main()
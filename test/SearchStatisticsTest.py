@@ -0,0 +1,48 @@
+import unittest
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+
+
+class SearchStatisticsTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+
+    def test_Counters(self):
+        self.assertIsNone(self.fsm.getSearchStatistics())
+        self.fsm.enableSearchStatistics(True)
+        statistics = self.fsm.getSearchStatistics()
+        self.assertEqual(2, self.fsm.morphologicalAnalysis("gözlüğümüz").size())
+        word = statistics.getWordStatistics()
+        self.assertEqual("gözlüğümüz", word["surface_form"])
+        self.assertEqual(1, word["analysis_cache_misses"])
+        self.assertTrue(word["frontier_pushes"] > 0)
+        self.assertEqual(word["frontier_pushes"], word["frontier_pops"])
+        self.assertEqual(word["transitions_tried"],
+                         word["rejected_by_surface_form"] + word["rejected_by_parse"] + word["rejected_by_word"] +
+                         word["make_transition_calls"])
+        self.assertTrue(word["make_transition_calls"] >=
+                        word["allomorph_cache_hits"] + word["allomorph_cache_misses"])
+        self.assertTrue(word["root_variant_misses"] > 0)
+        self.assertTrue(word["accepted_parses"] >= 2)
+        self.assertTrue(len(word["state_times"]) > 0)
+        self.fsm.morphologicalAnalysis("gözlüğümüz")
+        word = statistics.getWordStatistics()
+        self.assertEqual(1, word["analysis_cache_hits"])
+        self.assertEqual(0, word["frontier_pushes"])
+        self.fsm.morphologicalAnalysis("gözlüğü")
+        word = statistics.getWordStatistics()
+        self.assertTrue(word["root_variant_hits"] > 0)
+        self.assertEqual(0, word["root_variant_misses"])
+        total = statistics.toDict()["total"]
+        self.assertEqual(3, total["words"])
+        self.assertEqual(1, total["analysis_cache_hits"])
+        self.assertEqual(2, total["analysis_cache_misses"])
+        self.fsm.disableSearchStatistics()
+        self.assertIsNone(self.fsm.getSearchStatistics())
+
+
+if __name__ == '__main__':
+    unittest.main()
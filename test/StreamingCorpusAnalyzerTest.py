@@ -0,0 +1,98 @@
+import itertools
+import json
+import os
+import tempfile
+import unittest
+
+from Corpus.Sentence import Sentence
+
+from DisambiguationCorpus.DisambiguatedWord import DisambiguatedWord
+from DisambiguationCorpus.DisambiguationCorpus import DisambiguationCorpus
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.MorphologicalParse import MorphologicalParse
+from MorphologicalAnalysis.StreamingCorpusAnalyzer import StreamingCorpusAnalyzer
+
+
+class StreamingCorpusAnalyzerTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+    directory: tempfile.TemporaryDirectory
+    lines: list
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+        self.directory = tempfile.TemporaryDirectory()
+        self.lines = ["Ankara'da kitabı okudum", "", "yanlız gelir xyzqw", "evlerimizden 12'de geldik"]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def analyses(self, sentence: Sentence) -> list:
+        return [[parse.__str__() for parse in parse_list.toTuple()]
+                for parse_list in self.fsm.morphologicalAnalysis(sentence)]
+
+    def test_AnalyzeSentences(self):
+        corpus_analyzer = StreamingCorpusAnalyzer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()), 3)
+        sentences = [Sentence(line) for line in self.lines]
+        result = list(corpus_analyzer.analyzeSentences(sentences))
+        self.assertEqual(len(sentences), len(result))
+        for sentence, (analyzed_sentence, parse_lists) in zip(sentences, result):
+            self.assertIs(sentence, analyzed_sentence)
+            self.assertEqual(self.analyses(sentence),
+                             [[parse.__str__() for parse in parse_list.toTuple()] for parse_list in parse_lists])
+
+    def test_Streaming(self):
+        corpus_analyzer = StreamingCorpusAnalyzer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()), 4)
+        sentences = (Sentence(self.lines[i % len(self.lines)]) for i in itertools.count())
+        result = list(itertools.islice(corpus_analyzer.analyzeSentences(sentences), 10))
+        self.assertEqual(10, len(result))
+        self.assertEqual(self.analyses(result[9][0]),
+                         [[parse.__str__() for parse in parse_list.toTuple()] for parse_list in result[9][1]])
+
+    def test_AnalyzeTextFile(self):
+        input_file_name = os.path.join(self.directory.name, "corpus.txt")
+        output_file_name = os.path.join(self.directory.name, "analyses.txt")
+        with open(input_file_name, "w", encoding="utf8") as output_file:
+            output_file.write("\n".join(self.lines) + "\n")
+        corpus_analyzer = StreamingCorpusAnalyzer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()), 2, 2)
+        try:
+            count = corpus_analyzer.analyzeFile(input_file_name, output_file_name, outputFormat=StreamingCorpusAnalyzer.JSON)
+        finally:
+            corpus_analyzer.close()
+        self.assertEqual(len(self.lines), count)
+        with open(output_file_name, "r", encoding="utf8") as input_file:
+            output_lines = input_file.readlines()
+        self.assertEqual(len(self.lines), len(output_lines))
+        for line, output_line in zip(self.lines, output_lines):
+            sentence = Sentence(line)
+            words = json.loads(output_line)
+            self.assertEqual([sentence.getWord(i).getName() for i in range(sentence.wordCount())],
+                             [word["word"] for word in words])
+            self.assertEqual(self.analyses(sentence), [word["analyses"] for word in words])
+
+    def test_AnalyzeDisambiguationFile(self):
+        input_file_name = os.path.join(self.directory.name, "corpus.txt")
+        output_file_name = os.path.join(self.directory.name, "analyses.txt")
+        corpus = DisambiguationCorpus()
+        for line in self.lines[2:]:
+            sentence = Sentence()
+            for word in line.split(" "):
+                sentence.addWord(DisambiguatedWord(word, MorphologicalParse(word + "+NOUN+A3SG+PNON+NOM")))
+            corpus.addSentence(sentence)
+        corpus.writeToFile(input_file_name)
+        corpus_analyzer = StreamingCorpusAnalyzer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()))
+        count = corpus_analyzer.analyzeFile(input_file_name, output_file_name, StreamingCorpusAnalyzer.DISAMBIGUATION)
+        self.assertEqual(2, count)
+        with open(output_file_name, "r", encoding="utf8") as input_file:
+            output_lines = input_file.read().split("\n")
+        self.assertEqual("", output_lines[3])
+        self.assertEqual("xyzqw", output_lines[2])
+        self.assertEqual("\t".join(["evlerimizden"] + self.analyses(Sentence("evlerimizden"))[0]), output_lines[4])
+
+    def test_UnknownFormat(self):
+        corpus_analyzer = StreamingCorpusAnalyzer(FsmMorphologicalAnalyzer(core=self.fsm.getCore()))
+        self.assertRaises(ValueError, corpus_analyzer.analyzeFile, "corpus.txt", "analyses.txt", outputFormat="xml")
+
+
+if __name__ == '__main__':
+    unittest.main()
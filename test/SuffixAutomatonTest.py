@@ -0,0 +1,37 @@
+import unittest
+
+from MorphologicalAnalysis.FsmMorphologicalAnalyzer import FsmMorphologicalAnalyzer
+from MorphologicalAnalysis.SuffixAutomaton import SuffixAutomaton
+
+
+class SuffixAutomatonTest(unittest.TestCase):
+
+    fsm: FsmMorphologicalAnalyzer
+
+    def setUp(self) -> None:
+        self.fsm = FsmMorphologicalAnalyzer()
+
+    def test_ClassKey(self):
+        dictionary = self.fsm.getDictionary()
+        nominal_root = self.fsm.getFiniteStateMachine().getState("NominalRoot")
+        verbal_root = self.fsm.getFiniteStateMachine().getState("VerbalRoot")
+        self.assertEqual(SuffixAutomaton.classKey(dictionary.getWord("masa"), nominal_root),
+                         SuffixAutomaton.classKey(dictionary.getWord("kasa"), nominal_root))
+        self.assertNotEqual(SuffixAutomaton.classKey(dictionary.getWord("masa"), nominal_root),
+                            SuffixAutomaton.classKey(dictionary.getWord("masa"), verbal_root))
+        self.assertNotEqual(SuffixAutomaton.classKey(dictionary.getWord("kitap"), nominal_root),
+                            SuffixAutomaton.classKey(dictionary.getWord("kasap"), nominal_root))
+
+    def test_SameAsFiniteStateMachine(self):
+        lookup_fsm = FsmMorphologicalAnalyzer()
+        lookup_fsm.enableSuffixAutomaton(5)
+        for word in ["masada", "kasada", "kasalar", "masalarımız", "Masalar", "kitabı", "gitti", "gideceksiniz"]:
+            expected = self.fsm.morphologicalAnalysis(word)
+            found = lookup_fsm.morphologicalAnalysis(word)
+            self.assertEqual(sorted([expected.getFsmParse(i).__str__() for i in range(expected.size())]),
+                             sorted([found.getFsmParse(i).__str__() for i in range(found.size())]))
+        self.assertTrue(lookup_fsm.getSuffixAutomaton().getHits() > 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
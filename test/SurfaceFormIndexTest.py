@@ -0,0 +1,32 @@
+import unittest
+
+from MorphologicalAnalysis.FiniteStateMachine import FiniteStateMachine
+from MorphologicalAnalysis.SurfaceFormIndex import SurfaceFormIndex
+
+
+class SurfaceFormIndexTest(unittest.TestCase):
+
+    def test_RemainingMask(self):
+        index = SurfaceFormIndex("evlerde")
+        self.assertEqual("evlerde", index.getSurfaceForm())
+        self.assertTrue(index.containsAnyAfter(2, SurfaceFormIndex.characterMask("d")))
+        self.assertTrue(index.containsAnyAfter(6, SurfaceFormIndex.characterMask("ae")))
+        self.assertFalse(index.containsAnyAfter(3, SurfaceFormIndex.characterMask("l")))
+        self.assertFalse(index.containsAnyAfter(7, SurfaceFormIndex.characterMask("e")))
+        self.assertEqual(0, index.remainingMask(7))
+        self.assertEqual(SurfaceFormIndex.characterMask("de"), index.remainingMask(5))
+
+    def test_SameAsTransitionPossibleForString(self):
+        fsm = FiniteStateMachine("../MorphologicalAnalysis/data/turkish_finite_state_machine.xml")
+        for surface_form in ["kitaplarımızdan", "gelecekmişsiniz", "çocukçağız", "3'tü"]:
+            index = SurfaceFormIndex(surface_form)
+            for state in fsm.getStates():
+                for transition in fsm.getTransitions(state):
+                    for i in range(len(surface_form) + 1):
+                        current = surface_form[:i]
+                        self.assertEqual(transition.transitionPossibleForString(current, surface_form),
+                                         transition.transitionPossibleForSurfaceFormIndex(current, index))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+
+from MorphologicalAnalysis.TinyLfuCache import TinyLfuCache
+
+
+class TinyLfuCacheTest(unittest.TestCase):
+
+    def test_ByteBudget(self):
+        cache = TinyLfuCache(1000, len)
+        for i in range(100):
+            cache.add(i, "x" * 50)
+        self.assertTrue(cache.getResidentBytes() <= 1000)
+        self.assertTrue(cache.getEvictions() > 0)
+        cache.add("large", "x" * 2000)
+        self.assertFalse(cache.contains("large"))
+
+    def test_FrequentEntriesStay(self):
+        cache = TinyLfuCache(1000, len)
+        for i in range(10):
+            cache.add(("frequent", i), "x" * 50)
+            for j in range(5):
+                cache.get(("frequent", i))
+        for i in range(1000):
+            if cache.get(("rare", i)) is None:
+                cache.add(("rare", i), "x" * 50)
+        for i in range(10):
+            self.assertTrue(cache.contains(("frequent", i)))
+        self.assertEqual(1000, cache.getMisses())
+        self.assertEqual(50, cache.getHits())
+
+
+if __name__ == '__main__':
+    unittest.main()